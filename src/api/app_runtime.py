@@ -1,8 +1,15 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
 from src.api.config import ApiConfig
 from src.api.repositories.event_repository import EventRepository
+from src.api.repositories.search_index import SearchIndex
+from src.api.repositories.sqlite_repository import SQLiteEventRepository
+from src.api.repositories.stats import EventStats
+from src.api.services.admission import AdmissionController
+from src.api.services.degradation import DegradationController
+from src.api.services.event_stream import EventBroadcaster
 from src.api.services.mcp_ops import MCPOperationsPublisher
 from src.api.services.pipeline import DangerProcessingPipeline
 
@@ -12,5 +19,11 @@ class ApiRuntime:
     config: ApiConfig
     pipeline: DangerProcessingPipeline
     ops_publisher: MCPOperationsPublisher
-    repository: EventRepository
+    repository: EventRepository | SQLiteEventRepository
     admin_dir: Path
+    degradation: DegradationController = field(default_factory=DegradationController)
+    admission: AdmissionController = field(default_factory=AdmissionController)
+    broadcaster: EventBroadcaster = field(default_factory=EventBroadcaster)
+    stats: EventStats = field(default_factory=EventStats)
+    search_index: SearchIndex = field(default_factory=SearchIndex)
+    camera_health: dict[str, dict[str, Any]] = field(default_factory=dict)
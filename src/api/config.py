@@ -1,6 +1,6 @@
 import shlex
 import sys
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -18,8 +18,26 @@ class ApiConfig(BaseSettings):
     host: str = Field(default="0.0.0.0", validation_alias="API_HOST")
     port: int = Field(default=8000, validation_alias="API_PORT")
     recents_max: int = Field(default=100, validation_alias="API_RECENTS_MAX")
+    responses_index_max: int = Field(default=10000, validation_alias="API_RESPONSES_INDEX_MAX")
     event_log_path: str = Field(default="data/events/danger_events.jsonl", validation_alias="EVENT_LOG_PATH")
     response_log_path: str = Field(default="data/events/danger_responses.jsonl", validation_alias="RESPONSE_LOG_PATH")
+    recover_on_start: bool = Field(default=True, validation_alias="API_RECOVER_ON_START")
+    event_store_backend: str = Field(default="jsonl", validation_alias="EVENT_STORE_BACKEND")
+    event_db_path: str = Field(default="data/events/events.db", validation_alias="EVENT_DB_PATH")
+    log_write_behind: bool = Field(default=True, validation_alias="LOG_WRITE_BEHIND")
+    log_fsync_policy: str = Field(default="interval", validation_alias="LOG_FSYNC_POLICY")
+    log_fsync_interval_sec: float = Field(default=1.0, validation_alias="LOG_FSYNC_INTERVAL_SEC")
+    log_rotate_max_bytes: int = Field(default=64 * 1024 * 1024, validation_alias="LOG_ROTATE_MAX_BYTES")
+    log_rotate_interval_sec: float = Field(default=0.0, validation_alias="LOG_ROTATE_INTERVAL_SEC")
+    log_compress: str = Field(default="gzip", validation_alias="LOG_COMPRESS")
+    log_retention_max_segments: int = Field(default=0, validation_alias="LOG_RETENTION_MAX_SEGMENTS")
+    log_retention_max_bytes: int = Field(default=0, validation_alias="LOG_RETENTION_MAX_BYTES")
+    log_retention_max_age_sec: float = Field(default=0.0, validation_alias="LOG_RETENTION_MAX_AGE_SEC")
+    stats_path: str = Field(default="data/events/stats.json", validation_alias="API_STATS_PATH")
+    stats_retention_hours: int = Field(default=720, validation_alias="API_STATS_RETENTION_HOURS")
+    search_index_path: str = Field(default="data/events/search_index.jsonl", validation_alias="API_SEARCH_INDEX_PATH")
+    search_index_snapshot_every: int = Field(default=10000, validation_alias="API_SEARCH_INDEX_SNAPSHOT_EVERY")
+    search_index_max_docs: int = Field(default=200000, validation_alias="API_SEARCH_INDEX_MAX_DOCS")
 
     rag_top_k: int = Field(default=3, validation_alias="RAG_TOP_K")
     rag_mcp_enabled: bool = Field(default=True, validation_alias="RAG_MCP_ENABLED")
@@ -59,6 +77,29 @@ class ApiConfig(BaseSettings):
     gemini_tts_channels: int = Field(default=1, validation_alias="GEMINI_TTS_CHANNELS")
     gemini_tts_sample_width: int = Field(default=2, validation_alias="GEMINI_TTS_SAMPLE_WIDTH")
 
+    routing_enabled: bool = Field(default=True, validation_alias="ROUTING_ENABLED")
+    routing_fast_model: str = Field(default="gemini-2.5-flash-lite", validation_alias="ROUTING_FAST_MODEL")
+    routing_template_max_confidence: float = Field(default=0.6, validation_alias="ROUTING_TEMPLATE_MAX_CONFIDENCE")
+    routing_full_min_confidence: float = Field(default=0.85, validation_alias="ROUTING_FULL_MIN_CONFIDENCE")
+    routing_heuristic_max_tier: Literal["template", "fast", "full"] = Field(
+        default="fast", validation_alias="ROUTING_HEURISTIC_MAX_TIER"
+    )
+
+    degrade_enabled: bool = Field(default=True, validation_alias="DEGRADE_ENABLED")
+    degrade_latency_slo_sec: float = Field(default=8.0, validation_alias="DEGRADE_LATENCY_SLO_SEC")
+    degrade_max_inflight: int = Field(default=8, validation_alias="DEGRADE_MAX_INFLIGHT")
+    degrade_window_sec: float = Field(default=60.0, validation_alias="DEGRADE_WINDOW_SEC")
+    degrade_min_samples: int = Field(default=5, validation_alias="DEGRADE_MIN_SAMPLES")
+    degrade_step_cooldown_sec: float = Field(default=15.0, validation_alias="DEGRADE_STEP_COOLDOWN_SEC")
+    degrade_recover_ratio: float = Field(default=0.5, validation_alias="DEGRADE_RECOVER_RATIO")
+
+    admission_enabled: bool = Field(default=True, validation_alias="ADMISSION_ENABLED")
+    admission_rate_per_sec: float = Field(default=0.5, validation_alias="ADMISSION_RATE_PER_SEC")
+    admission_burst: int = Field(default=5, validation_alias="ADMISSION_BURST")
+    admission_max_concurrent: int = Field(default=4, validation_alias="ADMISSION_MAX_CONCURRENT")
+    admission_max_queue_per_source: int = Field(default=4, validation_alias="ADMISSION_MAX_QUEUE_PER_SOURCE")
+    admission_source_weights: dict[str, float] | None = Field(default=None, validation_alias="ADMISSION_SOURCE_WEIGHTS")
+
     @field_validator("rag_mcp_args", "ops_mcp_args", mode="before")
     @classmethod
     def _parse_command_args(cls, value: Any) -> list[str] | None:
@@ -71,6 +112,27 @@ class ApiConfig(BaseSettings):
             return [str(item) for item in value]
         return None
 
+    @field_validator("admission_source_weights", mode="before")
+    @classmethod
+    def _parse_source_weights(cls, value: Any) -> dict[str, float] | None:
+        if value is None:
+            return None
+        if isinstance(value, dict):
+            return {str(key): float(weight) for key, weight in value.items()}
+        if isinstance(value, str):
+            weights: dict[str, float] = {}
+            for item in value.split(","):
+                source, sep, weight = item.partition("=")
+                if sep and source.strip() and weight.strip():
+                    weights[source.strip()] = float(weight)
+            return weights or None
+        return None
+
+    @field_validator("routing_heuristic_max_tier", mode="before")
+    @classmethod
+    def _normalize_tier(cls, value: Any) -> Any:
+        return value.strip().lower() if isinstance(value, str) else value
+
     @field_validator("gemini_tts_style_prompt", mode="before")
     @classmethod
     def _normalize_style_prompt(cls, value: Any) -> str | None:
@@ -1,4 +1,7 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
+from typing import AsyncIterator
 
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
@@ -6,41 +9,122 @@ from fastapi.staticfiles import StaticFiles
 from src.api.app_runtime import ApiRuntime
 from src.api.config import ApiConfig
 from src.api.repositories.event_repository import EventRepository
+from src.api.repositories.search_index import SearchIndex
+from src.api.repositories.sqlite_repository import SQLiteEventRepository
+from src.api.repositories.stats import EventStats
 from src.api.routes.admin import router as admin_router
 from src.api.routes.events import router as events_router
 from src.api.routes.health import router as health_router
+from src.api.routes.stats import router as stats_router
+from src.api.services.admission import AdmissionController
+from src.api.services.degradation import DegradationController
 from src.api.services.gemini_tts import GeminiTTSGenerator
 from src.api.services.llm_responder import LLMResponder
 from src.api.services.local_rag import LocalRAGRetriever
 from src.api.services.mcp_ops import MCPOperationsPublisher
 from src.api.services.mcp_rag import MCPRAGRetriever
 from src.api.services.pipeline import DangerProcessingPipeline
+from src.api.services.routing import ResponseTierRouter
+
+
+def build_repository(config: ApiConfig) -> EventRepository | SQLiteEventRepository:
+    if config.event_store_backend.strip().lower() == "sqlite":
+        return SQLiteEventRepository(db_path=config.event_db_path, recents_max=config.recents_max)
+    return EventRepository(
+        event_log_path=config.event_log_path,
+        response_log_path=config.response_log_path,
+        recents_max=config.recents_max,
+        write_behind=config.log_write_behind,
+        fsync_policy=config.log_fsync_policy,
+        fsync_interval_sec=config.log_fsync_interval_sec,
+        rotate_max_bytes=config.log_rotate_max_bytes,
+        rotate_interval_sec=config.log_rotate_interval_sec,
+        compress=config.log_compress,
+        retention_max_segments=config.log_retention_max_segments,
+        retention_max_bytes=config.log_retention_max_bytes,
+        retention_max_age_sec=config.log_retention_max_age_sec,
+        recover=config.recover_on_start,
+        responses_index_max=config.responses_index_max,
+    )
 
 
 def build_runtime(config: ApiConfig | None = None) -> ApiRuntime:
     resolved = config or ApiConfig.from_env()
+    degradation = DegradationController(
+        enabled=resolved.degrade_enabled,
+        latency_slo_sec=resolved.degrade_latency_slo_sec,
+        max_inflight=resolved.degrade_max_inflight,
+        window_sec=resolved.degrade_window_sec,
+        min_samples=resolved.degrade_min_samples,
+        step_cooldown_sec=resolved.degrade_step_cooldown_sec,
+        recover_ratio=resolved.degrade_recover_ratio,
+    )
     pipeline = DangerProcessingPipeline(
         mcp_retriever=MCPRAGRetriever(resolved),
         local_retriever=LocalRAGRetriever(top_k=resolved.rag_top_k),
         responder=LLMResponder(resolved),
         tts_generator=GeminiTTSGenerator(resolved),
         mcp_timeout_sec=resolved.rag_mcp_timeout_sec,
+        router=ResponseTierRouter(
+            enabled=resolved.routing_enabled,
+            template_max_confidence=resolved.routing_template_max_confidence,
+            full_min_confidence=resolved.routing_full_min_confidence,
+            heuristic_max_tier=resolved.routing_heuristic_max_tier,
+        ),
+        fast_model=resolved.routing_fast_model,
+        degradation=degradation,
     )
     return ApiRuntime(
         config=resolved,
         pipeline=pipeline,
         ops_publisher=MCPOperationsPublisher(resolved),
-        repository=EventRepository(
-            event_log_path=resolved.event_log_path,
-            response_log_path=resolved.response_log_path,
-            recents_max=resolved.recents_max,
-        ),
+        repository=build_repository(resolved),
         admin_dir=Path(__file__).resolve().parent / "static" / "admin",
+        degradation=degradation,
+        admission=AdmissionController(
+            enabled=resolved.admission_enabled,
+            rate_per_sec=resolved.admission_rate_per_sec,
+            burst=resolved.admission_burst,
+            max_concurrent=resolved.admission_max_concurrent,
+            max_queue_per_source=resolved.admission_max_queue_per_source,
+            source_weights=resolved.admission_source_weights,
+        ),
+        stats=EventStats(
+            retention_hours=resolved.stats_retention_hours,
+            persist_path=resolved.stats_path,
+        ),
+        search_index=SearchIndex(
+            journal_path=resolved.search_index_path or None,
+            write_behind=resolved.log_write_behind,
+            snapshot_every=resolved.search_index_snapshot_every,
+            max_docs=resolved.search_index_max_docs,
+            # Events past the log retention age are gone from disk; stop matching them too.
+            max_age_sec=resolved.log_retention_max_age_sec,
+        ),
     )
 
 
+async def _save_stats_periodically(stats: EventStats) -> None:
+    while True:
+        await asyncio.sleep(stats.save_interval_sec)
+        await asyncio.to_thread(stats.save_if_dirty)
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    stats_saver = asyncio.create_task(_save_stats_periodically(app.state.runtime.stats))
+    yield
+    stats_saver.cancel()
+    with suppress(asyncio.CancelledError):
+        await stats_saver
+    # Drain write-behind log queues before the process exits.
+    app.state.runtime.repository.close()
+    app.state.runtime.stats.save()
+    app.state.runtime.search_index.close()
+
+
 def create_app(runtime: ApiRuntime | None = None) -> FastAPI:
-    app = FastAPI(title="SentinelHybrid Danger Event API", version="0.2.0")
+    app = FastAPI(title="SentinelHybrid Danger Event API", version="0.2.0", lifespan=_lifespan)
     app.state.runtime = runtime or build_runtime()
 
     if app.state.runtime.admin_dir.exists():
@@ -53,6 +137,7 @@ def create_app(runtime: ApiRuntime | None = None) -> FastAPI:
     app.include_router(admin_router)
     app.include_router(health_router)
     app.include_router(events_router)
+    app.include_router(stats_router)
     return app
 
 
@@ -14,6 +14,15 @@ class DangerEvent(BaseModel):
     metadata: dict | None = None
 
 
+class CameraHealthEvent(BaseModel):
+    source: str
+    camera_id: str
+    status: str
+    reason: str | None = None
+    timestamp: datetime
+    metrics: dict | None = None
+
+
 class RAGReference(BaseModel):
     id: str
     title: str
@@ -29,12 +38,15 @@ class DangerResponse(BaseModel):
     jetson_tts_summary: str
     jetson_tts_wav_base64: str | None = None
     references: list[RAGReference] = Field(default_factory=list)
+    response_tier: str = "full"
+    degradation_level: str = "normal"
 
 
 class DangerEventAck(BaseModel):
     status: str
     event_id: str
     response: DangerResponse | None = None
+    retry_after_sec: float | None = None
 
 
 class GeminiSafetyResponse(BaseModel):
@@ -1,53 +1,207 @@
-import json
+from collections import OrderedDict, deque
+from datetime import datetime
 from pathlib import Path
 from threading import Lock
 from typing import Any
 
+from src.api.repositories.jsonl_writer import JsonlWriter, iter_jsonl_range, list_segments
+from src.api.repositories.records import (
+    CompactResponse,
+    ReferenceCatalog,
+    dumps_json_bytes,
+    new_snapshot_epoch,
+    normalize_timestamp,
+    read_jsonl_tail,
+)
+from src.api.services.hazard_context import HazardContextService
+
 
 class EventRepository:
-    def __init__(self, event_log_path: str, response_log_path: str, recents_max: int = 100) -> None:
+    def __init__(
+        self,
+        event_log_path: str,
+        response_log_path: str,
+        recents_max: int = 100,
+        write_behind: bool = False,
+        fsync_policy: str = "none",
+        fsync_interval_sec: float = 1.0,
+        rotate_max_bytes: int = 0,
+        rotate_interval_sec: float = 0.0,
+        compress: str = "none",
+        retention_max_segments: int = 0,
+        retention_max_bytes: int = 0,
+        retention_max_age_sec: float = 0.0,
+        recover: bool = False,
+        responses_index_max: int = 10000,
+        catalog: ReferenceCatalog | None = None,
+    ) -> None:
         self.event_log_path = Path(event_log_path)
         self.response_log_path = Path(response_log_path)
         self.recents_max = recents_max
-        self._recent_events: list[dict[str, Any]] = []
-        self._recent_responses: list[dict[str, Any]] = []
-        self._responses_by_event_id: dict[str, dict[str, Any]] = {}
+        self.responses_index_max = max(recents_max, int(responses_index_max))
+        self.catalog = catalog or ReferenceCatalog.default()
+        if self.catalog.archive_dir is None:
+            self.catalog.attach_archive(self.response_log_path.parent / "reference_catalog")
+        # Newest first; each entry carries the repository version it was added at.
+        self._recent_events: deque[tuple[int, dict[str, Any]]] = deque(maxlen=recents_max)
+        self._recent_responses: deque[tuple[int, CompactResponse]] = deque(maxlen=recents_max)
+        self._responses_by_event_id: OrderedDict[str, CompactResponse] = OrderedDict()
+        self._version = 0
+        self.epoch = new_snapshot_epoch()
+        self._snapshot_cache: tuple[int, bytes] | None = None
         self._lock = Lock()
+        self.hazard_context = HazardContextService()
+        self._event_writer, self._response_writer = (
+            JsonlWriter(
+                path,
+                background=write_behind,
+                fsync_policy=fsync_policy,
+                fsync_interval_sec=fsync_interval_sec,
+                rotate_max_bytes=rotate_max_bytes,
+                rotate_interval_sec=rotate_interval_sec,
+                compress=compress,
+                retention_max_segments=retention_max_segments,
+                retention_max_bytes=retention_max_bytes,
+                retention_max_age_sec=retention_max_age_sec,
+                # Responses carry no timestamp of their own; segments are indexed by write time.
+                timestamp_key=timestamp_key,
+            )
+            for path, timestamp_key in ((self.event_log_path, "timestamp"), (self.response_log_path, None))
+        )
+        if recover:
+            self._recover_recents()
+
+    def _tail_records(self, path: Path) -> list[dict[str, Any]]:
+        records = read_jsonl_tail(path, self.recents_max)
+        # Fall back to the newest rotated segments when the live file is short.
+        for segment in reversed(list_segments(path)):
+            if len(records) >= self.recents_max:
+                break
+            records.extend(read_jsonl_tail(segment, self.recents_max - len(records)))
+        return records
+
+    def _recover_recents(self) -> None:
+        events = self._tail_records(self.event_log_path)
+        responses = self._tail_records(self.response_log_path)
+        with self._lock:
+            for payload in reversed(events):
+                self._push_recent(self._recent_events, payload)
+            for payload in reversed(responses):
+                event_id = payload.get("event_id")
+                if isinstance(event_id, str):
+                    self._index_response(event_id, CompactResponse(payload, self.catalog))
 
-    @staticmethod
-    def _append_jsonl(path: Path, payload: dict[str, Any]) -> None:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("a", encoding="utf-8") as fp:
-            fp.write(json.dumps(payload, ensure_ascii=False) + "\n")
+    def _push_recent(self, items: deque[tuple[int, Any]], item: Any) -> None:
+        self._version += 1
+        items.appendleft((self._version, item))
 
-    def _push_recent(self, items: list[dict[str, Any]], payload: dict[str, Any]) -> None:
-        items.insert(0, payload)
-        if len(items) > self.recents_max:
-            items.pop()
+    def _index_response(self, event_id: str, record: CompactResponse) -> None:
+        self._push_recent(self._recent_responses, record)
+        self._responses_by_event_id[event_id] = record
+        self._responses_by_event_id.move_to_end(event_id)
+        while len(self._responses_by_event_id) > self.responses_index_max:
+            self._responses_by_event_id.popitem(last=False)
+
+    @property
+    def version(self) -> int:
+        return self._version
 
     def append_event(self, payload: dict[str, Any]) -> None:
+        self._event_writer.write(payload)
         with self._lock:
-            self._append_jsonl(self.event_log_path, payload)
             self._push_recent(self._recent_events, payload)
 
     def append_response(self, event_id: str, payload: dict[str, Any]) -> None:
+        self.catalog.archive_current()
+        record = CompactResponse(payload, self.catalog)
+        self._response_writer.write(record.to_stored())
+        with self._lock:
+            self._index_response(event_id, record)
+
+    def query_events(
+        self,
+        since: datetime | None = None,
+        source: str | None = None,
+        hazard: str | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> dict[str, Any]:
+        # Without `since` only the in-memory recents are queryable; a time range is read back from the log,
+        # where the segment index skips rotated segments outside it.
+        if since is not None:
+            self._event_writer.flush()
+            since_ts = datetime.fromisoformat(normalize_timestamp(since)).timestamp()
+            events = list(iter_jsonl_range(self.event_log_path, since=since_ts))
+            events.reverse()
+        else:
+            with self._lock:
+                events = [payload for _, payload in self._recent_events]
+
+        if cursor:
+            ids = [str(item.get("event_id")) for item in events]
+            if cursor not in ids:
+                return {"events": [], "next_cursor": None}
+            events = events[ids.index(cursor) + 1 :]
+
+        since_text = normalize_timestamp(since) if since is not None else None
+        limit = max(1, min(500, int(limit)))
+        matched: list[dict[str, Any]] = []
+        for item in events:
+            if source and item.get("source") != source:
+                continue
+            if hazard and self.hazard_context.infer_hazard_hint_from_payload(item) != hazard:
+                continue
+            if since_text and normalize_timestamp(item.get("timestamp")) < since_text:
+                continue
+            matched.append(item)
+            if len(matched) > limit:
+                break
+
+        has_more = len(matched) > limit
+        matched = matched[:limit]
+        return {
+            "events": matched,
+            "next_cursor": str(matched[-1].get("event_id")) if has_more and matched else None,
+        }
+
+    def flush(self) -> None:
+        self._event_writer.flush()
+        self._response_writer.flush()
+
+    def close(self) -> None:
+        self._event_writer.close()
+        self._response_writer.close()
+
+    def get_recent_snapshot(self, since: int | None = None) -> dict[str, Any]:
         with self._lock:
-            self._append_jsonl(self.response_log_path, payload)
-            self._push_recent(self._recent_responses, payload)
-            self._responses_by_event_id[event_id] = payload
+            return self._build_snapshot(since)
+
+    def _build_snapshot(self, since: int | None) -> dict[str, Any]:
+        # A cursor from the future (e.g. before a restart) gets a full snapshot.
+        delta = since is not None and 0 <= since <= self._version
+        floor = since if delta and since is not None else 0
+        events = [payload for version, payload in self._recent_events if version > floor]
+        responses = [record.to_payload(self.catalog) for version, record in self._recent_responses if version > floor]
+        return {
+            "version": self._version,
+            "epoch": self.epoch,
+            "delta": delta,
+            "event_count": len(events),
+            "response_count": len(responses),
+            "events": events,
+            "responses": responses,
+        }
 
-    def get_recent_snapshot(self) -> dict[str, Any]:
+    def get_recent_snapshot_bytes(self, since: int | None = None) -> tuple[int, bytes]:
         with self._lock:
-            events = list(self._recent_events)
-            responses = list(self._recent_responses)
-            return {
-                "event_count": len(events),
-                "response_count": len(responses),
-                "events": events,
-                "responses": responses,
-            }
+            if since is None and self._snapshot_cache is not None and self._snapshot_cache[0] == self._version:
+                return self._snapshot_cache
+            body = dumps_json_bytes(self._build_snapshot(since))
+            if since is None:
+                self._snapshot_cache = (self._version, body)
+            return self._version, body
 
     def get_response(self, event_id: str) -> dict[str, Any] | None:
         with self._lock:
-            response = self._responses_by_event_id.get(event_id)
-            return dict(response) if response is not None else None
+            record = self._responses_by_event_id.get(event_id)
+            return record.to_payload(self.catalog) if record is not None else None
@@ -0,0 +1,411 @@
+import gzip
+import json
+import logging
+import os
+import queue
+import re
+import shutil
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from threading import Lock, Thread
+from typing import IO, Any, Iterator
+
+from src.api.repositories.records import normalize_timestamp, parse_jsonl_line
+
+FSYNC_POLICIES = {"none", "interval", "batch"}
+COMPRESSION_MODES = {"none", "gzip"}
+
+_STOP = object()
+
+
+def _record_epoch(payload: dict[str, Any], timestamp_key: str | None) -> float:
+    value = payload.get(timestamp_key) if timestamp_key else None
+    if value is None:
+        return time.time()
+    return datetime.fromisoformat(normalize_timestamp(value)).timestamp()
+
+
+def segment_index_path(path: str | Path) -> Path:
+    path = Path(path)
+    return path.with_name(f"{path.name}.index")
+
+
+def list_segments(path: str | Path) -> list[Path]:
+    # Rotated segments, plain or gzip, oldest first; the stamp in the name sorts chronologically.
+    path = Path(path)
+    pattern = re.compile(rf"^{re.escape(path.stem)}\.\d{{8}}T\d+{re.escape(path.suffix)}(\.gz)?$")
+    if not path.parent.exists():
+        return []
+    return sorted(item for item in path.parent.iterdir() if pattern.match(item.name))
+
+
+def open_segment(path: Path) -> IO[bytes]:
+    return gzip.open(path, "rb") if path.name.endswith(".gz") else path.open("rb")
+
+
+def load_segment_index(path: str | Path) -> dict[str, dict[str, Any]]:
+    index_path = segment_index_path(path)
+    if not index_path.exists():
+        return {}
+    entries: dict[str, dict[str, Any]] = {}
+    with index_path.open("rb") as fp:
+        for raw in fp:
+            entry = parse_jsonl_line(raw)
+            if entry is not None and isinstance(entry.get("segment"), str):
+                entries[entry["segment"]] = entry
+    return entries
+
+
+def iter_jsonl_range(
+    path: str | Path,
+    since: float | None = None,
+    until: float | None = None,
+    timestamp_key: str | None = "timestamp",
+) -> Iterator[dict[str, Any]]:
+    # Segments whose indexed [min_ts, max_ts] misses the range are never opened. Timestamps need not be
+    # ordered: a seek point is only taken when every record before it is older than `since`.
+    path = Path(path)
+    index = load_segment_index(path)
+    for segment in [*list_segments(path), path]:
+        entry = index.get(segment.name.removesuffix(".gz"))
+        offset = 0
+        if entry is not None:
+            # Entries written before min/max tracking only carry a trustworthy upper bound.
+            max_ts = entry.get("max_ts", entry.get("last_ts"))
+            if since is not None and max_ts is not None and max_ts < since:
+                continue
+            if until is not None and entry.get("min_ts") is not None and entry["min_ts"] > until:
+                continue
+            for item_offset, max_before in entry.get("seek", []):
+                if since is None or max_before >= since:
+                    break
+                offset = item_offset
+        if not segment.exists():
+            continue
+        with open_segment(segment) as fp:
+            fp.seek(offset)
+            for raw in fp:
+                record = parse_jsonl_line(raw)
+                if record is None:
+                    continue
+                if timestamp_key and record.get(timestamp_key) is not None:
+                    ts = _record_epoch(record, timestamp_key)
+                    if (since is not None and ts < since) or (until is not None and ts > until):
+                        continue
+                yield record
+
+
+class JsonlWriter:
+    def __init__(
+        self,
+        path: str | Path,
+        background: bool = True,
+        fsync_policy: str = "interval",
+        fsync_interval_sec: float = 1.0,
+        rotate_max_bytes: int = 0,
+        rotate_interval_sec: float = 0.0,
+        batch_max: int = 256,
+        queue_max: int = 10000,
+        flush_interval_sec: float = 0.2,
+        compress: str = "none",
+        retention_max_segments: int = 0,
+        retention_max_bytes: int = 0,
+        retention_max_age_sec: float = 0.0,
+        timestamp_key: str | None = "timestamp",
+        index_every: int = 1000,
+        drop_when_full: bool = False,
+    ) -> None:
+        self.path = Path(path)
+        self.background = background
+        self.fsync_policy = fsync_policy if fsync_policy in FSYNC_POLICIES else "interval"
+        self.fsync_interval_sec = max(0.0, float(fsync_interval_sec))
+        self.rotate_max_bytes = max(0, int(rotate_max_bytes))
+        self.rotate_interval_sec = max(0.0, float(rotate_interval_sec))
+        self.batch_max = max(1, int(batch_max))
+        self.flush_interval_sec = max(0.01, float(flush_interval_sec))
+        self.compress = compress if compress in COMPRESSION_MODES else "none"
+        self.retention_max_segments = max(0, int(retention_max_segments))
+        self.retention_max_bytes = max(0, int(retention_max_bytes))
+        self.retention_max_age_sec = max(0.0, float(retention_max_age_sec))
+        self.timestamp_key = timestamp_key
+        self.index_every = max(1, int(index_every))
+        self.drop_when_full = drop_when_full
+        self.dropped = 0
+        self.index_path = segment_index_path(self.path)
+        self.logger = logging.getLogger(__name__)
+
+        self._fp: IO[str] | None = None
+        self._size = 0
+        self._opened_at = 0.0
+        self._last_fsync = 0.0
+        self._unsynced = False
+        self._segment_min_ts: float | None = None
+        self._segment_max_ts: float | None = None
+        self._segment_records = 0
+        self._segment_seek: list[list[float]] = []
+        self._maintenance: Thread | None = None
+        self._index_lock = Lock()
+        self._write_lock = Lock()
+        self._closed = False
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max(1, int(queue_max)))
+        self._thread: Thread | None = None
+        if self.background:
+            self._thread = Thread(target=self._drain_loop, name=f"jsonl-writer:{self.path.name}", daemon=True)
+            self._thread.start()
+        if self.compress != "none" and any(not item.name.endswith(".gz") for item in list_segments(self.path)):
+            # Finish compressing segments left behind by a previous crash.
+            self._start_maintenance([item for item in list_segments(self.path) if not item.name.endswith(".gz")])
+
+    def write(self, payload: dict[str, Any]) -> bool:
+        if self._closed:
+            raise RuntimeError(f"JsonlWriter is closed: {self.path}")
+        if not self.background:
+            with self._write_lock:
+                self._write_batch([payload])
+            return True
+        if not self.drop_when_full:
+            # Blocks only when the queue is full, which back-pressures callers instead of dropping lines;
+            # async callers hand writes to a worker thread so that wait never lands on the event loop.
+            self._queue.put(payload)
+            return True
+        try:
+            self._queue.put_nowait(payload)
+        except queue.Full:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 100 == 0:
+                self.logger.warning("JSONL writer queue full. path=%s dropped=%s", self.path, self.dropped)
+            return False
+        return True
+
+    def flush(self) -> None:
+        if self.background and self._thread is not None and self._thread.is_alive():
+            self._queue.join()
+        with self._write_lock:
+            if self._fp is not None:
+                self._fp.flush()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join()
+            self._thread = None
+        with self._write_lock:
+            self._close_file(sync=self.fsync_policy != "none")
+        if self._maintenance is not None:
+            self._maintenance.join()
+
+    def _open(self) -> IO[str]:
+        if self._fp is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._fp = self.path.open("a", encoding="utf-8")
+            self._size = self._fp.tell()
+            if self._size and not self._ends_with_newline():
+                # Terminate a truncated trailing line so the next record stays parseable.
+                self._fp.write("\n")
+                self._size += 1
+            self._opened_at = time.monotonic()
+            self._segment_min_ts, self._segment_max_ts = self._existing_ts_bounds() if self._size else (None, None)
+            self._segment_records = 0
+            self._segment_seek = []
+        return self._fp
+
+    def _existing_ts_bounds(self) -> tuple[float | None, float | None]:
+        # A reopened segment keeps its earlier records, so its index bounds must cover them too.
+        low: float | None = None
+        high: float | None = None
+        with self.path.open("rb") as fp:
+            for raw in fp:
+                record = parse_jsonl_line(raw)
+                if record is None:
+                    continue
+                ts = _record_epoch(record, self.timestamp_key)
+                low = ts if low is None else min(low, ts)
+                high = ts if high is None else max(high, ts)
+        return low, high
+
+    def _ends_with_newline(self) -> bool:
+        with self.path.open("rb") as fp:
+            fp.seek(-1, os.SEEK_END)
+            return fp.read(1) == b"\n"
+
+    def _close_file(self, sync: bool) -> None:
+        if self._fp is None:
+            return
+        try:
+            self._fp.flush()
+            if sync:
+                os.fsync(self._fp.fileno())
+        finally:
+            self._fp.close()
+            self._fp = None
+            self._unsynced = False
+
+    def _should_rotate(self) -> bool:
+        if self._fp is None or self._size == 0:
+            return False
+        if self.rotate_max_bytes and self._size >= self.rotate_max_bytes:
+            return True
+        if self.rotate_interval_sec and time.monotonic() - self._opened_at >= self.rotate_interval_sec:
+            return True
+        return False
+
+    def rotated_path(self) -> Path:
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+        return self.path.with_name(f"{self.path.stem}.{stamp}{self.path.suffix}")
+
+    def _rotate(self) -> None:
+        self._close_file(sync=self.fsync_policy != "none")
+        target = self.rotated_path()
+        os.replace(self.path, target)
+        if self._segment_max_ts is not None:
+            entry = {
+                "segment": target.name,
+                "min_ts": self._segment_min_ts,
+                "max_ts": self._segment_max_ts,
+                "bytes": self._size,
+                "seek": self._segment_seek,
+            }
+            with self._index_lock, self.index_path.open("a", encoding="utf-8") as fp:
+                fp.write(json.dumps(entry) + "\n")
+        self.logger.info("Rotated JSONL log. path=%s segment=%s", self.path, target)
+        self._start_maintenance([target] if self.compress != "none" else [])
+
+    def _start_maintenance(self, segments: list[Path]) -> None:
+        # Compression and retention run off the write path; one pass at a time.
+        if self._maintenance is not None:
+            self._maintenance.join()
+        self._maintenance = Thread(
+            target=self._run_maintenance,
+            args=(segments,),
+            name=f"jsonl-maintenance:{self.path.name}",
+            daemon=True,
+        )
+        self._maintenance.start()
+
+    def _run_maintenance(self, segments: list[Path]) -> None:
+        for segment in segments:
+            try:
+                self._compress_segment(segment)
+            except Exception as exc:
+                self.logger.warning("JSONL segment compression failed. segment=%s err=%s", segment, exc)
+        try:
+            self._apply_retention()
+        except Exception as exc:
+            self.logger.warning("JSONL retention pass failed. path=%s err=%s", self.path, exc)
+
+    def _compress_segment(self, segment: Path) -> None:
+        target = segment.with_name(f"{segment.name}.gz")
+        tmp_path = segment.with_name(f"{segment.name}.gz.tmp")
+        with segment.open("rb") as src, gzip.open(tmp_path, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        os.replace(tmp_path, target)
+        segment.unlink()
+
+    def _apply_retention(self) -> None:
+        if not (self.retention_max_segments or self.retention_max_bytes or self.retention_max_age_sec):
+            return
+        segments = list_segments(self.path)
+        sizes = {item: item.stat().st_size for item in segments}
+        total = sum(sizes.values())
+        now = time.time()
+        removed: list[Path] = []
+        for item in segments:
+            remaining = len(segments) - len(removed)
+            expired = self.retention_max_age_sec and now - item.stat().st_mtime > self.retention_max_age_sec
+            if (
+                (self.retention_max_segments and remaining > self.retention_max_segments)
+                or (self.retention_max_bytes and total > self.retention_max_bytes)
+                or expired
+            ):
+                item.unlink()
+                total -= sizes[item]
+                removed.append(item)
+        if removed:
+            self._prune_index()
+            self.logger.info("JSONL retention removed segments. path=%s count=%s", self.path, len(removed))
+
+    def _prune_index(self) -> None:
+        # Rotation appends to the same file from the writer thread; rewrite under the same lock.
+        with self._index_lock:
+            live = {item.name.removesuffix(".gz") for item in list_segments(self.path)}
+            entries = [entry for name, entry in load_segment_index(self.path).items() if name in live]
+            tmp_path = self.index_path.with_name(f"{self.index_path.name}.tmp")
+            tmp_path.write_text("".join(json.dumps(entry) + "\n" for entry in entries), encoding="utf-8")
+            os.replace(tmp_path, self.index_path)
+
+    def _write_batch(self, payloads: list[dict[str, Any]]) -> None:
+        # Serialization happens here so background callers only pay for a queue put.
+        items = [
+            (json.dumps(payload, ensure_ascii=False) + "\n", _record_epoch(payload, self.timestamp_key))
+            for payload in payloads
+        ]
+        if self._should_rotate():
+            self._rotate()
+        fp = self._open()
+        for line, ts in items:
+            if self._segment_records % self.index_every == 0 and self._segment_max_ts is not None:
+                # Seek points carry the newest timestamp written before them, not the record's own.
+                self._segment_seek.append([self._size, self._segment_max_ts])
+            self._segment_min_ts = ts if self._segment_min_ts is None else min(self._segment_min_ts, ts)
+            self._segment_max_ts = ts if self._segment_max_ts is None else max(self._segment_max_ts, ts)
+            self._segment_records += 1
+            self._size += len(line.encode("utf-8"))
+        fp.write("".join(line for line, _ in items))
+        fp.flush()
+        self._unsynced = True
+
+        now = time.monotonic()
+        if self.fsync_policy == "batch" or (
+            self.fsync_policy == "interval" and now - self._last_fsync >= self.fsync_interval_sec
+        ):
+            self._fsync(now)
+
+    def _fsync(self, now: float) -> None:
+        if self._fp is not None:
+            os.fsync(self._fp.fileno())
+        self._last_fsync = now
+        self._unsynced = False
+
+    def _sync_if_idle_due(self) -> None:
+        # Under "interval" a write that lands inside the window would otherwise wait for the next write.
+        if self.fsync_policy != "interval" or not self._unsynced:
+            return
+        with self._write_lock:
+            now = time.monotonic()
+            if self._unsynced and now - self._last_fsync >= self.fsync_interval_sec:
+                try:
+                    self._fsync(now)
+                except OSError as exc:
+                    self.logger.warning("JSONL fsync failed. path=%s err=%s", self.path, exc)
+
+    def _drain_loop(self) -> None:
+        stopping = False
+        while not stopping:
+            try:
+                first = self._queue.get(timeout=self.flush_interval_sec)
+            except queue.Empty:
+                self._sync_if_idle_due()
+                continue
+
+            items = [first]
+            while len(items) < self.batch_max:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            lines = [item for item in items if item is not _STOP]
+            stopping = len(lines) != len(items)
+            try:
+                if lines:
+                    with self._write_lock:
+                        self._write_batch(lines)
+            except Exception as exc:
+                self.logger.warning("JSONL batch write failed. path=%s lines=%s err=%s", self.path, len(lines), exc)
+            finally:
+                for _ in items:
+                    self._queue.task_done()
@@ -0,0 +1,204 @@
+import gzip
+import json
+import os
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from src.rag.manual_repository import ManualEntry, corpus_version, load_manuals
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def new_snapshot_epoch() -> str:
+    # Version counters restart with the process; the epoch tells clients their cursor is from another run.
+    return uuid.uuid4().hex[:12]
+
+
+def dumps_json_bytes(payload: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def normalize_timestamp(value: Any) -> str:
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        try:
+            parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        except ValueError:
+            parsed = datetime.now(timezone.utc)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).isoformat()
+
+
+def read_jsonl_tail(path: Path, max_records: int, block_size: int = 65536) -> list[dict[str, Any]]:
+    if max_records <= 0 or not path.exists():
+        return []
+    if path.name.endswith(".gz"):
+        # Compressed segments are bounded by the rotation size, so they are read whole.
+        with gzip.open(path, "rb") as gz:
+            lines = gz.read().split(b"\n")
+        records = []
+        for raw in reversed(lines):
+            record = parse_jsonl_line(raw)
+            if record is not None:
+                records.append(record)
+                if len(records) >= max_records:
+                    break
+        return records
+
+    records: list[dict[str, Any]] = []
+    with path.open("rb") as fp:
+        fp.seek(0, os.SEEK_END)
+        position = fp.tell()
+        carry = b""
+        while position > 0 and len(records) < max_records:
+            read_size = min(block_size, position)
+            position -= read_size
+            fp.seek(position)
+            chunk = fp.read(read_size) + carry
+            lines = chunk.split(b"\n")
+            # The first piece may continue in the previous block unless we reached the file start.
+            carry = lines.pop(0) if position > 0 else b""
+            for raw in reversed(lines):
+                record = parse_jsonl_line(raw)
+                if record is not None:
+                    records.append(record)
+                    if len(records) >= max_records:
+                        break
+    return records
+
+
+def parse_jsonl_line(raw: bytes) -> dict[str, Any] | None:
+    raw = raw.strip()
+    if not raw:
+        return None
+    try:
+        record = json.loads(raw)
+    except ValueError:
+        # A crash mid-write can leave a truncated final line.
+        return None
+    return record if isinstance(record, dict) else None
+
+
+class ReferenceCatalog:
+    def __init__(self, manuals: list[ManualEntry], archive_dir: str | Path | None = None) -> None:
+        self.version = corpus_version(manuals)
+        self._by_id: dict[str, dict[str, Any]] = {
+            entry.id: {"id": entry.id, "title": entry.title, "content": entry.content, "tags": list(entry.tags)}
+            for entry in manuals
+        }
+        self._versions: dict[str, dict[str, dict[str, Any]] | None] = {self.version: self._by_id}
+        self.archive_dir = Path(archive_dir) if archive_dir is not None else None
+        self._archived = False
+
+    @classmethod
+    def default(cls) -> "ReferenceCatalog":
+        return cls(load_manuals())
+
+    def attach_archive(self, archive_dir: str | Path) -> None:
+        self.archive_dir = Path(archive_dir)
+        self._archived = False
+
+    def archive_current(self) -> None:
+        # Every corpus version that ids were stored under is kept on disk, so they still resolve
+        # after the manuals change. Written once, on the first stored response.
+        if self._archived or self.archive_dir is None:
+            return
+        self._archived = True
+        path = self.archive_dir / f"{self.version}.json"
+        if path.exists():
+            return
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        tmp_path.write_text(json.dumps(list(self._by_id.values()), ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    def _entries(self, version: str) -> dict[str, dict[str, Any]] | None:
+        if version not in self._versions:
+            path = self.archive_dir / f"{version}.json" if self.archive_dir is not None else None
+            entries = json.loads(path.read_text(encoding="utf-8")) if path is not None and path.exists() else None
+            self._versions[version] = {entry["id"]: entry for entry in entries} if entries is not None else None
+        return self._versions[version]
+
+    def compact(self, reference: dict[str, Any]) -> str | dict[str, Any]:
+        ref_id = reference.get("id")
+        known = self._by_id.get(ref_id) if isinstance(ref_id, str) else None
+        # Only references identical to the corpus entry are replaced by their id.
+        if known is not None and all(reference.get(key) == value for key, value in known.items()):
+            return ref_id
+        return reference
+
+    def resolve(self, reference: str | dict[str, Any], version: str | None = None) -> dict[str, Any] | None:
+        # Ids resolve against the corpus version they were stored under; None when that text is gone.
+        if isinstance(reference, dict):
+            return reference
+        entries = self._entries(version or self.version)
+        known = entries.get(reference) if entries is not None else None
+        if known is None:
+            return None
+        return {**known, "tags": list(known["tags"])}
+
+
+_MISSING = object()
+
+
+class CompactResponse:
+    FIELDS = (
+        "event_id",
+        "rag_source",
+        "llm_provider",
+        "operator_response",
+        "jetson_tts_summary",
+        "response_tier",
+        "degradation_level",
+    )
+    __slots__ = (*FIELDS, "references", "corpus_version", "extra")
+
+    def __init__(self, payload: dict[str, Any], catalog: ReferenceCatalog) -> None:
+        for name in self.FIELDS:
+            setattr(self, name, payload.get(name, _MISSING))
+
+        raw_refs = payload.get("references")
+        self.references: tuple[str | dict[str, Any], ...] | None = None
+        if isinstance(raw_refs, list):
+            self.references = tuple(catalog.compact(ref) if isinstance(ref, dict) else str(ref) for ref in raw_refs)
+        self.corpus_version = payload.get("corpus_version") or catalog.version
+
+        known = {*self.FIELDS, "references", "corpus_version"}
+        extra = {key: value for key, value in payload.items() if key not in known}
+        self.extra: dict[str, Any] | None = extra or None
+
+    def _fields(self) -> dict[str, Any]:
+        data: dict[str, Any] = {}
+        for name in self.FIELDS:
+            value = getattr(self, name)
+            if value is not _MISSING:
+                data[name] = value
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def to_stored(self) -> dict[str, Any]:
+        data = self._fields()
+        if self.references is not None:
+            data["references"] = list(self.references)
+            data["corpus_version"] = self.corpus_version
+        return data
+
+    def to_payload(self, catalog: ReferenceCatalog) -> dict[str, Any]:
+        data = self._fields()
+        if self.references is not None:
+            resolved = [(ref, catalog.resolve(ref, self.corpus_version)) for ref in self.references]
+            data["references"] = [item for _, item in resolved if item is not None]
+            unresolved = [ref for ref, item in resolved if item is None]
+            if unresolved:
+                data["unresolved_references"] = unresolved
+        return data
@@ -0,0 +1,367 @@
+import bisect
+import json
+import logging
+import os
+import re
+import shutil
+import time
+from array import array
+from datetime import datetime, timezone
+from pathlib import Path
+from threading import Lock, Thread
+from typing import Any
+
+from src.api.repositories.jsonl_writer import JsonlWriter
+from src.api.repositories.records import normalize_timestamp
+from src.api.services.hazard_context import HazardContextService
+
+_TOKEN_RE = re.compile(r"[가-힣]+|[a-z0-9]+")
+
+
+def tokenize(text: str) -> list[str]:
+    # Korean has no reliable word boundaries, so Hangul runs are indexed as character bigrams.
+    tokens: list[str] = []
+    for run in _TOKEN_RE.findall(text.lower()):
+        if run.isascii() or len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[idx : idx + 2] for idx in range(len(run) - 1))
+    return tokens
+
+
+class SearchIndex:
+    # The journal only holds what arrived since the last snapshot, so startup loads one snapshot and a short
+    # tail instead of replaying every event ever indexed. Doc ids are global and never reused, so search
+    # cursors stay valid when the oldest docs are trimmed.
+    SNAPSHOT_VERSION = 1
+
+    def __init__(
+        self,
+        journal_path: str | None = None,
+        write_behind: bool = True,
+        snapshot_every: int = 10000,
+        max_docs: int = 0,
+        max_age_sec: float = 0.0,
+    ) -> None:
+        self.journal_path = Path(journal_path) if journal_path else None
+        self.snapshot_path = (
+            self.journal_path.with_name(f"{self.journal_path.stem}.snapshot.json") if self.journal_path else None
+        )
+        self.write_behind = write_behind
+        self.snapshot_every = max(0, int(snapshot_every))
+        self.max_docs = max(0, int(max_docs))
+        self.max_age_sec = max(0.0, float(max_age_sec))
+        self.hazard_context = HazardContextService()
+        self.logger = logging.getLogger(__name__)
+        self._lock = Lock()
+        self._base = 0
+        self._postings: dict[str, array] = {}
+        self._event_ids: list[str] = []
+        self._doc_by_event_id: dict[str, int] = {}
+        self._doc_ts = array("d")
+        self._doc_source = array("I")
+        self._doc_hazard = array("I")
+        self._labels: list[str] = []
+        self._label_ids: dict[str, int] = {}
+        self._journal: JsonlWriter | None = None
+        self._journaled = 0
+        self._snapshotter: Thread | None = None
+        if self.journal_path is not None:
+            self._load_snapshot()
+            for path in (self._previous_journal_path(self.journal_path), self.journal_path):
+                self._journaled += self._replay_journal(path)
+            self._journal = JsonlWriter(self.journal_path, background=write_behind, fsync_policy="none")
+            if self._snapshot_due():
+                self._start_snapshot()
+
+    @property
+    def doc_count(self) -> int:
+        return len(self._event_ids)
+
+    def add_event(self, payload: dict[str, Any]) -> None:
+        record = {
+            "op": "event",
+            "event_id": str(payload.get("event_id", "")),
+            "timestamp": normalize_timestamp(payload.get("timestamp")),
+            "source": str(payload.get("source", "")),
+            "hazard": self.hazard_context.infer_hazard_hint_from_payload(payload),
+            "text": str(payload.get("summary") or ""),
+        }
+        self._record(record)
+
+    def add_response(self, event_id: str, payload: dict[str, Any]) -> None:
+        self._record({"op": "response", "event_id": event_id, "text": str(payload.get("operator_response") or "")})
+
+    def search(
+        self,
+        query: str,
+        limit: int = 50,
+        cursor: str | None = None,
+        source: str | None = None,
+        hazard: str | None = None,
+        since: datetime | None = None,
+    ) -> dict[str, Any]:
+        terms = sorted(set(tokenize(query)))
+        if not terms:
+            raise ValueError("Query has no searchable terms.")
+        try:
+            before = int(cursor) if cursor else None
+        except ValueError as exc:
+            raise ValueError(f"Invalid cursor: {cursor!r}") from exc
+        since_ts = datetime.fromisoformat(normalize_timestamp(since)).timestamp() if since is not None else None
+        limit = max(1, min(500, int(limit)))
+
+        with self._lock:
+            postings = [self._postings_for(term) for term in terms]
+            if any(len(posting) == 0 for posting in postings):
+                return {"hits": [], "next_cursor": None}
+            postings.sort(key=len)
+            source_id = self._label_ids.get(source) if source else None
+            hazard_id = self._label_ids.get(hazard) if hazard else None
+            if (source and source_id is None) or (hazard and hazard_id is None):
+                return {"hits": [], "next_cursor": None}
+
+            # Walk the rarest term newest-first and probe the others by binary search.
+            shortest, others = postings[0], postings[1:]
+            end = bisect.bisect_left(shortest, before) if before is not None else len(shortest)
+            docs: list[int] = []
+            for pos in range(end - 1, -1, -1):
+                doc = shortest[pos]
+                slot = doc - self._base
+                if source_id is not None and self._doc_source[slot] != source_id:
+                    continue
+                if hazard_id is not None and self._doc_hazard[slot] != hazard_id:
+                    continue
+                if since_ts is not None and self._doc_ts[slot] < since_ts:
+                    continue
+                if all(_contains(posting, doc) for posting in others):
+                    docs.append(doc)
+                    if len(docs) > limit:
+                        break
+
+            has_more = len(docs) > limit
+            docs = docs[:limit]
+            hits = [self._hit(doc) for doc in docs]
+        return {"hits": hits, "next_cursor": str(docs[-1]) if has_more and docs else None}
+
+    def flush(self) -> None:
+        if self._journal is not None:
+            self._journal.flush()
+
+    def close(self) -> None:
+        snapshotter = self._snapshotter
+        if snapshotter is not None:
+            snapshotter.join()
+        with self._lock:
+            if self._journal is not None:
+                self._journal.close()
+
+    def _hit(self, doc: int) -> dict[str, Any]:
+        slot = doc - self._base
+        return {
+            "event_id": self._event_ids[slot],
+            "timestamp": datetime.fromtimestamp(self._doc_ts[slot], tz=timezone.utc).isoformat(),
+            "source": self._labels[self._doc_source[slot]],
+            "hazard": self._labels[self._doc_hazard[slot]],
+        }
+
+    def _postings_for(self, term: str) -> array:
+        posting = self._postings.get(term)
+        if posting is not None or len(term) != 1 or term.isascii():
+            return posting if posting is not None else array("I")
+        # A single Hangul syllable matches every bigram that contains it.
+        merged = sorted(
+            {doc for key, values in self._postings.items() if len(key) == 2 and term in key for doc in values}
+        )
+        return array("I", merged)
+
+    def _label(self, value: str) -> int:
+        label_id = self._label_ids.get(value)
+        if label_id is None:
+            label_id = self._label_ids[value] = len(self._labels)
+            self._labels.append(value)
+        return label_id
+
+    def _record(self, record: dict[str, Any]) -> None:
+        with self._lock:
+            if not self._apply(record) or self._journal is None:
+                return
+            # Journaled under the index lock so no record can land in a journal a snapshot has already retired.
+            self._journal.write(record)
+            self._journaled += 1
+            due = self._snapshot_due()
+        if due:
+            self._start_snapshot()
+
+    def _apply(self, record: dict[str, Any]) -> bool:
+        # Callers hold the lock, except replay during __init__.
+        event_id = str(record.get("event_id", ""))
+        doc = self._doc_by_event_id.get(event_id)
+        if record.get("op") == "event":
+            source = str(record.get("source", ""))
+            hazard = str(record.get("hazard", "general"))
+            if doc is None:
+                doc = self._doc_by_event_id[event_id] = self._base + len(self._event_ids)
+                self._event_ids.append(event_id)
+                self._doc_ts.append(datetime.fromisoformat(normalize_timestamp(record.get("timestamp"))).timestamp())
+                self._doc_source.append(self._label(source))
+                self._doc_hazard.append(self._label(hazard))
+            tokens = tokenize(" ".join([str(record.get("text", "")), source, hazard]))
+        elif doc is not None:
+            tokens = tokenize(str(record.get("text", "")))
+        else:
+            return False
+        for token in set(tokens):
+            _insert(self._postings.setdefault(token, array("I")), doc)
+        return True
+
+    @staticmethod
+    def _previous_journal_path(journal_path: Path) -> Path:
+        return journal_path.with_name(f"{journal_path.name}.prev")
+
+    def _snapshot_due(self) -> bool:
+        running = self._snapshotter is not None and self._snapshotter.is_alive()
+        return bool(self.snapshot_every) and self._journaled >= self.snapshot_every and not running
+
+    def _start_snapshot(self) -> None:
+        with self._lock:
+            if self._snapshotter is not None and self._snapshotter.is_alive():
+                return
+            self._snapshotter = Thread(target=self._snapshot, name="search-index-snapshot", daemon=True)
+            self._snapshotter.start()
+
+    def _snapshot(self) -> None:
+        if self.journal_path is None or self.snapshot_path is None:
+            return
+        try:
+            with self._lock:
+                self._trim(time.time())
+                state = self._state()
+                self._retire_journal(self.journal_path)
+            tmp_path = self.snapshot_path.with_name(f"{self.snapshot_path.name}.tmp")
+            tmp_path.write_text(json.dumps(state, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, self.snapshot_path)
+            # Only once the snapshot covering it is in place.
+            self._previous_journal_path(self.journal_path).unlink(missing_ok=True)
+            self.logger.info(
+                "Search index snapshot written. path=%s docs=%s", self.snapshot_path, len(state["event_ids"])
+            )
+        except Exception as exc:
+            self.logger.warning("Search index snapshot failed. path=%s err=%s", self.journal_path, exc)
+
+    def _retire_journal(self, journal_path: Path) -> None:
+        # Everything journaled so far is in the snapshot being written; start a fresh journal for the tail.
+        if self._journal is not None:
+            self._journal.close()
+        previous = self._previous_journal_path(journal_path)
+        try:
+            if journal_path.exists() and previous.exists():
+                # An earlier snapshot failed after retiring its journal; keep both until one succeeds.
+                with journal_path.open("rb") as src, previous.open("ab") as dst:
+                    shutil.copyfileobj(src, dst)
+                journal_path.unlink()
+            elif journal_path.exists():
+                os.replace(journal_path, previous)
+        finally:
+            self._journal = JsonlWriter(journal_path, background=self.write_behind, fsync_policy="none")
+            self._journaled = 0
+
+    def _trim(self, now: float) -> None:
+        # Drops the oldest docs beyond max_docs or older than max_age_sec, keeping memory and the snapshot bounded.
+        keep_from = self._base
+        if self.max_docs and len(self._event_ids) > self.max_docs:
+            keep_from = self._base + len(self._event_ids) - self.max_docs
+        if self.max_age_sec:
+            cutoff = now - self.max_age_sec
+            while keep_from - self._base < len(self._doc_ts) and self._doc_ts[keep_from - self._base] < cutoff:
+                keep_from += 1
+        drop = keep_from - self._base
+        if drop <= 0:
+            return
+        for event_id in self._event_ids[:drop]:
+            self._doc_by_event_id.pop(event_id, None)
+        del self._event_ids[:drop]
+        self._doc_ts = self._doc_ts[drop:]
+        self._doc_source = self._doc_source[drop:]
+        self._doc_hazard = self._doc_hazard[drop:]
+        for term in list(self._postings):
+            posting = self._postings[term]
+            pos = bisect.bisect_left(posting, keep_from)
+            if pos == len(posting):
+                del self._postings[term]
+            elif pos:
+                self._postings[term] = posting[pos:]
+        self._base = keep_from
+
+    def _state(self) -> dict[str, Any]:
+        return {
+            "version": self.SNAPSHOT_VERSION,
+            "base": self._base,
+            "event_ids": list(self._event_ids),
+            "doc_ts": self._doc_ts.tolist(),
+            "doc_source": self._doc_source.tolist(),
+            "doc_hazard": self._doc_hazard.tolist(),
+            "labels": list(self._labels),
+            "postings": {term: posting.tolist() for term, posting in self._postings.items()},
+        }
+
+    def _load_snapshot(self) -> None:
+        path = self.snapshot_path
+        if path is None or not path.exists():
+            return
+        try:
+            state = json.loads(path.read_text(encoding="utf-8"))
+            if state.get("version") != self.SNAPSHOT_VERSION:
+                raise ValueError(f"unsupported snapshot version {state.get('version')!r}")
+            self._base = int(state["base"])
+            self._event_ids = [str(item) for item in state["event_ids"]]
+            self._doc_ts = array("d", state["doc_ts"])
+            self._doc_source = array("I", state["doc_source"])
+            self._doc_hazard = array("I", state["doc_hazard"])
+            self._labels = [str(item) for item in state["labels"]]
+            self._postings = {term: array("I", docs) for term, docs in state["postings"].items()}
+        except Exception as exc:
+            # The journal tail alone still rebuilds what arrived since; older docs are unsearchable until then.
+            self.logger.warning("Failed to load search index snapshot. path=%s err=%s", path, exc)
+            self._base, self._event_ids, self._postings, self._labels = 0, [], {}, []
+            self._doc_ts, self._doc_source, self._doc_hazard = array("d"), array("I"), array("I")
+        self._doc_by_event_id = {event_id: self._base + slot for slot, event_id in enumerate(self._event_ids)}
+        self._label_ids = {label: label_id for label_id, label in enumerate(self._labels)}
+
+    def _replay_journal(self, path: Path) -> int:
+        if not path.exists():
+            return 0
+        replayed = skipped = 0
+        with path.open("r", encoding="utf-8") as fp:
+            for line in fp:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    skipped += 1
+                    continue
+                if isinstance(record, dict):
+                    self._apply(record)
+                    replayed += 1
+        self.logger.info(
+            "Search index journal replayed. path=%s records=%s docs=%s skipped=%s",
+            path,
+            replayed,
+            len(self._event_ids),
+            skipped,
+        )
+        return replayed
+
+
+def _contains(posting: array, doc: int) -> bool:
+    pos = bisect.bisect_left(posting, doc)
+    return pos < len(posting) and posting[pos] == doc
+
+
+def _insert(posting: array, doc: int) -> None:
+    # Doc ids grow monotonically, so this is an append except for late responses.
+    if not posting or posting[-1] < doc:
+        posting.append(doc)
+        return
+    pos = bisect.bisect_left(posting, doc)
+    if pos == len(posting) or posting[pos] != doc:
+        posting.insert(pos, doc)
@@ -0,0 +1,186 @@
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+from src.api.repositories.records import (
+    CompactResponse,
+    ReferenceCatalog,
+    dumps_json_bytes,
+    new_snapshot_epoch,
+    normalize_timestamp,
+)
+from src.api.services.hazard_context import HazardContextService
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    event_id TEXT NOT NULL,
+    ts TEXT NOT NULL,
+    source TEXT NOT NULL,
+    hazard TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_events_event_id ON events(event_id);
+CREATE INDEX IF NOT EXISTS idx_events_ts ON events(ts);
+CREATE INDEX IF NOT EXISTS idx_events_source_seq ON events(source, seq);
+CREATE INDEX IF NOT EXISTS idx_events_hazard_seq ON events(hazard, seq);
+CREATE INDEX IF NOT EXISTS idx_events_version ON events(version);
+
+CREATE TABLE IF NOT EXISTS responses (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    event_id TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_event_id ON responses(event_id, seq);
+CREATE INDEX IF NOT EXISTS idx_responses_version ON responses(version);
+"""
+
+
+class SQLiteEventRepository:
+    def __init__(self, db_path: str, recents_max: int = 100, catalog: ReferenceCatalog | None = None) -> None:
+        self.db_path = Path(db_path)
+        self.recents_max = recents_max
+        self.catalog = catalog or ReferenceCatalog.default()
+        if self.catalog.archive_dir is None:
+            self.catalog.attach_archive(self.db_path.parent / "reference_catalog")
+        self.hazard_context = HazardContextService()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = Lock()
+        self._version = int(
+            self._conn.execute(
+                "SELECT MAX(COALESCE((SELECT MAX(version) FROM events), 0), "
+                "COALESCE((SELECT MAX(version) FROM responses), 0))"
+            ).fetchone()[0]
+        )
+        self._snapshot_cache: tuple[int, bytes] | None = None
+        self.epoch = new_snapshot_epoch()
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def append_event(self, payload: dict[str, Any]) -> None:
+        event_id = str(payload.get("event_id", ""))
+        ts = normalize_timestamp(payload.get("timestamp"))
+        source = str(payload.get("source", ""))
+        hazard = self.hazard_context.infer_hazard_hint_from_payload(payload)
+        body = json.dumps(payload, ensure_ascii=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO events (event_id, ts, source, hazard, version, payload) VALUES (?, ?, ?, ?, ?, ?)",
+                (event_id, ts, source, hazard, self._version + 1, body),
+            )
+            self._version += 1
+
+    def _load_response(self, raw: str) -> dict[str, Any]:
+        return CompactResponse(json.loads(raw), self.catalog).to_payload(self.catalog)
+
+    def append_response(self, event_id: str, payload: dict[str, Any]) -> None:
+        self.catalog.archive_current()
+        body = json.dumps(CompactResponse(payload, self.catalog).to_stored(), ensure_ascii=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO responses (event_id, version, payload) VALUES (?, ?, ?)",
+                (event_id, self._version + 1, body),
+            )
+            self._version += 1
+
+    def get_recent_snapshot(self, since: int | None = None) -> dict[str, Any]:
+        with self._lock:
+            return self._build_snapshot(since)
+
+    def _build_snapshot(self, since: int | None) -> dict[str, Any]:
+        delta = since is not None and 0 <= since <= self._version
+        floor = since if delta and since is not None else 0
+        event_rows = self._conn.execute(
+            "SELECT payload FROM events WHERE version > ? ORDER BY seq DESC LIMIT ?",
+            (floor, self.recents_max),
+        ).fetchall()
+        response_rows = self._conn.execute(
+            "SELECT payload FROM responses WHERE version > ? ORDER BY seq DESC LIMIT ?",
+            (floor, self.recents_max),
+        ).fetchall()
+        events = [json.loads(row[0]) for row in event_rows]
+        responses = [self._load_response(row[0]) for row in response_rows]
+        return {
+            "version": self._version,
+            "epoch": self.epoch,
+            "delta": delta,
+            "event_count": len(events),
+            "response_count": len(responses),
+            "events": events,
+            "responses": responses,
+        }
+
+    def get_recent_snapshot_bytes(self, since: int | None = None) -> tuple[int, bytes]:
+        with self._lock:
+            if since is None and self._snapshot_cache is not None and self._snapshot_cache[0] == self._version:
+                return self._snapshot_cache
+            body = dumps_json_bytes(self._build_snapshot(since))
+            if since is None:
+                self._snapshot_cache = (self._version, body)
+            return self._version, body
+
+    def get_response(self, event_id: str) -> dict[str, Any] | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM responses WHERE event_id = ? ORDER BY seq DESC LIMIT 1",
+                (event_id,),
+            ).fetchone()
+        return self._load_response(row[0]) if row is not None else None
+
+    def query_events(
+        self,
+        since: datetime | None = None,
+        source: str | None = None,
+        hazard: str | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> dict[str, Any]:
+        clauses: list[str] = []
+        params: list[Any] = []
+        if cursor:
+            if not cursor.isdigit():
+                raise ValueError(f"Invalid cursor: {cursor!r}")
+            clauses.append("seq < ?")
+            params.append(int(cursor))
+        if since is not None:
+            clauses.append("ts >= ?")
+            params.append(normalize_timestamp(since))
+        if source:
+            clauses.append("source = ?")
+            params.append(source)
+        if hazard:
+            clauses.append("hazard = ?")
+            params.append(hazard)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        limit = max(1, min(500, int(limit)))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT seq, payload FROM events {where} ORDER BY seq DESC LIMIT ?",
+                (*params, limit + 1),
+            ).fetchall()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        return {
+            "events": [json.loads(row[1]) for row in rows],
+            "next_cursor": str(rows[-1][0]) if has_more and rows else None,
+        }
+
+    def flush(self) -> None:
+        return None
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
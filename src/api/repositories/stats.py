@@ -0,0 +1,233 @@
+import bisect
+import json
+import logging
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+from src.api.services.hazard_context import HazardContextService
+
+STATS_WINDOWS: dict[str, int] = {"1h": 1, "24h": 24, "7d": 24 * 7, "30d": 24 * 30}
+CONFIDENCE_BUCKETS = 10
+# Upper bounds in milliseconds; the last bucket is open-ended.
+LATENCY_BUCKETS_MS: tuple[float, ...] = (50, 100, 250, 500, 1000, 2000, 4000, 8000, 16000, 32000, float("inf"))
+
+
+class _HourBucket:
+    __slots__ = (
+        "events",
+        "responses",
+        "by_hazard",
+        "by_source",
+        "by_rag_source",
+        "confidence_hist",
+        "confidence_sum",
+        "confidence_count",
+        "latency_hist",
+    )
+
+    def __init__(self) -> None:
+        self.events = 0
+        self.responses = 0
+        self.by_hazard: Counter[str] = Counter()
+        self.by_source: Counter[str] = Counter()
+        self.by_rag_source: Counter[str] = Counter()
+        self.confidence_hist = [0] * CONFIDENCE_BUCKETS
+        self.confidence_sum = 0.0
+        self.confidence_count = 0
+        self.latency_hist = [0] * len(LATENCY_BUCKETS_MS)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "events": self.events,
+            "responses": self.responses,
+            "by_hazard": dict(self.by_hazard),
+            "by_source": dict(self.by_source),
+            "by_rag_source": dict(self.by_rag_source),
+            "confidence_hist": self.confidence_hist,
+            "confidence_sum": self.confidence_sum,
+            "confidence_count": self.confidence_count,
+            "latency_hist": self.latency_hist,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "_HourBucket":
+        bucket = cls()
+        bucket.events = int(data.get("events", 0))
+        bucket.responses = int(data.get("responses", 0))
+        bucket.by_hazard.update(data.get("by_hazard", {}))
+        bucket.by_source.update(data.get("by_source", {}))
+        bucket.by_rag_source.update(data.get("by_rag_source", {}))
+        if len(data.get("confidence_hist", [])) == CONFIDENCE_BUCKETS:
+            bucket.confidence_hist = [int(value) for value in data["confidence_hist"]]
+        bucket.confidence_sum = float(data.get("confidence_sum", 0.0))
+        bucket.confidence_count = int(data.get("confidence_count", 0))
+        if len(data.get("latency_hist", [])) == len(LATENCY_BUCKETS_MS):
+            bucket.latency_hist = [int(value) for value in data["latency_hist"]]
+        return bucket
+
+
+def _hour_of(epoch_sec: float) -> int:
+    return int(epoch_sec // 3600)
+
+
+def _histogram_percentile(hist: list[int], bounds: tuple[float, ...], pct: float) -> float | None:
+    total = sum(hist)
+    if total == 0:
+        return None
+    target = pct * total
+    running = 0
+    for count, bound in zip(hist, bounds):
+        running += count
+        if running >= target:
+            return bound if bound != float("inf") else bounds[-2]
+    return bounds[-2]
+
+
+class EventStats:
+    def __init__(
+        self,
+        retention_hours: int = STATS_WINDOWS["30d"],
+        persist_path: str | None = None,
+        save_interval_sec: float = 60.0,
+    ) -> None:
+        self.retention_hours = max(1, int(retention_hours))
+        self.persist_path = Path(persist_path) if persist_path else None
+        # Saved by a background task in the API lifespan, never on the request path.
+        self.save_interval_sec = max(1.0, float(save_interval_sec))
+        self.hazard_context = HazardContextService()
+        self.logger = logging.getLogger(__name__)
+        self._buckets: dict[int, _HourBucket] = {}
+        self._lock = Lock()
+        self._dirty = False
+        if self.persist_path is not None:
+            self._load()
+
+    def _bucket(self, hour: int) -> _HourBucket | None:
+        current = _hour_of(time.time())
+        if hour <= current - self.retention_hours:
+            return None
+        bucket = self._buckets.get(hour)
+        if bucket is None:
+            bucket = self._buckets[hour] = _HourBucket()
+            for stale in [key for key in self._buckets if key <= current - self.retention_hours]:
+                del self._buckets[stale]
+        return bucket
+
+    def record_event(self, payload: dict[str, Any]) -> None:
+        hazard = self.hazard_context.infer_hazard_hint_from_payload(payload)
+        confidence = payload.get("confidence")
+        # Bucketed by arrival time so skewed edge clocks cannot land events outside the window.
+        with self._lock:
+            bucket = self._bucket(_hour_of(time.time()))
+            if bucket is None:
+                return
+            bucket.events += 1
+            bucket.by_hazard[hazard] += 1
+            bucket.by_source[str(payload.get("source", ""))] += 1
+            if isinstance(confidence, (int, float)):
+                value = min(1.0, max(0.0, float(confidence)))
+                bucket.confidence_hist[min(CONFIDENCE_BUCKETS - 1, int(value * CONFIDENCE_BUCKETS))] += 1
+                bucket.confidence_sum += value
+                bucket.confidence_count += 1
+            self._dirty = True
+
+    def record_response(self, payload: dict[str, Any], latency_sec: float | None = None) -> None:
+        with self._lock:
+            bucket = self._bucket(_hour_of(time.time()))
+            if bucket is None:
+                return
+            bucket.responses += 1
+            bucket.by_rag_source[str(payload.get("rag_source", "unknown"))] += 1
+            if latency_sec is not None:
+                index = bisect.bisect_left(LATENCY_BUCKETS_MS, max(0.0, latency_sec) * 1000.0)
+                bucket.latency_hist[min(index, len(LATENCY_BUCKETS_MS) - 1)] += 1
+            self._dirty = True
+
+    def summary(self, window: str = "24h") -> dict[str, Any]:
+        hours = STATS_WINDOWS.get(window)
+        if hours is None:
+            raise ValueError(f"Unsupported window: {window!r}. Use one of {sorted(STATS_WINDOWS)}")
+
+        current = _hour_of(time.time())
+        merged = _HourBucket()
+        hourly: list[dict[str, Any]] = []
+        with self._lock:
+            for hour in range(current - hours + 1, current + 1):
+                bucket = self._buckets.get(hour)
+                if bucket is None:
+                    continue
+                merged.events += bucket.events
+                merged.responses += bucket.responses
+                merged.by_hazard.update(bucket.by_hazard)
+                merged.by_source.update(bucket.by_source)
+                merged.by_rag_source.update(bucket.by_rag_source)
+                merged.confidence_hist = [a + b for a, b in zip(merged.confidence_hist, bucket.confidence_hist)]
+                merged.confidence_sum += bucket.confidence_sum
+                merged.confidence_count += bucket.confidence_count
+                merged.latency_hist = [a + b for a, b in zip(merged.latency_hist, bucket.latency_hist)]
+                hourly.append(
+                    {
+                        "hour": datetime.fromtimestamp(hour * 3600, tz=timezone.utc).isoformat(),
+                        "events": bucket.events,
+                        "responses": bucket.responses,
+                    }
+                )
+
+        responses = merged.responses
+        return {
+            "window": window,
+            "events": merged.events,
+            "responses": responses,
+            "by_hazard": dict(merged.by_hazard),
+            "by_source": dict(merged.by_source),
+            "rag_source_ratio": {
+                key: round(count / responses, 4) for key, count in merged.by_rag_source.items()
+            }
+            if responses
+            else {},
+            "confidence": {
+                "avg": round(merged.confidence_sum / merged.confidence_count, 4) if merged.confidence_count else None,
+                "histogram": merged.confidence_hist,
+            },
+            "latency_ms": {
+                "p50": _histogram_percentile(merged.latency_hist, LATENCY_BUCKETS_MS, 0.50),
+                "p95": _histogram_percentile(merged.latency_hist, LATENCY_BUCKETS_MS, 0.95),
+                "p99": _histogram_percentile(merged.latency_hist, LATENCY_BUCKETS_MS, 0.99),
+                "bucket_upper_bounds": [bound for bound in LATENCY_BUCKETS_MS if bound != float("inf")],
+                "histogram": merged.latency_hist,
+            },
+            "hourly": hourly,
+        }
+
+    def _load(self) -> None:
+        if self.persist_path is None or not self.persist_path.exists():
+            return
+        try:
+            raw = json.loads(self.persist_path.read_text(encoding="utf-8"))
+            self._buckets = {int(hour): _HourBucket.from_dict(data) for hour, data in raw.get("buckets", {}).items()}
+        except Exception as exc:
+            self.logger.warning("Failed to load stats snapshot. path=%s err=%s", self.persist_path, exc)
+
+    def save_if_dirty(self) -> None:
+        if self.persist_path is None or not self._dirty:
+            return
+        try:
+            self.save()
+        except OSError as exc:
+            self._dirty = True
+            self.logger.warning("Failed to save stats snapshot. path=%s err=%s", self.persist_path, exc)
+
+    def save(self) -> None:
+        if self.persist_path is None:
+            return
+        with self._lock:
+            data = {"buckets": {str(hour): bucket.to_dict() for hour, bucket in self._buckets.items()}}
+            self._dirty = False
+        self.persist_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.persist_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(self.persist_path)
@@ -1,7 +1,13 @@
+import asyncio
 import logging
-from typing import Any
+import math
+import time
+from datetime import datetime
+from typing import Any, AsyncIterator
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 
 from src.api.app_runtime import ApiRuntime
 from src.api.models import DangerEvent, DangerEventAck, DangerResponse
@@ -9,11 +15,106 @@ from src.api.routes.deps import get_runtime
 
 router = APIRouter()
 LOGGER = logging.getLogger(__name__)
+STREAM_HEARTBEAT_SEC = 15.0
+
+
+@router.get("/events")
+def list_events(
+    since: datetime | None = None,
+    source: str | None = None,
+    hazard: str | None = None,
+    limit: int = Query(default=50, ge=1, le=500),
+    cursor: str | None = None,
+    runtime: ApiRuntime = Depends(get_runtime),
+) -> dict[str, Any]:
+    try:
+        return runtime.repository.query_events(
+            since=since,
+            source=source,
+            hazard=hazard,
+            limit=limit,
+            cursor=cursor,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+@router.get("/events/search")
+def search_events(
+    q: str = Query(min_length=1),
+    since: datetime | None = None,
+    source: str | None = None,
+    hazard: str | None = None,
+    limit: int = Query(default=50, ge=1, le=500),
+    cursor: str | None = None,
+    runtime: ApiRuntime = Depends(get_runtime),
+) -> dict[str, Any]:
+    try:
+        return runtime.search_index.search(
+            q,
+            limit=limit,
+            cursor=cursor,
+            source=source,
+            hazard=hazard,
+            since=since,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+@router.get("/events/stream")
+async def stream_events(
+    request: Request,
+    last_event_id: int | None = Header(default=None, alias="Last-Event-ID"),
+    runtime: ApiRuntime = Depends(get_runtime),
+) -> StreamingResponse:
+    queue = runtime.broadcaster.subscribe(last_event_id=last_event_id)
+
+    async def _messages() -> AsyncIterator[str]:
+        try:
+            yield "retry: 3000\n\n"
+            while not await request.is_disconnected():
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout=STREAM_HEARTBEAT_SEC)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield message.encode()
+        finally:
+            runtime.broadcaster.unsubscribe(queue)
+
+    return StreamingResponse(
+        _messages(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _snapshot_etag(epoch: str, version: int, since: int | None) -> str:
+    return f'"{epoch}-v{version}"' if since is None else f'"{epoch}-v{version}-s{since}"'
 
 
 @router.get("/events/recent")
-def recent_events(runtime: ApiRuntime = Depends(get_runtime)) -> dict[str, Any]:
-    return runtime.repository.get_recent_snapshot()
+def recent_events(
+    request: Request,
+    since: int | None = Query(default=None, ge=0),
+    epoch: str | None = None,
+    runtime: ApiRuntime = Depends(get_runtime),
+) -> Response:
+    # A `since` cursor only means something within the run that issued it; otherwise send everything.
+    if epoch != runtime.repository.epoch:
+        since = None
+    # Idle pollers are answered from the version counter alone, before any serialization.
+    etag = _snapshot_etag(runtime.repository.epoch, runtime.repository.version, since)
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    version, body = runtime.repository.get_recent_snapshot_bytes(since)
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": _snapshot_etag(runtime.repository.epoch, version, since), "Cache-Control": "no-cache"},
+    )
 
 
 @router.get("/events/{event_id}/response")
@@ -24,20 +125,64 @@ def get_event_response(event_id: str, runtime: ApiRuntime = Depends(get_runtime)
     return response
 
 
+def _persist_event(runtime: ApiRuntime, payload: dict[str, Any]) -> None:
+    runtime.repository.append_event(payload)
+    runtime.stats.record_event(payload)
+    runtime.search_index.add_event(payload)
+
+
+def _persist_response(runtime: ApiRuntime, event_id: str, payload: dict[str, Any], latency_sec: float) -> None:
+    runtime.repository.append_response(event_id, payload)
+    runtime.stats.record_response(payload, latency_sec=latency_sec)
+    runtime.search_index.add_response(event_id, payload)
+
+
 @router.post("/events/danger", response_model=DangerEventAck)
-async def receive_danger_event(event: DangerEvent, runtime: ApiRuntime = Depends(get_runtime)) -> DangerEventAck:
+async def receive_danger_event(
+    event: DangerEvent,
+    http_response: Response,
+    runtime: ApiRuntime = Depends(get_runtime),
+) -> DangerEventAck:
+    # Every event is recorded and shown on the dashboard; throttling only limits the response pipeline.
     event_payload = event.model_dump(mode="json")
-    runtime.repository.append_event(event_payload)
+    # Log writes can block on a full write-behind queue or a disk write; keep them off the event loop.
+    await run_in_threadpool(_persist_event, runtime, event_payload)
+    runtime.broadcaster.publish("event", event_payload)
 
     if not event.is_danger:
         return DangerEventAck(status="ignored_non_danger", event_id=event.event_id)
 
-    response: DangerResponse = await runtime.pipeline.process(event)
-    ops_result = await runtime.ops_publisher.publish(event=event, response=response)
+    admission = runtime.admission.try_admit(event.source)
+    if not admission.admitted:
+        LOGGER.info(
+            "Danger event throttled. event_id=%s source=%s reason=%s retry_after=%.3fs",
+            event.event_id,
+            event.source,
+            admission.reason,
+            admission.retry_after_sec,
+        )
+        http_response.status_code = 429
+        http_response.headers["Retry-After"] = str(max(1, math.ceil(admission.retry_after_sec)))
+        return DangerEventAck(
+            status="throttled",
+            event_id=event.event_id,
+            retry_after_sec=admission.retry_after_sec,
+        )
+
+    with runtime.degradation.track():
+        async with runtime.admission.slot(event.source):
+            pipeline_started = time.perf_counter()
+            response: DangerResponse = await runtime.pipeline.process(event)
+            pipeline_latency_sec = time.perf_counter() - pipeline_started
+            ops_started = time.perf_counter()
+            ops_result = await runtime.ops_publisher.publish(event=event, response=response)
+            runtime.degradation.record("ops", time.perf_counter() - ops_started)
     LOGGER.info("MCP ops publish result. event_id=%s result=%s", event.event_id, ops_result)
 
     # Do not persist large inline WAV payloads in logs or admin polling responses.
     response_payload = response.model_dump(mode="json", exclude={"jetson_tts_wav_base64"})
-    runtime.repository.append_response(event.event_id, response_payload)
+    await run_in_threadpool(_persist_response, runtime, event.event_id, response_payload, pipeline_latency_sec)
+    runtime.broadcaster.publish("response", response_payload)
+    runtime.broadcaster.publish("ops", {"event_id": event.event_id, "result": ops_result})
 
     return DangerEventAck(status="accepted", event_id=event.event_id, response=response)
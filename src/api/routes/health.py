@@ -3,6 +3,7 @@ from typing import Any
 from fastapi import APIRouter, Depends
 
 from src.api.app_runtime import ApiRuntime
+from src.api.models import CameraHealthEvent
 from src.api.routes.deps import get_runtime
 
 router = APIRouter()
@@ -16,4 +17,18 @@ def health(runtime: ApiRuntime = Depends(get_runtime)) -> dict[str, Any]:
         "rag_mcp_enabled": config.rag_mcp_enabled,
         "llm_provider": config.llm_provider,
         "gemini_model": config.gemini_model,
+        "routing_enabled": config.routing_enabled,
+        "degradation": runtime.degradation.snapshot(),
+        "admission": runtime.admission.snapshot(),
+        "stream_subscribers": runtime.broadcaster.subscriber_count,
+        "cameras": runtime.camera_health,
     }
+
+
+@router.post("/health/cameras")
+def report_camera_health(event: CameraHealthEvent, runtime: ApiRuntime = Depends(get_runtime)) -> dict[str, Any]:
+    # Edges report feed problems (e.g. a frozen camera) here; the latest state per camera is kept.
+    payload = event.model_dump(mode="json")
+    runtime.camera_health[f"{event.source}/{event.camera_id}"] = payload
+    runtime.broadcaster.publish("camera_health", payload)
+    return {"status": "accepted"}
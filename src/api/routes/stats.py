@@ -0,0 +1,16 @@
+from typing import Any
+
+from fastapi import APIRouter, Depends, HTTPException
+
+from src.api.app_runtime import ApiRuntime
+from src.api.routes.deps import get_runtime
+
+router = APIRouter()
+
+
+@router.get("/stats")
+def get_stats(window: str = "24h", runtime: ApiRuntime = Depends(get_runtime)) -> dict[str, Any]:
+    try:
+        return runtime.stats.summary(window)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
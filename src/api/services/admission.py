@@ -0,0 +1,167 @@
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, AsyncIterator, Callable
+
+
+@dataclass
+class _TokenBucket:
+    tokens: float
+    updated_at: float
+
+
+@dataclass(frozen=True)
+class AdmissionDecision:
+    admitted: bool
+    retry_after_sec: float = 0.0
+    reason: str = "ok"
+
+
+class AdmissionController:
+    MAX_TRACKED_SOURCES = 4096
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        rate_per_sec: float = 0.5,
+        burst: int = 5,
+        max_concurrent: int = 4,
+        max_queue_per_source: int = 4,
+        source_weights: dict[str, float] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.enabled = enabled
+        self.rate_per_sec = max(0.001, float(rate_per_sec))
+        self.burst = max(1, int(burst))
+        self.max_concurrent = max(1, int(max_concurrent))
+        self.max_queue_per_source = max(0, int(max_queue_per_source))
+        self.source_weights = {key: max(0.01, float(value)) for key, value in (source_weights or {}).items()}
+        self.logger = logging.getLogger(__name__)
+        self._clock = clock
+        self._bucket_lock = Lock()
+        self._buckets: dict[str, _TokenBucket] = {}
+        self._throttled: dict[str, int] = {}
+
+        self._active = 0
+        self._virtual_time = 0.0
+        self._last_finish: dict[str, float] = {}
+        self._waiters: dict[str, deque[tuple[float, asyncio.Future[None]]]] = {}
+
+    def _weight(self, source: str) -> float:
+        return self.source_weights.get(source, 1.0)
+
+    def _prune_buckets(self, now: float) -> None:
+        if len(self._buckets) <= self.MAX_TRACKED_SOURCES:
+            return
+        # Idle sources whose bucket has refilled carry no state worth keeping.
+        for source, bucket in list(self._buckets.items()):
+            if bucket.tokens + (now - bucket.updated_at) * self.rate_per_sec >= self.burst:
+                del self._buckets[source]
+
+    def try_admit(self, source: str) -> AdmissionDecision:
+        if not self.enabled:
+            return AdmissionDecision(admitted=True)
+
+        now = self._clock()
+        with self._bucket_lock:
+            bucket = self._buckets.get(source)
+            if bucket is None:
+                self._prune_buckets(now)
+                bucket = _TokenBucket(tokens=float(self.burst), updated_at=now)
+                self._buckets[source] = bucket
+            else:
+                elapsed = max(0.0, now - bucket.updated_at)
+                bucket.tokens = min(float(self.burst), bucket.tokens + elapsed * self.rate_per_sec)
+                bucket.updated_at = now
+
+            if len(self._waiters.get(source, ())) >= self.max_queue_per_source and self._active >= self.max_concurrent:
+                self._throttled[source] = self._throttled.get(source, 0) + 1
+                return AdmissionDecision(
+                    admitted=False,
+                    retry_after_sec=round(1.0 / self.rate_per_sec, 3),
+                    reason="queue-full",
+                )
+
+            if bucket.tokens < 1.0:
+                self._throttled[source] = self._throttled.get(source, 0) + 1
+                retry_after = math.ceil((1.0 - bucket.tokens) / self.rate_per_sec * 1000) / 1000
+                return AdmissionDecision(admitted=False, retry_after_sec=retry_after, reason="rate-limited")
+
+            bucket.tokens -= 1.0
+            return AdmissionDecision(admitted=True)
+
+    async def _acquire(self, source: str) -> None:
+        if self._active < self.max_concurrent and not any(self._waiters.values()):
+            self._active += 1
+            return
+
+        # Start-time fair queueing: each waiter is tagged with a virtual finish
+        # time so a flooding source only delays its own backlog.
+        finish = max(self._virtual_time, self._last_finish.get(source, 0.0)) + 1.0 / self._weight(source)
+        self._last_finish[source] = finish
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(source, deque()).append((finish, future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            queue = self._waiters.get(source)
+            if queue is not None:
+                for item in list(queue):
+                    if item[1] is future:
+                        queue.remove(item)
+                        break
+                if not queue:
+                    self._waiters.pop(source, None)
+            if future.done() and not future.cancelled():
+                self._release()
+            raise
+
+    def _prune_finish_tags(self) -> None:
+        # A tag at or behind virtual time changes nothing for that source's next waiter.
+        for source, finish in list(self._last_finish.items()):
+            if finish <= self._virtual_time and source not in self._waiters:
+                del self._last_finish[source]
+
+    def _release(self) -> None:
+        candidates = [(queue[0][0], source) for source, queue in self._waiters.items() if queue]
+        if not candidates:
+            self._active -= 1
+            self._prune_finish_tags()
+            return
+
+        finish, source = min(candidates)
+        queue = self._waiters[source]
+        _, future = queue.popleft()
+        if not queue:
+            self._waiters.pop(source, None)
+        self._virtual_time = finish
+        self._prune_finish_tags()
+        # The slot is handed over directly, so the active count is unchanged.
+        future.set_result(None)
+
+    @asynccontextmanager
+    async def slot(self, source: str) -> AsyncIterator[None]:
+        if not self.enabled:
+            yield
+            return
+
+        await self._acquire(source)
+        try:
+            yield
+        finally:
+            self._release()
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._bucket_lock:
+            throttled = dict(self._throttled)
+        return {
+            "enabled": self.enabled,
+            "active": self._active,
+            "queued": sum(len(queue) for queue in self._waiters.values()),
+            "throttled_by_source": throttled,
+        }
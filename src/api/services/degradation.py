@@ -0,0 +1,162 @@
+import logging
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Callable, Iterator
+
+DEGRADATION_LEVELS: tuple[str, ...] = ("normal", "skip-tts", "local-rag", "template")
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+@dataclass(frozen=True)
+class DegradationPolicy:
+    level_name: str
+    skip_tts: bool
+    local_rag_only: bool
+    template_only: bool
+
+
+class DegradationController:
+    def __init__(
+        self,
+        enabled: bool = True,
+        latency_slo_sec: float = 8.0,
+        max_inflight: int = 8,
+        window_sec: float = 60.0,
+        min_samples: int = 5,
+        step_cooldown_sec: float = 15.0,
+        recover_ratio: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.enabled = enabled
+        self.latency_slo_sec = max(0.001, float(latency_slo_sec))
+        self.max_inflight = max(1, int(max_inflight))
+        self.window_sec = max(1.0, float(window_sec))
+        self.min_samples = max(1, int(min_samples))
+        self.step_cooldown_sec = max(0.0, float(step_cooldown_sec))
+        self.recover_ratio = min(1.0, max(0.0, float(recover_ratio)))
+        self.logger = logging.getLogger(__name__)
+        self._clock = clock
+        self._lock = Lock()
+        self._samples: dict[str, deque[tuple[float, float]]] = {}
+        self._inflight = 0
+        self._level = 0
+        self._last_change = float("-inf")
+        self._last_slow = float("-inf")
+
+    @property
+    def level(self) -> int:
+        return self._level if self.enabled else 0
+
+    @property
+    def level_name(self) -> str:
+        return DEGRADATION_LEVELS[self.level]
+
+    def policy(self) -> DegradationPolicy:
+        level = self.level
+        return DegradationPolicy(
+            level_name=DEGRADATION_LEVELS[level],
+            skip_tts=level >= 1,
+            local_rag_only=level >= 2,
+            template_only=level >= 3,
+        )
+
+    def _trim(self, samples: deque[tuple[float, float]], now: float) -> None:
+        while samples and now - samples[0][0] > self.window_sec:
+            samples.popleft()
+
+    def record(self, stage: str, seconds: float) -> None:
+        now = self._clock()
+        with self._lock:
+            samples = self._samples.setdefault(stage, deque(maxlen=512))
+            samples.append((now, max(0.0, float(seconds))))
+            self._trim(samples, now)
+            if stage == "total":
+                if seconds > self.latency_slo_sec * self.recover_ratio:
+                    self._last_slow = now
+                self._evaluate(now)
+
+    @contextmanager
+    def track(self) -> Iterator[None]:
+        with self._lock:
+            self._inflight += 1
+            self._evaluate(self._clock())
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._inflight -= 1
+            self.record("total", time.perf_counter() - started)
+
+    def _stage_p95(self, stage: str, now: float) -> tuple[float, int]:
+        samples = self._samples.get(stage)
+        if not samples:
+            return 0.0, 0
+        self._trim(samples, now)
+        values = [value for _, value in samples]
+        return _percentile(values, 0.95), len(values)
+
+    def _evaluate(self, now: float) -> None:
+        if not self.enabled:
+            return
+        if now - self._last_change < self.step_cooldown_sec:
+            return
+
+        p95, count = self._stage_p95("total", now)
+        latency_breached = count >= self.min_samples and p95 > self.latency_slo_sec
+        queue_breached = self._inflight > self.max_inflight
+
+        if (latency_breached or queue_breached) and self._level < len(DEGRADATION_LEVELS) - 1:
+            self._set_level(self._level + 1, now, f"p95={p95:.2f}s inflight={self._inflight}")
+            return
+
+        # Stepping back needs as much evidence as stepping down, or one cheap template reply would undo it.
+        # A window too thin to judge counts as recovered once a full window has passed with no slow reply,
+        # so low traffic after a burst does not hold the level forever.
+        if count >= self.min_samples:
+            latency_recovered = p95 <= self.latency_slo_sec * self.recover_ratio
+        else:
+            latency_recovered = now - max(self._last_change, self._last_slow) >= self.window_sec
+        queue_recovered = self._inflight <= self.max_inflight * self.recover_ratio
+        if latency_recovered and queue_recovered and self._level > 0:
+            self._set_level(self._level - 1, now, f"p95={p95:.2f}s inflight={self._inflight}")
+
+    def _set_level(self, level: int, now: float, reason: str) -> None:
+        self.logger.warning(
+            "Degradation level changed: %s -> %s (%s)",
+            DEGRADATION_LEVELS[self._level],
+            DEGRADATION_LEVELS[level],
+            reason,
+        )
+        self._level = level
+        self._last_change = now
+        # Judge the new level only on latencies observed while it was active.
+        self._samples.pop("total", None)
+
+    def snapshot(self) -> dict[str, Any]:
+        now = self._clock()
+        with self._lock:
+            self._evaluate(now)
+            stages = {}
+            for stage in sorted(self._samples):
+                p95, count = self._stage_p95(stage, now)
+                stages[stage] = {"p95_sec": round(p95, 4), "samples": count}
+            return {
+                "enabled": self.enabled,
+                "level": self.level,
+                "level_name": self.level_name,
+                "inflight": self._inflight,
+                "latency_slo_sec": self.latency_slo_sec,
+                "max_inflight": self.max_inflight,
+                "stages": stages,
+            }
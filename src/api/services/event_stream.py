@@ -0,0 +1,57 @@
+import asyncio
+import json
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class StreamMessage:
+    seq: int
+    kind: str
+    data: dict[str, Any]
+
+    def encode(self) -> str:
+        body = json.dumps(self.data, ensure_ascii=False, separators=(",", ":"))
+        return f"id: {self.seq}\nevent: {self.kind}\ndata: {body}\n\n"
+
+
+class EventBroadcaster:
+    def __init__(self, queue_max: int = 256, replay_max: int = 256) -> None:
+        self.queue_max = max(1, int(queue_max))
+        self.logger = logging.getLogger(__name__)
+        self._seq = 0
+        self._replay: deque[StreamMessage] = deque(maxlen=max(0, int(replay_max)))
+        self._subscribers: set[asyncio.Queue[StreamMessage]] = set()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def publish(self, kind: str, data: dict[str, Any]) -> StreamMessage:
+        self._seq += 1
+        message = StreamMessage(seq=self._seq, kind=kind, data=data)
+        self._replay.append(message)
+        for queue in list(self._subscribers):
+            if queue.full():
+                # A stalled dashboard loses its oldest delta rather than blocking ingest.
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    pass
+                self.logger.warning("Stream subscriber lagging. Dropped oldest message.")
+            queue.put_nowait(message)
+        return message
+
+    def subscribe(self, last_event_id: int | None = None) -> asyncio.Queue[StreamMessage]:
+        queue: asyncio.Queue[StreamMessage] = asyncio.Queue(maxsize=self.queue_max)
+        if last_event_id is not None:
+            for message in self._replay:
+                if message.seq > last_event_id and not queue.full():
+                    queue.put_nowait(message)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue[StreamMessage]) -> None:
+        self._subscribers.discard(queue)
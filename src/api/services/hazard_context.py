@@ -1,4 +1,4 @@
-from typing import Literal, cast
+from typing import Any, Literal, cast
 
 from src.api.models import DangerEvent, RAGReference
 
@@ -22,12 +22,18 @@ class HazardContextService:
     }
 
     def infer_hazard_hint(self, event: DangerEvent) -> HazardHint:
-        meta = event.metadata if isinstance(event.metadata, dict) else {}
+        return self._infer(event.metadata, event.summary)
+
+    def infer_hazard_hint_from_payload(self, payload: dict[str, Any]) -> HazardHint:
+        return self._infer(payload.get("metadata"), str(payload.get("summary") or ""))
+
+    def _infer(self, metadata: Any, summary: str) -> HazardHint:
+        meta = metadata if isinstance(metadata, dict) else {}
         scenario = str(meta.get("scenario", "")).strip().lower()
         if scenario in {"fire", "fall", "intrusion", "electrical"}:
             return cast(HazardHint, scenario)
 
-        summary = event.summary.lower()
+        summary = summary.lower()
         for hazard, keywords in self.HAZARD_KEYWORDS.items():
             if any(keyword in summary for keyword in keywords):
                 return cast(HazardHint, hazard)
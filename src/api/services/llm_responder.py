@@ -64,8 +64,17 @@ class LLMResponder:
         situation: str,
         references: list[RAGReference],
         hazard_hint: str | None = None,
+        model: str | None = None,
+        template_only: bool = False,
     ) -> tuple[str, str]:
         normalized_hint = self._normalize_hazard_hint(hazard_hint)
+        if template_only:
+            return self._fallback_response(
+                situation=situation,
+                references=references,
+                hazard_hint=normalized_hint,
+            )
+
         self._ensure_client()
         if self._client is None:
             return self._fallback_response(
@@ -105,7 +114,7 @@ class LLMResponder:
         try:
             response = await asyncio.to_thread(
                 self._client.models.generate_content,
-                model=self.config.gemini_model,
+                model=model or self.config.gemini_model,
                 contents=prompt,
                 config={
                     "response_mime_type": "application/json",
@@ -1,11 +1,15 @@
 import asyncio
+import logging
+import time
 
 from src.api.models import DangerEvent, DangerResponse, RAGReference
+from src.api.services.degradation import DegradationController
 from src.api.services.gemini_tts import GeminiTTSGenerator
 from src.api.services.hazard_context import HazardContextService, HazardHint
 from src.api.services.llm_responder import LLMResponder
 from src.api.services.local_rag import LocalRAGRetriever
 from src.api.services.mcp_rag import MCPRAGRetriever
+from src.api.services.routing import ResponseTierRouter
 
 
 class DangerProcessingPipeline:
@@ -17,6 +21,9 @@ class DangerProcessingPipeline:
         tts_generator: GeminiTTSGenerator,
         hazard_context: HazardContextService | None = None,
         mcp_timeout_sec: float = 2.0,
+        router: ResponseTierRouter | None = None,
+        fast_model: str | None = None,
+        degradation: DegradationController | None = None,
     ) -> None:
         self.mcp_retriever = mcp_retriever
         self.local_retriever = local_retriever
@@ -24,12 +31,29 @@ class DangerProcessingPipeline:
         self.tts_generator = tts_generator
         self.hazard_context = hazard_context or HazardContextService()
         self.mcp_timeout_sec = mcp_timeout_sec
+        self.router = router or ResponseTierRouter()
+        self.fast_model = fast_model
+        self.degradation = degradation or DegradationController(enabled=False)
+        self.logger = logging.getLogger(__name__)
+
+    def _retrieve_local(self, rag_query: str, hazard_hint: HazardHint, top_k: int) -> list[RAGReference]:
+        references = self.local_retriever.retrieve(rag_query)
+        return self.hazard_context.rerank_references(
+            references=references,
+            hazard_hint=hazard_hint,
+            top_k=top_k,
+        )
 
     async def _retrieve_references(
         self,
         rag_query: str,
         hazard_hint: HazardHint,
+        use_mcp: bool = True,
     ) -> tuple[list[RAGReference], str]:
+        top_k = int(getattr(self.local_retriever, "top_k", 3))
+        if not use_mcp:
+            return self._retrieve_local(rag_query, hazard_hint, top_k), "local"
+
         try:
             references = await asyncio.wait_for(
                 self.mcp_retriever.retrieve(rag_query),
@@ -38,7 +62,6 @@ class DangerProcessingPipeline:
         except Exception:
             references = []
 
-        top_k = int(getattr(self.local_retriever, "top_k", 3))
         references = self.hazard_context.rerank_references(
             references=references,
             hazard_hint=hazard_hint,
@@ -49,32 +72,56 @@ class DangerProcessingPipeline:
         if references:
             return references, rag_source
 
-        references = self.local_retriever.retrieve(rag_query)
-        references = self.hazard_context.rerank_references(
-            references=references,
-            hazard_hint=hazard_hint,
-            top_k=top_k,
-        )
-        return references, "local-fallback"
+        return self._retrieve_local(rag_query, hazard_hint, top_k), "local-fallback"
 
     async def process(self, event: DangerEvent) -> DangerResponse:
         hazard_hint = self.hazard_context.infer_hazard_hint(event)
         rag_query = self.hazard_context.build_rag_query(event.summary, hazard_hint)
-        refs, rag_source = await self._retrieve_references(rag_query, hazard_hint)
+        decision = self.router.route(event, hazard_hint)
+        tier = decision.tier
+        policy = self.degradation.policy()
+        if policy.template_only:
+            tier = "template"
+        self.logger.info(
+            "Response tier selected. event_id=%s tier=%s reason=%s degradation=%s",
+            event.event_id,
+            tier,
+            decision.reason,
+            policy.level_name,
+        )
+
+        started = time.perf_counter()
+        refs, rag_source = await self._retrieve_references(
+            rag_query,
+            hazard_hint,
+            use_mcp=tier != "template" and not policy.local_rag_only,
+        )
+        self.degradation.record("rag", time.perf_counter() - started)
 
+        started = time.perf_counter()
         operator_response, jetson_summary = await self.responder.build_response(
             situation=event.summary,
             references=refs,
             hazard_hint=hazard_hint,
+            model=self.fast_model if tier == "fast" else None,
+            template_only=tier == "template",
         )
-        jetson_tts_wav_base64 = await self.tts_generator.synthesize_wav_base64(jetson_summary)
+        self.degradation.record("llm", time.perf_counter() - started)
+
+        jetson_tts_wav_base64 = None
+        if tier == "full" and not policy.skip_tts:
+            started = time.perf_counter()
+            jetson_tts_wav_base64 = await self.tts_generator.synthesize_wav_base64(jetson_summary)
+            self.degradation.record("tts", time.perf_counter() - started)
 
         return DangerResponse(
             event_id=event.event_id,
             rag_source=rag_source,
-            llm_provider=self.responder.provider_name,
+            llm_provider="fallback-template" if tier == "template" else self.responder.provider_name,
             operator_response=operator_response,
             jetson_tts_summary=jetson_summary,
             jetson_tts_wav_base64=jetson_tts_wav_base64,
             references=refs,
+            response_tier=tier,
+            degradation_level=policy.level_name,
         )
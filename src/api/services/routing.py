@@ -0,0 +1,71 @@
+from dataclasses import dataclass
+from typing import Literal
+
+from src.api.models import DangerEvent
+from src.api.services.hazard_context import HazardHint
+
+ResponseTier = Literal["template", "fast", "full"]
+
+TIER_ORDER: tuple[ResponseTier, ...] = ("template", "fast", "full")
+
+
+@dataclass(frozen=True)
+class TierDecision:
+    tier: ResponseTier
+    reason: str
+
+
+class ResponseTierRouter:
+    HIGH_SEVERITY_HAZARDS: frozenset[str] = frozenset({"fire", "electrical"})
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        template_max_confidence: float = 0.6,
+        full_min_confidence: float = 0.85,
+        heuristic_max_tier: ResponseTier = "fast",
+    ) -> None:
+        self.enabled = enabled
+        self.template_max_confidence = template_max_confidence
+        self.full_min_confidence = full_min_confidence
+        self.heuristic_max_tier: ResponseTier = heuristic_max_tier if heuristic_max_tier in TIER_ORDER else "fast"
+
+    @staticmethod
+    def _provider(event: DangerEvent) -> str:
+        meta = event.metadata if isinstance(event.metadata, dict) else {}
+        return str(meta.get("provider", "")).strip().lower()
+
+    @staticmethod
+    def _cap(tier: ResponseTier, ceiling: ResponseTier) -> ResponseTier:
+        return TIER_ORDER[min(TIER_ORDER.index(tier), TIER_ORDER.index(ceiling))]
+
+    def route(self, event: DangerEvent, hazard_hint: HazardHint) -> TierDecision:
+        if not self.enabled:
+            return TierDecision(tier="full", reason="routing-disabled")
+
+        confidence = event.confidence
+        if confidence is None:
+            tier: ResponseTier = "fast"
+            reason = "confidence-missing"
+        elif confidence >= self.full_min_confidence:
+            tier = "full"
+            reason = "high-confidence"
+        elif confidence < self.template_max_confidence:
+            tier = "template"
+            reason = "low-confidence"
+        else:
+            tier = "fast"
+            reason = "mid-confidence"
+
+        # Severe hazards always get at least a model-written response.
+        if tier == "template" and hazard_hint in self.HIGH_SEVERITY_HAZARDS:
+            tier = "fast"
+            reason = f"{reason}+high-severity-hazard"
+
+        if self._provider(event) == "heuristic":
+            capped = self._cap(tier, self.heuristic_max_tier)
+            if capped != tier:
+                tier = capped
+                reason = f"{reason}+heuristic-provider"
+
+        return TierDecision(tier=tier, reason=reason)
@@ -1,9 +1,19 @@
 const POLL_MS = 3000;
+const HEALTH_POLL_MS = 15000;
+const STREAM_URL = "/events/stream";
+const RECENT_MAX = 100;
+const STATS_WINDOW = "24h";
 
 const state = {
   events: [],
   responsesByEventId: new Map(),
+  opsByEventId: new Map(),
+  snapshotVersion: null,
+  snapshotEpoch: null,
+  stats: null,
   selectedEventId: null,
+  pollTimer: null,
+  stream: null,
 };
 
 const els = {
@@ -21,6 +31,7 @@ const els = {
   detailSummary: document.getElementById("detail-summary"),
   detailOperator: document.getElementById("detail-operator"),
   detailTts: document.getElementById("detail-tts"),
+  detailOps: document.getElementById("detail-ops"),
   detailReferences: document.getElementById("detail-references"),
   refreshButton: document.getElementById("refresh-button"),
 };
@@ -43,6 +54,12 @@ function safeText(value, fallback = "-") {
   return String(value);
 }
 
+function ragTagClass(ragSource) {
+  if (ragSource === "mcp") return "mcp";
+  if (ragSource === "local-fallback" || ragSource === "local") return "fallback";
+  return "";
+}
+
 function updateServerStatus(ok, text) {
   els.serverStatusDot.classList.remove("ok", "fail");
   els.serverStatusDot.classList.add(ok ? "ok" : "fail");
@@ -69,13 +86,25 @@ function calcMetrics(events, responses) {
   };
 }
 
+function statsMetrics(stats) {
+  const mcpRatio = stats.rag_source_ratio?.mcp ?? 0;
+  const avg = stats.confidence?.avg;
+  return {
+    eventCount: stats.events,
+    responseCount: stats.responses,
+    avgConfidence: typeof avg === "number" ? avg.toFixed(2) : "0.00",
+    mcpRate: `${Math.round(mcpRatio * 100)}%`,
+  };
+}
+
 function renderMetrics(events, responses) {
-  const metrics = calcMetrics(events, responses);
+  // Server-side aggregates cover the whole window; the local recents are only a fallback.
+  const metrics = state.stats ? statsMetrics(state.stats) : calcMetrics(events, responses);
   els.metricEvents.textContent = metrics.eventCount;
   els.metricResponses.textContent = metrics.responseCount;
   els.metricMcpRate.textContent = metrics.mcpRate;
   els.metricConfidence.textContent = metrics.avgConfidence;
-  els.eventsMeta.textContent = `${metrics.eventCount}건`;
+  els.eventsMeta.textContent = `${events.length}건`;
 }
 
 function renderEventRows() {
@@ -93,7 +122,7 @@ function renderEventRows() {
     .map((event) => {
       const response = state.responsesByEventId.get(event.event_id);
       const rag = response?.rag_source ?? "-";
-      const ragClass = rag === "mcp" ? "mcp" : rag === "local-fallback" ? "fallback" : "";
+      const ragClass = ragTagClass(rag);
       const selectedClass = state.selectedEventId === event.event_id ? "selected" : "";
       return `
         <tr class="${selectedClass}" data-event-id="${event.event_id}">
@@ -135,6 +164,14 @@ function renderReferences(references) {
     .join("");
 }
 
+function formatOpsResult(result) {
+  // Only pushed over the stream, so events from before this page loaded have no ops result.
+  if (!result || typeof result !== "object") return "-";
+  if (typeof result.status === "string") return result.status;
+  const channels = Object.entries(result).map(([channel, outcome]) => `${channel}: ${safeText(outcome?.status)}`);
+  return channels.length > 0 ? channels.join(" · ") : "-";
+}
+
 function renderDetailPanel() {
   const selected = state.events.find((ev) => ev.event_id === state.selectedEventId);
   if (!selected) {
@@ -142,6 +179,7 @@ function renderDetailPanel() {
     els.detailSummary.textContent = "왼쪽 이벤트를 선택하면 상세가 표시됩니다.";
     els.detailOperator.textContent = "-";
     els.detailTts.textContent = "-";
+    els.detailOps.textContent = "-";
     els.detailRagSource.textContent = "-";
     renderReferences([]);
     return;
@@ -152,10 +190,11 @@ function renderDetailPanel() {
   els.detailSummary.textContent = safeText(selected.summary);
   els.detailOperator.textContent = safeText(response?.operator_response, "응답 생성 대기 중");
   els.detailTts.textContent = safeText(response?.jetson_tts_summary, "-");
+  els.detailOps.textContent = formatOpsResult(state.opsByEventId.get(selected.event_id));
   
   const ragSource = response?.rag_source || "pending";
   els.detailRagSource.textContent = ragSource;
-  els.detailRagSource.className = `tag ${ragSource === "mcp" ? "mcp" : ragSource === "local-fallback" ? "fallback" : ""}`;
+  els.detailRagSource.className = `tag ${ragTagClass(ragSource)}`;
 
   renderReferences(response?.references ?? []);
 }
@@ -187,34 +226,140 @@ async function loadHealth() {
   }
 }
 
-async function loadRecent() {
-  const res = await fetch("/events/recent");
-  if (!res.ok) throw new Error(`recent ${res.status}`);
-  const body = await res.json();
-  const events = Array.isArray(body.events) ? body.events : [];
-  const responses = Array.isArray(body.responses) ? body.responses : [];
-
-  state.events = events;
-  state.responsesByEventId.clear();
-  responses.forEach((item) => {
-    if (item?.event_id) {
-      state.responsesByEventId.set(item.event_id, item);
-    }
-  });
+async function loadStats() {
+  try {
+    const res = await fetch(`/stats?window=${STATS_WINDOW}`);
+    if (!res.ok) throw new Error(`stats ${res.status}`);
+    state.stats = await res.json();
+  } catch (_) {
+    state.stats = null;
+  }
+  renderMetrics(state.events, Array.from(state.responsesByEventId.values()));
+}
 
+function renderAll() {
+  const events = state.events;
   if (!state.selectedEventId && events.length > 0) {
     state.selectedEventId = events[0].event_id;
   } else if (state.selectedEventId && !events.find((ev) => ev.event_id === state.selectedEventId)) {
     state.selectedEventId = events[0]?.event_id ?? null;
   }
 
-  renderMetrics(events, responses);
+  renderMetrics(events, Array.from(state.responsesByEventId.values()));
   renderEventRows();
   renderDetailPanel();
 }
 
+function mergeEvents(events) {
+  const incoming = new Set(events.map((ev) => ev.event_id));
+  state.events = [...events, ...state.events.filter((ev) => !incoming.has(ev.event_id))].slice(0, RECENT_MAX);
+}
+
+function mergeResponses(responses) {
+  responses
+    .slice()
+    .reverse()
+    .forEach((item) => {
+      if (item?.event_id) {
+        state.responsesByEventId.delete(item.event_id);
+        state.responsesByEventId.set(item.event_id, item);
+      }
+    });
+  while (state.responsesByEventId.size > RECENT_MAX) {
+    state.responsesByEventId.delete(state.responsesByEventId.keys().next().value);
+  }
+}
+
+async function loadRecent(full = false) {
+  const useDelta = !full && state.snapshotVersion !== null;
+  const url = useDelta
+    ? `/events/recent?since=${state.snapshotVersion}&epoch=${encodeURIComponent(state.snapshotEpoch ?? "")}`
+    : "/events/recent";
+  const res = await fetch(url);
+  if (res.status === 304) return;
+  if (!res.ok) throw new Error(`recent ${res.status}`);
+  const body = await res.json();
+  const events = Array.isArray(body.events) ? body.events : [];
+  const responses = Array.isArray(body.responses) ? body.responses : [];
+
+  if (!body.delta) {
+    state.events = [];
+    state.responsesByEventId.clear();
+  }
+  mergeEvents(events);
+  mergeResponses(responses);
+  if (typeof body.version === "number") {
+    state.snapshotVersion = body.version;
+    state.snapshotEpoch = typeof body.epoch === "string" ? body.epoch : null;
+  }
+
+  renderAll();
+}
+
+function applyStreamEvent(event) {
+  if (!event?.event_id) return;
+  mergeEvents([event]);
+  renderAll();
+}
+
+function applyStreamResponse(response) {
+  if (!response?.event_id) return;
+  mergeResponses([response]);
+  renderAll();
+}
+
+function applyStreamOps(body) {
+  if (!body?.event_id) return;
+  state.opsByEventId.set(body.event_id, body.result);
+  if (state.opsByEventId.size > RECENT_MAX) {
+    state.opsByEventId.delete(state.opsByEventId.keys().next().value);
+  }
+  if (body.event_id === state.selectedEventId) renderDetailPanel();
+}
+
+function parseStreamData(message) {
+  try {
+    return JSON.parse(message.data);
+  } catch (_) {
+    return null;
+  }
+}
+
 async function refreshAll() {
-  await Promise.all([loadHealth(), loadRecent()]);
+  await Promise.all([loadHealth(), loadRecent(), loadStats()]);
+}
+
+function startPolling() {
+  if (state.pollTimer !== null) return;
+  state.pollTimer = window.setInterval(refreshAll, POLL_MS);
+}
+
+function stopPolling() {
+  if (state.pollTimer === null) return;
+  window.clearInterval(state.pollTimer);
+  state.pollTimer = null;
+}
+
+function connectStream() {
+  if (!window.EventSource) {
+    startPolling();
+    return;
+  }
+
+  const stream = new EventSource(STREAM_URL);
+  state.stream = stream;
+  stream.addEventListener("open", () => {
+    stopPolling();
+    // Resync once so deltas apply on top of a fresh snapshot.
+    loadRecent(true).catch(() => {});
+  });
+  stream.addEventListener("error", () => {
+    // EventSource keeps reconnecting on its own; poll until it succeeds.
+    startPolling();
+  });
+  stream.addEventListener("event", (message) => applyStreamEvent(parseStreamData(message)));
+  stream.addEventListener("response", (message) => applyStreamResponse(parseStreamData(message)));
+  stream.addEventListener("ops", (message) => applyStreamOps(parseStreamData(message)));
 }
 
 function setupActions() {
@@ -226,7 +371,9 @@ function setupActions() {
 async function boot() {
   setupActions();
   await refreshAll();
-  window.setInterval(refreshAll, POLL_MS);
+  connectStream();
+  window.setInterval(loadHealth, HEALTH_POLL_MS);
+  window.setInterval(loadStats, HEALTH_POLL_MS);
 }
 
 boot();
\ No newline at end of file
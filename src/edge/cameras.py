@@ -0,0 +1,452 @@
+import ctypes
+import gc
+import logging
+import multiprocessing
+import os
+import resource
+import signal
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import cv2
+import numpy as np
+
+from src.edge.capture_sources import CaptureSource, EncodedFrame, Frame, open_capture_source
+from src.edge.cascade import CascadeDetector, CascadeHit, probe_image
+from src.edge.frame_ring import SharedFrameRing
+
+
+@dataclass(frozen=True)
+class CameraSpec:
+    camera_id: str
+    source: int | str
+    min_interval_sec: float
+    max_interval_sec: float
+
+
+def parse_camera_sources(
+    raw: list[str] | None,
+    default_index: int,
+    min_interval_sec: float,
+    max_interval_sec: float,
+) -> list[CameraSpec]:
+    max_interval_sec = max_interval_sec if max_interval_sec > 0 else min_interval_sec * 3
+    max_interval_sec = max(min_interval_sec, max_interval_sec)
+    items = raw or [str(default_index)]
+    specs: list[CameraSpec] = []
+    for idx, item in enumerate(items):
+        camera_id, sep, source = item.partition("=")
+        if not sep:
+            camera_id, source = f"cam{idx}", item
+        source = source.strip()
+        specs.append(
+            CameraSpec(
+                camera_id=camera_id.strip() or f"cam{idx}",
+                source=int(source) if source.isdigit() else source,
+                min_interval_sec=min_interval_sec,
+                max_interval_sec=max_interval_sec,
+            )
+        )
+    return specs
+
+
+class MotionDetector:
+    CHECK_SEC = 0.5
+    SIZE = (32, 24)
+
+    def __init__(self, threshold: float = 8.0) -> None:
+        self.threshold = threshold
+        # Mean absolute difference of the last check; the adaptive sampler reads it as scene-change magnitude.
+        self.change = 0.0
+        self._reference: np.ndarray | None = None
+        self._checked = 0.0
+
+    def due(self, now: float) -> bool:
+        return now - self._checked >= self.CHECK_SEC
+
+    def update(self, frame: Frame, now: float) -> bool:
+        if not self.due(now):
+            return False
+        self._checked = now
+        pixels = frame.preview() if isinstance(frame, EncodedFrame) else frame
+        small = cv2.cvtColor(cv2.resize(pixels, self.SIZE, interpolation=cv2.INTER_AREA), cv2.COLOR_BGR2GRAY)
+        self.change = float(np.mean(cv2.absdiff(small, self._reference))) if self._reference is not None else 0.0
+        self._reference = small
+        return self.change >= self.threshold
+
+
+class FrameBufferPool:
+    # Decoded frames land in a few reusable arrays instead of a fresh full-resolution allocation per read.
+    def __init__(self, slots: int = 3) -> None:
+        self._buffers: list[np.ndarray | None] = [None] * max(2, slots)
+        self._next = 0
+        self.allocations = 0
+        self.reuses = 0
+        self.passthrough = 0
+
+    def retrieve(self, cap: CaptureSource, keep: tuple[Frame | None, ...] = ()) -> Frame | None:
+        # `keep` holds frames callers may still be looking at; none of them is decoded over.
+        slot = self._next
+        for _ in range(len(self._buffers)):
+            if self._buffers[slot] is None or not any(self._buffers[slot] is item for item in keep):
+                break
+            slot = (slot + 1) % len(self._buffers)
+        self._next = (slot + 1) % len(self._buffers)
+        buffer = self._buffers[slot]
+        ok, frame = cap.retrieve(image=buffer) if buffer is not None else cap.retrieve()
+        if not ok or frame is None:
+            return None
+        if isinstance(frame, EncodedFrame):
+            self.passthrough += 1
+            return frame
+        if frame is buffer:
+            self.reuses += 1
+        else:
+            self.allocations += 1
+            self._buffers[slot] = frame
+        return frame
+
+
+def process_memory_stats() -> dict[str, Any]:
+    stats: dict[str, Any] = {"rss_mb": None, "gc_collections": [item["collections"] for item in gc.get_stats()]}
+    try:
+        with open("/proc/self/statm", encoding="ascii") as handle:
+            stats["rss_mb"] = round(int(handle.read().split()[1]) * resource.getpagesize() / 1048576, 1)
+    except (OSError, IndexError, ValueError):
+        stats["rss_mb"] = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    return stats
+
+
+class CameraWorker:
+    def __init__(
+        self,
+        spec: CameraSpec,
+        motion_threshold: float = 8.0,
+        buffer_slots: int = 3,
+        cascade_fps: float = 0.0,
+    ) -> None:
+        self.spec = spec
+        self.logger = logging.getLogger(__name__)
+        self.last_motion = 0.0
+        self.scene_change = 0.0
+        self.last_cascade: CascadeHit | None = None
+        self.read_failures = 0
+        self._motion = MotionDetector(motion_threshold)
+        self._cascade = CascadeDetector(fps=cascade_fps) if cascade_fps > 0 else None
+        # One slot for the frame being decoded, one for the published frame, one for the frame handed out.
+        self._pool = FrameBufferPool(max(3, buffer_slots))
+        self._cap: CaptureSource | None = None
+        self._frame: Frame | None = None
+        self._handed_out: Frame | None = None
+        self._seq = 0
+        self._decoded_seq = 0
+        self._decoded = 0
+        self._decode_wanted = False
+        # _cap_lock serializes device access (grab/retrieve); _lock guards the published frame and counters.
+        # latest() never blocks on _cap_lock, so a stalled grab cannot hold up the inference loop.
+        self._cap_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._cap = open_capture_source(self.spec.source)
+        if not self._cap.isOpened():
+            raise RuntimeError(f"Failed to open camera id={self.spec.camera_id} source={self.spec.source}")
+        self._thread = threading.Thread(target=self._read_loop, name=f"camera:{self.spec.camera_id}", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+        if self._cap is not None:
+            self._cap.release()
+
+    @property
+    def latest_seq(self) -> int:
+        return self._seq
+
+    def latest(self) -> tuple[int, Frame | None]:
+        # Frames are decoded only when someone asks for them. The returned array is a pooled buffer
+        # that stays valid until the next call to latest(). While the reader is inside grab() the
+        # newest frame cannot be decoded here; the caller gets no frame for that seq and the reader
+        # decodes the next frame it grabs, which then shows up as a new latest_seq.
+        with self._lock:
+            if self._seq != self._decoded_seq:
+                self._decode_wanted = True
+        if self._cap_lock.acquire(blocking=False):
+            try:
+                if self._seq != self._decoded_seq:
+                    self._decode()
+            finally:
+                self._cap_lock.release()
+        with self._lock:
+            if self._seq != self._decoded_seq:
+                return self._seq, None
+            self._handed_out = self._frame
+            return self._decoded_seq, self._frame
+
+    def frame_stats(self) -> dict[str, Any]:
+        return {
+            "grabbed": self._seq,
+            "decoded": self._decoded,
+            "buffer_allocations": self._pool.allocations,
+            "buffer_reuses": self._pool.reuses,
+            "jpeg_passthrough": self._pool.passthrough,
+        }
+
+    def supervise(self) -> None:
+        return None
+
+    def _decode(self) -> Frame | None:
+        # Callers hold _cap_lock, so _seq still names the frame the device last grabbed.
+        assert self._cap is not None
+        with self._lock:
+            keep = (self._handed_out, self._frame)
+        frame = self._pool.retrieve(self._cap, keep=keep)
+        with self._lock:
+            # A failed retrieve leaves no usable frame for this seq; do not hand out the previous one under it.
+            self._frame = frame
+            self._decoded_seq = self._seq
+            self._decode_wanted = False
+            if frame is not None:
+                self._decoded += 1
+        return frame
+
+    def _read_loop(self) -> None:
+        # Keep draining the device so inference always sees the newest frame, not a buffered one.
+        # grab() skips the decode; only frames that the probes (motion, cascade) or inference need are retrieved.
+        assert self._cap is not None
+        while not self._stop.is_set():
+            frame: Frame | None = None
+            with self._cap_lock:
+                ok = self._cap.grab()
+                now = time.monotonic()
+                probes_due = self._motion.due(now) or (self._cascade is not None and self._cascade.due(now))
+                if ok:
+                    with self._lock:
+                        self._seq += 1
+                        wanted = self._decode_wanted
+                    if wanted or probes_due:
+                        frame = self._decode()
+            if not ok:
+                self.read_failures += 1
+                if self.read_failures == 1 or self.read_failures % 50 == 0:
+                    self.logger.warning(
+                        "Failed to read frame from camera. camera_id=%s failures=%s",
+                        self.spec.camera_id,
+                        self.read_failures,
+                    )
+                time.sleep(0.2)
+                continue
+            if frame is None or not probes_due:
+                continue
+            probe = probe_image(frame)
+            if self._motion.update(probe, now):
+                self.last_motion = now
+            self.scene_change = self._motion.change
+            if self._cascade is not None:
+                hit = self._cascade.update(probe, now)
+                if hit is not None:
+                    self.last_cascade = hit
+
+
+PR_SET_PDEATHSIG = 1
+
+
+def _die_with_parent() -> None:
+    # Linux only: have the kernel kill this process if the orchestrator is SIGKILLed or OOM-killed, so an
+    # orphan never keeps the camera device open. The kernel closes its descriptors; the parent reclaims the ring.
+    if not sys.platform.startswith("linux"):
+        return
+    try:
+        ctypes.CDLL(None, use_errno=True).prctl(PR_SET_PDEATHSIG, signal.SIGKILL)
+    except (OSError, AttributeError):
+        pass
+
+
+def _capture_process_main(
+    spec: CameraSpec,
+    name: str,
+    slots: int,
+    slot_bytes: int,
+    motion_threshold: float,
+    cascade_fps: float,
+    stop: "multiprocessing.synchronize.Event",
+    parent_pid: int,
+) -> None:
+    # The parent owns shutdown: ignore Ctrl-C here and treat SIGTERM as a request to stop.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, lambda _signum, _frame: stop.set())
+    _die_with_parent()
+    logger = logging.getLogger(__name__)
+    if os.getppid() != parent_pid:
+        # The parent died before the death signal was armed.
+        return
+    ring = SharedFrameRing(name, slots=slots, slot_bytes=slot_bytes, track=False)
+    cap = open_capture_source(spec.source)
+    motion = MotionDetector(motion_threshold)
+    cascade = CascadeDetector(fps=cascade_fps) if cascade_fps > 0 else None
+    buffer: np.ndarray | None = None
+    try:
+        if not cap.isOpened():
+            logger.error("Capture process failed to open camera. camera_id=%s source=%s", spec.camera_id, spec.source)
+            return
+        while not stop.is_set():
+            if os.getppid() != parent_pid:
+                # Reparented: the orchestrator is gone (also covers platforms without a parent-death signal).
+                logger.warning("Capture process orphaned; exiting. camera_id=%s", spec.camera_id)
+                break
+            # The ring copies the frame out, so a single reused decode buffer is enough here.
+            ok, frame = cap.read(image=buffer) if buffer is not None else cap.read()
+            if not ok:
+                failures = ring.add_read_failure()
+                if failures == 1 or failures % 50 == 0:
+                    logger.warning("Failed to read frame from camera. camera_id=%s failures=%s", spec.camera_id, failures)
+                ring.touch()
+                time.sleep(0.2)
+                continue
+            buffer = frame if isinstance(frame, np.ndarray) else None
+            ring.write(frame)
+            now = time.monotonic()
+            if not motion.due(now) and (cascade is None or not cascade.due(now)):
+                continue
+            probe = probe_image(frame)
+            if motion.update(probe, now):
+                ring.mark_motion(now)
+            ring.set_scene_change(motion.change)
+            hit = cascade.update(probe, now) if cascade is not None else None
+            if hit is not None:
+                ring.mark_cascade(hit)
+    finally:
+        cap.release()
+        ring.close()
+
+
+class ProcessCameraWorker:
+    # Same surface as CameraWorker, but capture and decode run in their own process and frames
+    # arrive through a shared-memory ring, so they never contend for the inference process's GIL.
+    RESTART_BACKOFF_MAX_SEC = 30.0
+
+    def __init__(
+        self,
+        spec: CameraSpec,
+        ring_name: str,
+        slots: int = 4,
+        slot_bytes: int = 1920 * 1080 * 3,
+        motion_threshold: float = 8.0,
+        stall_timeout_sec: float = 10.0,
+        cascade_fps: float = 0.0,
+    ) -> None:
+        self.spec = spec
+        self.ring_name = ring_name
+        self.slots = slots
+        self.slot_bytes = slot_bytes
+        self.motion_threshold = motion_threshold
+        self.stall_timeout_sec = stall_timeout_sec
+        self.cascade_fps = cascade_fps
+        self.logger = logging.getLogger(__name__)
+        self.restarts = 0
+        self._ctx = multiprocessing.get_context("spawn")
+        self._stop = self._ctx.Event()
+        self._process: multiprocessing.process.BaseProcess | None = None
+        self._ring: SharedFrameRing | None = None
+        self._restart_at = 0.0
+        self._backoff_sec = 1.0
+        self._started_at = 0.0
+
+    @property
+    def last_motion(self) -> float:
+        return self._ring.last_motion if self._ring is not None else 0.0
+
+    @property
+    def scene_change(self) -> float:
+        return self._ring.scene_change if self._ring is not None else 0.0
+
+    @property
+    def last_cascade(self) -> CascadeHit | None:
+        return self._ring.last_cascade if self._ring is not None else None
+
+    @property
+    def read_failures(self) -> int:
+        return self._ring.read_failures if self._ring is not None else 0
+
+    def start(self) -> None:
+        self._ring = SharedFrameRing(self.ring_name, slots=self.slots, slot_bytes=self.slot_bytes, create=True)
+        self._spawn()
+
+    def _spawn(self) -> None:
+        self._process = self._ctx.Process(
+            target=_capture_process_main,
+            args=(
+                self.spec,
+                self.ring_name,
+                self.slots,
+                self.slot_bytes,
+                self.motion_threshold,
+                self.cascade_fps,
+                self._stop,
+                os.getpid(),
+            ),
+            name=f"capture:{self.spec.camera_id}",
+            daemon=True,
+        )
+        self._process.start()
+        self._started_at = time.monotonic()
+
+    @property
+    def latest_seq(self) -> int:
+        return self._ring.latest_seq if self._ring is not None else 0
+
+    def latest(self) -> tuple[int, Frame | None]:
+        return self._ring.latest() if self._ring is not None else (0, None)
+
+    def frame_stats(self) -> dict[str, Any]:
+        return {"frames": self.latest_seq, "restarts": self.restarts}
+
+    def supervise(self) -> None:
+        if self._process is None or self._ring is None or self._stop.is_set():
+            return
+        now = time.monotonic()
+        stalled = (
+            self._process.is_alive()
+            and now - self._started_at > self.stall_timeout_sec
+            and self._ring.heartbeat_age_sec > self.stall_timeout_sec
+        )
+        if self._process.is_alive() and not stalled:
+            if now - self._started_at > self.RESTART_BACKOFF_MAX_SEC:
+                self._backoff_sec = 1.0
+            return
+        if self._restart_at == 0.0:
+            self.logger.warning(
+                "Capture process %s. camera_id=%s exitcode=%s restart_in=%.1fs",
+                "stalled" if stalled else "exited",
+                self.spec.camera_id,
+                self._process.exitcode,
+                self._backoff_sec,
+            )
+            if stalled:
+                self._process.terminate()
+            self._restart_at = now + self._backoff_sec
+            self._backoff_sec = min(self.RESTART_BACKOFF_MAX_SEC, self._backoff_sec * 2)
+            return
+        if now >= self._restart_at:
+            self._process.join(timeout=1.0)
+            self._restart_at = 0.0
+            self.restarts += 1
+            self._spawn()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._process is not None:
+            self._process.join(timeout=3.0)
+            if self._process.is_alive():
+                self._process.terminate()
+                self._process.join(timeout=1.0)
+        if self._ring is not None:
+            self._ring.close()
+            self._ring.unlink()
@@ -0,0 +1,231 @@
+import logging
+import re
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator
+
+import cv2
+import numpy as np
+import requests
+
+JPEG_SOI = b"\xff\xd8"
+
+
+class EncodedFrame:
+    # A JPEG exactly as the camera delivered it. The VLM gets these bytes untouched;
+    # pixels are decoded only when something local (motion, heuristics, mosaic) needs them.
+    __slots__ = ("jpeg", "_pixels")
+
+    def __init__(self, jpeg: bytes) -> None:
+        self.jpeg = jpeg
+        self._pixels: np.ndarray | None = None
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.jpeg)
+
+    def pixels(self) -> np.ndarray:
+        if self._pixels is None:
+            decoded = cv2.imdecode(np.frombuffer(self.jpeg, dtype=np.uint8), cv2.IMREAD_COLOR)
+            if decoded is None:
+                raise ValueError("Failed to decode JPEG frame.")
+            self._pixels = decoded
+        return self._pixels
+
+    def preview(self) -> np.ndarray:
+        # libjpeg can decode at 1/8 scale for a fraction of the cost of a full decode.
+        if self._pixels is not None:
+            return self._pixels
+        decoded = cv2.imdecode(np.frombuffer(self.jpeg, dtype=np.uint8), cv2.IMREAD_REDUCED_COLOR_8)
+        if decoded is None:
+            raise ValueError("Failed to decode JPEG frame.")
+        return decoded
+
+
+Frame = np.ndarray | EncodedFrame
+
+
+def as_pixels(frame: Frame) -> np.ndarray:
+    return frame.pixels() if isinstance(frame, EncodedFrame) else frame
+
+
+class PassthroughSource(ABC):
+    # Same grab/retrieve surface as cv2.VideoCapture, so workers and buffer pools treat both alike.
+    def __init__(self) -> None:
+        self.logger = logging.getLogger(__name__)
+        self._current: bytes | None = None
+
+    def isOpened(self) -> bool:  # noqa: N802 - mirrors cv2.VideoCapture
+        return True
+
+    def grab(self) -> bool:
+        # A failed grab keeps the last JPEG retrievable, unlike OpenCV, since the bytes are already in hand.
+        data = self._next_jpeg()
+        if data is None:
+            return False
+        self._current = data
+        return True
+
+    def retrieve(self, image: Any = None) -> tuple[bool, EncodedFrame | None]:
+        if self._current is None:
+            return False, None
+        return True, EncodedFrame(self._current)
+
+    def read(self, image: Any = None) -> tuple[bool, EncodedFrame | None]:
+        return self.retrieve() if self.grab() else (False, None)
+
+    def release(self) -> None:
+        return None
+
+    @abstractmethod
+    def _next_jpeg(self) -> bytes | None:
+        ...
+
+
+class JpegDirectorySource(PassthroughSource):
+    # Plays the JPEG files of a directory in name order, once, like a video file.
+    def __init__(self, path: str) -> None:
+        super().__init__()
+        self.path = Path(path)
+        self._files = sorted(
+            item for item in self.path.glob("*") if item.suffix.lower() in {".jpg", ".jpeg"} and item.is_file()
+        )
+        self._position = 0
+
+    def isOpened(self) -> bool:  # noqa: N802
+        return bool(self._files)
+
+    def _next_jpeg(self) -> bytes | None:
+        while self._position < len(self._files):
+            item = self._files[self._position]
+            self._position += 1
+            data = item.read_bytes()
+            if data.startswith(JPEG_SOI):
+                return data
+            self.logger.warning("Skipping non-JPEG file in capture directory. path=%s", item)
+        return None
+
+
+def iter_multipart_jpegs(stream: BinaryIO, boundary: bytes) -> Iterator[bytes]:
+    # Parses a multipart/x-mixed-replace body. Content-Length is used when the camera sends it;
+    # otherwise the part runs until the next boundary line.
+    delimiter = b"--" + boundary.lstrip(b"-")
+    line = stream.readline()
+    while line:
+        if not line.strip().startswith(delimiter):
+            line = stream.readline()
+            continue
+        headers: dict[bytes, bytes] = {}
+        while True:
+            line = stream.readline()
+            if not line or not line.strip():
+                break
+            key, _, value = line.partition(b":")
+            headers[key.strip().lower()] = value.strip()
+        if not line:
+            return
+        length = headers.get(b"content-length")
+        if length and length.isdigit():
+            body = stream.read(int(length))
+            line = stream.readline()
+        else:
+            chunks: list[bytes] = []
+            line = stream.readline()
+            while line and not line.strip().startswith(delimiter):
+                chunks.append(line)
+                line = stream.readline()
+            body = b"".join(chunks).removesuffix(b"\n").removesuffix(b"\r")
+        if body.startswith(JPEG_SOI):
+            yield body
+
+
+class HttpMjpegSource(PassthroughSource):
+    def __init__(self, url: str, timeout_sec: float = 10.0) -> None:
+        super().__init__()
+        self.url = url
+        self.timeout_sec = timeout_sec
+        self._response: requests.Response | None = None
+        self._parts: Iterator[bytes] | None = None
+        self._connect()
+
+    def isOpened(self) -> bool:  # noqa: N802
+        return self._parts is not None
+
+    def _connect(self) -> None:
+        try:
+            response = requests.get(self.url, stream=True, timeout=self.timeout_sec)
+            response.raise_for_status()
+        except requests.RequestException as exc:
+            self.logger.warning("Failed to open MJPEG stream. url=%s error=%s", self.url, exc)
+            self._response, self._parts = None, None
+            return
+        match = re.search(r"boundary=\"?([^\";]+)", response.headers.get("Content-Type", ""))
+        if match is None:
+            self.logger.warning("MJPEG stream has no multipart boundary. url=%s", self.url)
+            response.close()
+            self._response, self._parts = None, None
+            return
+        self._response = response
+        self._parts = iter_multipart_jpegs(response.raw, match.group(1).encode("latin-1"))
+
+    def _next_jpeg(self) -> bytes | None:
+        if self._parts is None:
+            self._connect()
+            if self._parts is None:
+                return None
+        try:
+            return next(self._parts)
+        except (StopIteration, requests.RequestException, OSError):
+            # Drop the connection; the next grab reconnects.
+            self.release()
+            return None
+
+    def release(self) -> None:
+        if self._response is not None:
+            self._response.close()
+        self._response, self._parts = None, None
+
+
+class V4l2MjpegSource:
+    # Asks the V4L2 backend for the camera's compressed MJPEG buffers instead of converted BGR frames.
+    def __init__(self, device: int | str) -> None:
+        self._cap = cv2.VideoCapture(device, cv2.CAP_V4L2)
+        self._cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+        self._cap.set(cv2.CAP_PROP_CONVERT_RGB, 0)
+
+    def isOpened(self) -> bool:  # noqa: N802
+        return bool(self._cap.isOpened())
+
+    def grab(self) -> bool:
+        return bool(self._cap.grab())
+
+    def retrieve(self, image: Any = None) -> tuple[bool, Frame | None]:
+        ok, raw = self._cap.retrieve()
+        if not ok or raw is None:
+            return False, None
+        if raw.ndim == 3:
+            # The driver ignored CONVERT_RGB=0 and decoded anyway; pass the pixels along.
+            return True, raw
+        return True, EncodedFrame(raw.tobytes())
+
+    def read(self, image: Any = None) -> tuple[bool, Frame | None]:
+        return self.retrieve() if self.grab() else (False, None)
+
+    def release(self) -> None:
+        self._cap.release()
+
+
+CaptureSource = cv2.VideoCapture | PassthroughSource | V4l2MjpegSource
+
+
+def open_capture_source(source: int | str) -> CaptureSource:
+    # "mjpeg:<url or device>" and "jpegdir:<path>" pass JPEG bytes through; anything else goes to OpenCV.
+    if isinstance(source, str):
+        scheme, sep, target = source.partition(":")
+        if sep and scheme == "jpegdir":
+            return JpegDirectorySource(target)
+        if sep and scheme == "mjpeg":
+            if target.startswith(("http://", "https://")):
+                return HttpMjpegSource(target)
+            return V4l2MjpegSource(int(target) if target.isdigit() else target)
+    return cv2.VideoCapture(source)
@@ -0,0 +1,123 @@
+from dataclasses import dataclass
+from typing import Any
+
+import cv2
+import numpy as np
+
+from src.edge.capture_sources import EncodedFrame, Frame
+
+CASCADE_REASONS = ("fire_color", "flicker", "flash", "haze")
+PROBE_SIZE = (160, 120)
+
+
+def probe_image(frame: Frame) -> np.ndarray:
+    # One small BGR copy per probe, shared by motion detection and the cascade.
+    pixels = frame.preview() if isinstance(frame, EncodedFrame) else frame
+    return cv2.resize(pixels, PROBE_SIZE, interpolation=cv2.INTER_AREA)
+
+
+@dataclass(frozen=True)
+class CascadeHit:
+    reason: str
+    tile: tuple[int, int]
+    score: float
+    at: float
+
+    def as_meta(self) -> dict[str, Any]:
+        return {"reason": self.reason, "tile": list(self.tile), "score": round(self.score, 3)}
+
+
+class CascadeDetector:
+    # Cheap per-frame screen that only decides whether the VLM should look right now.
+    # Every feature is computed per grid tile, so a hit also says roughly where.
+    WARMUP_UPDATES = 10
+    BASELINE_ALPHA = 0.05
+
+    def __init__(
+        self,
+        fps: float = 10.0,
+        grid: tuple[int, int] = (4, 4),
+        fire_fraction: float = 0.12,
+        flicker_fraction: float = 0.04,
+        flash_delta: float = 45.0,
+        haze_contrast_ratio: float = 0.45,
+        persist_updates: int = 2,
+        retrigger_sec: float = 5.0,
+    ) -> None:
+        self.interval_sec = 1.0 / fps if fps > 0 else 0.0
+        self.rows, self.cols = grid
+        self.fire_fraction = fire_fraction
+        self.flicker_fraction = flicker_fraction
+        self.flash_delta = flash_delta
+        self.haze_contrast_ratio = haze_contrast_ratio
+        self.persist_updates = max(1, persist_updates)
+        self.retrigger_sec = retrigger_sec
+        self.updates = 0
+        self.hits = 0
+        self._checked = float("-inf")
+        self._last_hit = float("-inf")
+        self._previous_fire: np.ndarray | None = None
+        self._tile_mean: np.ndarray | None = None
+        self._tile_std: np.ndarray | None = None
+        self._fire_base: np.ndarray | None = None
+        self._streak = np.zeros((len(CASCADE_REASONS), self.rows, self.cols), dtype=np.int32)
+
+    def due(self, now: float) -> bool:
+        # Small tolerance so a probe rate equal to the camera frame rate does not skip frames on jitter.
+        return now - self._checked >= self.interval_sec - 1e-6
+
+    def _tiles(self, plane: np.ndarray) -> np.ndarray:
+        height, width = plane.shape[:2]
+        th, tw = height // self.rows, width // self.cols
+        return plane[: th * self.rows, : tw * self.cols].reshape(self.rows, th, self.cols, tw)
+
+    def update(self, probe: np.ndarray, now: float) -> CascadeHit | None:
+        if not self.due(now):
+            return None
+        self._checked = now
+        self.updates += 1
+
+        bgr = probe.astype(np.int16)
+        blue, green, red = bgr[:, :, 0], bgr[:, :, 1], bgr[:, :, 2]
+        gray = cv2.cvtColor(probe, cv2.COLOR_BGR2GRAY).astype(np.float32)
+        # Flame-like pixels: bright, red-dominant, with green above blue (red through yellow).
+        fire = (red > 150) & (red > green + 25) & (green > blue)
+        tiles = self._tiles(gray)
+        tile_mean = tiles.mean(axis=(1, 3))
+        tile_std = tiles.std(axis=(1, 3))
+
+        scores = np.zeros((len(CASCADE_REASONS), self.rows, self.cols), dtype=np.float32)
+        fire_mass = self._tiles(fire).mean(axis=(1, 3))
+        if self._fire_base is not None:
+            # Only new flame-coloured mass counts, so a red machine or a safety vest does not fire forever.
+            scores[0] = (fire_mass - self._fire_base) / self.fire_fraction
+        if self._previous_fire is not None:
+            # Flames and sparks switch flame-coloured pixels on and off between frames; static red paint does not.
+            scores[1] = self._tiles(fire ^ self._previous_fire).mean(axis=(1, 3)) / self.flicker_fraction
+        if self._tile_mean is not None and self._tile_std is not None and self.updates > self.WARMUP_UPDATES:
+            scores[2] = np.abs(tile_mean - self._tile_mean) / self.flash_delta
+            # Smoke washes out texture: contrast collapses against the tile's own baseline.
+            scores[3] = np.where(
+                self._tile_std > 8.0,
+                (self.haze_contrast_ratio * self._tile_std) / np.maximum(tile_std, 1e-3),
+                0.0,
+            )
+        self._previous_fire = fire
+        if self._tile_mean is None or self._tile_std is None or self._fire_base is None:
+            self._tile_mean, self._tile_std, self._fire_base = tile_mean, tile_std, fire_mass
+        else:
+            self._tile_mean += self.BASELINE_ALPHA * (tile_mean - self._tile_mean)
+            self._tile_std += self.BASELINE_ALPHA * (tile_std - self._tile_std)
+            self._fire_base += self.BASELINE_ALPHA * (fire_mass - self._fire_base)
+
+        firing = scores >= 1.0
+        self._streak = np.where(firing, self._streak + 1, 0)
+        if now - self._last_hit < self.retrigger_sec:
+            return None
+        confirmed = np.where(self._streak >= self.persist_updates, scores, 0.0)
+        if not confirmed.any():
+            return None
+        reason_idx, row, col = np.unravel_index(int(np.argmax(confirmed)), confirmed.shape)
+        self._last_hit = now
+        self.hits += 1
+        return CascadeHit(CASCADE_REASONS[reason_idx], (int(row), int(col)), float(confirmed[reason_idx, row, col]), now)
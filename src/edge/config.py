@@ -5,10 +5,45 @@ from dataclasses import dataclass
 @dataclass
 class EdgeConfig:
     camera_index: int = 0
+    camera_sources: list[str] | None = None
     capture_interval_sec: int = 10
+    camera_max_interval_sec: float = 0.0
+    scheduler_boost_sec: float = 30.0
+    scheduler_stats_interval_sec: float = 60.0
+    sampling_mode: str = "fixed"
+    sampling_min_interval_sec: float = 2.0
+    sampling_max_interval_sec: float = 60.0
+    sampling_schedule: list[str] | None = None
+    sampling_danger_hold_sec: float = 60.0
+    sampling_idle_after_sec: float = 120.0
+    thermal_enabled: bool = True
+    thermal_sysfs_root: str = "/"
+    thermal_soft_temp_c: float = 75.0
+    thermal_hard_temp_c: float = 90.0
+    thermal_load_high: float = 0.9
+    thermal_max_slowdown: float = 3.0
+    thermal_poll_sec: float = 5.0
+    motion_threshold: float = 8.0
+    cascade_fps: float = 10.0
+    capture_mode: str = "thread"
+    capture_ring_slots: int = 4
+    capture_slot_bytes: int = 1920 * 1080 * 3
+    camera_zones_path: str | None = None
+    zone_mode: str = "composite"
     danger_cooldown_sec: int = 30
+    confirm_policy: str = "immediate"
+    confirm_k: int = 2
+    confirm_n: int = 3
+    confirm_window_sec: float = 20.0
+    confirm_burst_interval_sec: float = 1.0
     server_base_url: str = "http://127.0.0.1:8000"
     danger_endpoint: str = "/events/danger"
+    health_endpoint: str = "/health/cameras"
+    quality_gate_enabled: bool = True
+    quality_dark_max_fraction: float = 0.85
+    quality_bright_max_fraction: float = 0.5
+    quality_blur_ratio: float = 0.3
+    quality_frozen_after: int = 3
     source_id: str = "jetson-orin-nano-01"
     vlm_provider: str = "ollama"
     vlm_model: str = "gemma3:4b"
@@ -18,8 +53,26 @@ class EdgeConfig:
     vlm_use_heuristic_fallback: bool = True
     vlm_raw_log_enabled: bool = True
     vlm_raw_log_path: str = "data/edge/vlm_raw_responses.jsonl"
+    vlm_raw_log_rotate_max_bytes: int = 32 * 1024 * 1024
+    vlm_raw_log_compress: str = "gzip"
+    vlm_raw_log_retention_max_bytes: int = 256 * 1024 * 1024
+    vlm_raw_log_retention_max_age_sec: float = 0.0
+    vlm_raw_log_sample_safe: float = 0.05
+    vlm_raw_log_sample_danger: float = 1.0
+    vlm_raw_log_sample_error: float = 1.0
+    vlm_raw_log_include_metadata: bool = False
+    vlm_raw_log_queue_max: int = 256
+    vlm_mosaic_enabled: bool = False
+    vlm_mosaic_max_tiles: int = 4
+    vlm_mosaic_tile_width: int = 448
+    vlm_image_mode: str = "fixed"
+    vlm_image_max_side: int = 0
+    vlm_image_jpeg_quality: int = 85
+    vlm_image_min_side: int = 448
+    vlm_latency_budget_ms: float = 4000.0
     request_timeout_sec: int = 5
     request_retries: int = 2
+    request_throttle_max_backoff_sec: int = 300
     alert_duration_sec: int = 3
     led_gpio_pin: int = 17
     danger_led_pins: list[int] | None = None
@@ -47,15 +100,52 @@ class EdgeConfig:
         parsed_safe_led_pins = [int(item) for item in safe_led_pin_items] if safe_led_pin_items else None
         buzzer_pin_raw = (os.getenv("EDGE_BUZZER_GPIO_PIN", "") or "").strip()
         parsed_buzzer_pin = int(buzzer_pin_raw) if buzzer_pin_raw else None
+        camera_source_items = [item.strip() for item in os.getenv("EDGE_CAMERA_SOURCES", "").split(",") if item.strip()]
+        sampling_schedule_items = [item.strip() for item in os.getenv("EDGE_SAMPLING_SCHEDULE", "").split(",") if item.strip()]
         tts_speaker_raw = (os.getenv("EDGE_TTS_PIPER_SPEAKER_ID", "") or "").strip()
         parsed_tts_speaker = int(tts_speaker_raw) if tts_speaker_raw else None
 
         return cls(
             camera_index=int(os.getenv("EDGE_CAMERA_INDEX", "0")),
+            camera_sources=camera_source_items or None,
             capture_interval_sec=int(os.getenv("EDGE_CAPTURE_INTERVAL_SEC", "10")),
+            camera_max_interval_sec=float(os.getenv("EDGE_CAMERA_MAX_INTERVAL_SEC", "0")),
+            scheduler_boost_sec=float(os.getenv("EDGE_SCHEDULER_BOOST_SEC", "30")),
+            scheduler_stats_interval_sec=float(os.getenv("EDGE_SCHEDULER_STATS_INTERVAL_SEC", "60")),
+            sampling_mode=os.getenv("EDGE_SAMPLING_MODE", "fixed").strip().lower(),
+            sampling_min_interval_sec=float(os.getenv("EDGE_SAMPLING_MIN_INTERVAL_SEC", "2")),
+            sampling_max_interval_sec=float(os.getenv("EDGE_SAMPLING_MAX_INTERVAL_SEC", "60")),
+            sampling_schedule=sampling_schedule_items or None,
+            sampling_danger_hold_sec=float(os.getenv("EDGE_SAMPLING_DANGER_HOLD_SEC", "60")),
+            sampling_idle_after_sec=float(os.getenv("EDGE_SAMPLING_IDLE_AFTER_SEC", "120")),
+            thermal_enabled=os.getenv("EDGE_THERMAL_ENABLED", "true").lower() == "true",
+            thermal_sysfs_root=os.getenv("EDGE_THERMAL_SYSFS_ROOT", "/").strip() or "/",
+            thermal_soft_temp_c=float(os.getenv("EDGE_THERMAL_SOFT_TEMP_C", "75")),
+            thermal_hard_temp_c=float(os.getenv("EDGE_THERMAL_HARD_TEMP_C", "90")),
+            thermal_load_high=float(os.getenv("EDGE_THERMAL_LOAD_HIGH", "0.9")),
+            thermal_max_slowdown=float(os.getenv("EDGE_THERMAL_MAX_SLOWDOWN", "3.0")),
+            thermal_poll_sec=float(os.getenv("EDGE_THERMAL_POLL_SEC", "5")),
+            motion_threshold=float(os.getenv("EDGE_MOTION_THRESHOLD", "8.0")),
+            cascade_fps=float(os.getenv("EDGE_CASCADE_FPS", "10")),
+            capture_mode=os.getenv("EDGE_CAPTURE_MODE", "thread").strip().lower(),
+            capture_ring_slots=int(os.getenv("EDGE_CAPTURE_RING_SLOTS", "4")),
+            capture_slot_bytes=int(os.getenv("EDGE_CAPTURE_SLOT_BYTES", str(1920 * 1080 * 3))),
+            camera_zones_path=(os.getenv("EDGE_CAMERA_ZONES_PATH", "") or "").strip() or None,
+            zone_mode=os.getenv("EDGE_ZONE_MODE", "composite").strip().lower(),
             danger_cooldown_sec=int(os.getenv("EDGE_DANGER_COOLDOWN_SEC", "30")),
+            confirm_policy=os.getenv("EDGE_CONFIRM_POLICY", "immediate").strip().lower(),
+            confirm_k=int(os.getenv("EDGE_CONFIRM_K", "2")),
+            confirm_n=int(os.getenv("EDGE_CONFIRM_N", "3")),
+            confirm_window_sec=float(os.getenv("EDGE_CONFIRM_WINDOW_SEC", "20")),
+            confirm_burst_interval_sec=float(os.getenv("EDGE_CONFIRM_BURST_INTERVAL_SEC", "1.0")),
             server_base_url=os.getenv("EDGE_SERVER_BASE_URL", "http://127.0.0.1:8000"),
             danger_endpoint=os.getenv("EDGE_DANGER_ENDPOINT", "/events/danger"),
+            health_endpoint=os.getenv("EDGE_HEALTH_ENDPOINT", "/health/cameras"),
+            quality_gate_enabled=os.getenv("EDGE_QUALITY_GATE_ENABLED", "true").lower() == "true",
+            quality_dark_max_fraction=float(os.getenv("EDGE_QUALITY_DARK_MAX_FRACTION", "0.85")),
+            quality_bright_max_fraction=float(os.getenv("EDGE_QUALITY_BRIGHT_MAX_FRACTION", "0.5")),
+            quality_blur_ratio=float(os.getenv("EDGE_QUALITY_BLUR_RATIO", "0.3")),
+            quality_frozen_after=int(os.getenv("EDGE_QUALITY_FROZEN_AFTER", "3")),
             source_id=os.getenv("EDGE_SOURCE_ID", "jetson-orin-nano-01"),
             vlm_provider=os.getenv("EDGE_VLM_PROVIDER", "ollama").strip().lower(),
             vlm_model=os.getenv("EDGE_VLM_MODEL", "gemma3:4b").strip(),
@@ -65,8 +155,28 @@ class EdgeConfig:
             vlm_use_heuristic_fallback=os.getenv("EDGE_VLM_HEURISTIC_FALLBACK", "true").lower() == "true",
             vlm_raw_log_enabled=os.getenv("EDGE_VLM_RAW_LOG_ENABLED", "true").lower() == "true",
             vlm_raw_log_path=os.getenv("EDGE_VLM_RAW_LOG_PATH", "data/edge/vlm_raw_responses.jsonl").strip(),
+            vlm_raw_log_rotate_max_bytes=int(os.getenv("EDGE_VLM_RAW_LOG_ROTATE_MAX_BYTES", str(32 * 1024 * 1024))),
+            vlm_raw_log_compress=os.getenv("EDGE_VLM_RAW_LOG_COMPRESS", "gzip").strip().lower(),
+            vlm_raw_log_retention_max_bytes=int(
+                os.getenv("EDGE_VLM_RAW_LOG_RETENTION_MAX_BYTES", str(256 * 1024 * 1024))
+            ),
+            vlm_raw_log_retention_max_age_sec=float(os.getenv("EDGE_VLM_RAW_LOG_RETENTION_MAX_AGE_SEC", "0")),
+            vlm_raw_log_sample_safe=float(os.getenv("EDGE_VLM_RAW_LOG_SAMPLE_SAFE", "0.05")),
+            vlm_raw_log_sample_danger=float(os.getenv("EDGE_VLM_RAW_LOG_SAMPLE_DANGER", "1.0")),
+            vlm_raw_log_sample_error=float(os.getenv("EDGE_VLM_RAW_LOG_SAMPLE_ERROR", "1.0")),
+            vlm_raw_log_include_metadata=os.getenv("EDGE_VLM_RAW_LOG_INCLUDE_METADATA", "false").lower() == "true",
+            vlm_raw_log_queue_max=int(os.getenv("EDGE_VLM_RAW_LOG_QUEUE_MAX", "256")),
+            vlm_mosaic_enabled=os.getenv("EDGE_VLM_MOSAIC_ENABLED", "false").lower() == "true",
+            vlm_mosaic_max_tiles=int(os.getenv("EDGE_VLM_MOSAIC_MAX_TILES", "4")),
+            vlm_mosaic_tile_width=int(os.getenv("EDGE_VLM_MOSAIC_TILE_WIDTH", "448")),
+            vlm_image_mode=os.getenv("EDGE_VLM_IMAGE_MODE", "fixed").strip().lower(),
+            vlm_image_max_side=int(os.getenv("EDGE_VLM_IMAGE_MAX_SIDE", "0")),
+            vlm_image_jpeg_quality=int(os.getenv("EDGE_VLM_IMAGE_JPEG_QUALITY", "85")),
+            vlm_image_min_side=int(os.getenv("EDGE_VLM_IMAGE_MIN_SIDE", "448")),
+            vlm_latency_budget_ms=float(os.getenv("EDGE_VLM_LATENCY_BUDGET_MS", "4000")),
             request_timeout_sec=int(os.getenv("EDGE_REQUEST_TIMEOUT_SEC", "5")),
             request_retries=int(os.getenv("EDGE_REQUEST_RETRIES", "2")),
+            request_throttle_max_backoff_sec=int(os.getenv("EDGE_REQUEST_THROTTLE_MAX_BACKOFF_SEC", "300")),
             alert_duration_sec=int(os.getenv("EDGE_ALERT_DURATION_SEC", "3")),
             led_gpio_pin=int(os.getenv("EDGE_LED_GPIO_PIN", "17")),
             danger_led_pins=parsed_led_pins,
@@ -0,0 +1,122 @@
+import statistics
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+CONFIRM_POLICIES = ("immediate", "k_of_n", "local_first")
+
+
+@dataclass(frozen=True)
+class ConfirmDecision:
+    local_alert: bool
+    escalate: bool
+    pending: bool
+    votes: int
+    window: int
+
+    def as_meta(self, policy: str) -> dict[str, Any]:
+        return {"policy": policy, "votes": self.votes, "window": self.window, "confirmed": self.escalate}
+
+
+@dataclass
+class _Episode:
+    first_at: float
+    confirmed_at: float | None = None
+
+
+@dataclass
+class _TargetHistory:
+    verdicts: deque[tuple[float, bool]]
+    episode: _Episode | None = None
+
+
+@dataclass
+class _PolicyStats:
+    first_positives: int = 0
+    confirmed: int = 0
+    expired: int = 0
+    local_alerts: int = 0
+    confirm_latency_sec: list[float] = field(default_factory=list)
+
+
+class TemporalConfirmer:
+    # Decides when a DANGER verdict becomes an alert. "immediate" keeps the single-frame behaviour;
+    # "k_of_n" needs k DANGER verdicts among the last n inside window_sec before anything fires;
+    # "local_first" sounds the local alert on the first positive but escalates to the server only
+    # once the k-of-n vote confirms it. An episode that never confirms counts as a suppressed false positive.
+    LATENCY_SAMPLES = 200
+
+    def __init__(self, policy: str = "immediate", k: int = 2, n: int = 3, window_sec: float = 20.0) -> None:
+        if policy not in CONFIRM_POLICIES:
+            raise ValueError(f"Unsupported confirmation policy: {policy}")
+        self.policy = policy
+        self.n = max(1, n)
+        self.k = min(max(1, k), self.n)
+        self.window_sec = window_sec
+        self._targets: dict[str, _TargetHistory] = {}
+        self._stats = _PolicyStats()
+
+    def observe(self, key: str, is_danger: bool, now: float) -> ConfirmDecision:
+        target = self._targets.setdefault(key, _TargetHistory(deque(maxlen=self.n)))
+        target.verdicts.append((now, is_danger))
+        while target.verdicts and now - target.verdicts[0][0] > self.window_sec:
+            target.verdicts.popleft()
+        votes = sum(1 for _, danger in target.verdicts if danger)
+        self._close_stale_episode(target, now)
+
+        if is_danger and target.episode is None:
+            target.episode = _Episode(first_at=now)
+            self._stats.first_positives += 1
+        if self.policy == "immediate":
+            if is_danger:
+                self._confirm(target, now)
+            return ConfirmDecision(is_danger, is_danger, False, votes, len(target.verdicts))
+
+        confirmed = is_danger and votes >= self.k
+        if confirmed:
+            self._confirm(target, now)
+        # Keep sampling fast while an unconfirmed episode is open.
+        pending = target.episode is not None and target.episode.confirmed_at is None
+        local_alert = confirmed if self.policy == "k_of_n" else is_danger
+        if self.policy == "local_first" and is_danger and not confirmed:
+            self._stats.local_alerts += 1
+        return ConfirmDecision(local_alert, confirmed, pending, votes, len(target.verdicts))
+
+    def _confirm(self, target: _TargetHistory, now: float) -> None:
+        episode = target.episode
+        if episode is None or episode.confirmed_at is not None:
+            return
+        episode.confirmed_at = now
+        self._stats.confirmed += 1
+        self._stats.confirm_latency_sec.append(now - episode.first_at)
+        del self._stats.confirm_latency_sec[: -self.LATENCY_SAMPLES]
+
+    def _close_stale_episode(self, target: _TargetHistory, now: float) -> None:
+        episode = target.episode
+        if episode is None:
+            return
+        if episode.confirmed_at is None and now - episode.first_at > self.window_sec:
+            self._stats.expired += 1
+            target.episode = None
+        elif episode.confirmed_at is not None and not any(
+            danger and now - at <= self.window_sec for at, danger in target.verdicts
+        ):
+            target.episode = None
+
+    def sweep(self, now: float) -> None:
+        for target in self._targets.values():
+            self._close_stale_episode(target, now)
+
+    def stats(self) -> dict[str, Any]:
+        latencies = self._stats.confirm_latency_sec
+        return {
+            "policy": self.policy,
+            "k": self.k,
+            "n": self.n,
+            "first_positives": self._stats.first_positives,
+            "confirmed": self._stats.confirmed,
+            "suppressed_unconfirmed": self._stats.expired,
+            "local_only_alerts": self._stats.local_alerts,
+            "confirm_latency_ms_p50": round(statistics.median(latencies) * 1000.0, 1) if latencies else None,
+            "confirm_latency_ms_max": round(max(latencies) * 1000.0, 1) if latencies else None,
+        }
@@ -0,0 +1,196 @@
+import math
+import re
+import time
+from multiprocessing import resource_tracker, shared_memory
+
+import cv2
+import numpy as np
+
+from src.edge.capture_sources import EncodedFrame, Frame
+from src.edge.cascade import CASCADE_REASONS, CascadeHit
+
+# Header is a flat int64 array; per-slot records follow the fixed fields.
+_LATEST_SEQ = 0
+_LATEST_SLOT = 1
+_PIN = 2
+_MOTION_NS = 3
+_HEARTBEAT_NS = 4
+_READ_FAILURES = 5
+_CASCADE_NS = 6
+_CASCADE_INFO = 7  # reason index * 10000 + tile row * 100 + tile column
+_CASCADE_SCORE_MILLI = 8
+_SCENE_CHANGE_MILLI = 9
+_FIXED_FIELDS = 10
+_SLOT_FIELDS = 4  # seq, height, width, channels; channels == 0 marks a JPEG of `height` bytes
+_WRITING = -1
+
+
+def ring_name(*parts: str) -> str:
+    return "sentinel_" + "_".join(re.sub(r"[^A-Za-z0-9]+", "-", part) for part in parts)
+
+
+class SharedFrameRing:
+    # Single writer (a capture process), single reader (the inference process).
+    # The reader pins the slot it is looking at and the writer never overwrites the pinned or latest slot,
+    # so the reader can hand out zero-copy views instead of pickled copies.
+    def __init__(self, name: str, slots: int, slot_bytes: int, create: bool = False, track: bool = True) -> None:
+        if slots < 3:
+            raise ValueError("SharedFrameRing needs at least 3 slots.")
+        self.name = name
+        self.slots = slots
+        self.slot_bytes = int(slot_bytes)
+        header_len = _FIXED_FIELDS + slots * _SLOT_FIELDS
+        self._data_offset = math.ceil(header_len * 8 / 64) * 64
+        size = self._data_offset + slots * self.slot_bytes
+        if create:
+            self._unlink_stale(name)
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+            if not track:
+                # Attaching processes must not let their resource tracker unlink the creator's segment.
+                resource_tracker.unregister(self._shm._name, "shared_memory")  # type: ignore[attr-defined]
+        self._header = np.ndarray((header_len,), dtype=np.int64, buffer=self._shm.buf)
+        if create:
+            self._header[:] = 0
+            self._header[_PIN] = -1
+            self._header[_LATEST_SLOT] = -1
+        self._next_slot = 0
+
+    @staticmethod
+    def _unlink_stale(name: str) -> None:
+        # A crashed inference process leaves its segments behind; reclaim them on restart.
+        try:
+            stale = shared_memory.SharedMemory(name=name)
+        except FileNotFoundError:
+            return
+        stale.close()
+        stale.unlink()
+
+    def _slot_field(self, slot: int, field: int) -> int:
+        return _FIXED_FIELDS + slot * _SLOT_FIELDS + field
+
+    def _view(self, slot: int, shape: tuple[int, ...]) -> np.ndarray:
+        return np.ndarray(shape, dtype=np.uint8, buffer=self._shm.buf, offset=self._data_offset + slot * self.slot_bytes)
+
+    def write(self, frame: Frame) -> int:
+        if isinstance(frame, EncodedFrame):
+            if frame.nbytes <= self.slot_bytes:
+                return self._write_slot(np.frombuffer(frame.jpeg, dtype=np.uint8), (frame.nbytes, 0, 0))
+            frame = frame.pixels()
+        if frame.nbytes > self.slot_bytes:
+            scale = math.sqrt(self.slot_bytes / frame.nbytes)
+            size = (max(1, int(frame.shape[1] * scale)), max(1, int(frame.shape[0] * scale)))
+            frame = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+        frame = frame if frame.ndim == 3 else frame[:, :, None]
+        return self._write_slot(frame, frame.shape)
+
+    def _write_slot(self, data: np.ndarray, shape: tuple[int, int, int]) -> int:
+        header = self._header
+        for _ in range(self.slots):
+            slot = self._next_slot
+            self._next_slot = (self._next_slot + 1) % self.slots
+            if slot in (header[_LATEST_SLOT], header[_PIN]):
+                continue
+            seq_field = self._slot_field(slot, 0)
+            previous = header[seq_field]
+            header[seq_field] = _WRITING
+            if header[_PIN] == slot:
+                # The reader pinned this slot between our check and the mark; leave it alone.
+                header[seq_field] = previous
+                continue
+            self._view(slot, data.shape)[...] = data
+            header[self._slot_field(slot, 1) : self._slot_field(slot, 4)] = shape
+            seq = int(header[_LATEST_SEQ]) + 1
+            header[seq_field] = seq
+            header[_LATEST_SLOT] = slot
+            header[_LATEST_SEQ] = seq
+            header[_HEARTBEAT_NS] = time.monotonic_ns()
+            return seq
+        raise RuntimeError(f"No free slot in frame ring {self.name}.")
+
+    @property
+    def latest_seq(self) -> int:
+        return int(self._header[_LATEST_SEQ])
+
+    def latest(self) -> tuple[int, Frame | None]:
+        # The returned view stays valid until the next call to latest(). JPEG slots are copied out,
+        # which is cheap next to a raw frame.
+        header = self._header
+        for _ in range(3):
+            seq = int(header[_LATEST_SEQ])
+            slot = int(header[_LATEST_SLOT])
+            if seq == 0 or slot < 0:
+                return 0, None
+            header[_PIN] = slot
+            if header[self._slot_field(slot, 0)] == seq:
+                height, width, channels = (int(value) for value in header[self._slot_field(slot, 1) : self._slot_field(slot, 4)])
+                if channels == 0:
+                    return seq, EncodedFrame(self._view(slot, (height,)).tobytes())
+                return seq, self._view(slot, (height, width, channels))
+        return 0, None
+
+    @property
+    def last_motion(self) -> float:
+        return self._header[_MOTION_NS] / 1e9
+
+    def mark_motion(self, at: float) -> None:
+        self._header[_MOTION_NS] = int(at * 1e9)
+
+    @property
+    def scene_change(self) -> float:
+        return self._header[_SCENE_CHANGE_MILLI] / 1000.0
+
+    def set_scene_change(self, value: float) -> None:
+        self._header[_SCENE_CHANGE_MILLI] = int(value * 1000)
+
+    @property
+    def last_cascade(self) -> CascadeHit | None:
+        header = self._header
+        at_ns = int(header[_CASCADE_NS])
+        if at_ns == 0:
+            return None
+        reason, tile = divmod(int(header[_CASCADE_INFO]), 10000)
+        return CascadeHit(
+            CASCADE_REASONS[reason],
+            divmod(tile, 100),
+            int(header[_CASCADE_SCORE_MILLI]) / 1000.0,
+            at_ns / 1e9,
+        )
+
+    def mark_cascade(self, hit: CascadeHit) -> None:
+        header = self._header
+        header[_CASCADE_INFO] = CASCADE_REASONS.index(hit.reason) * 10000 + hit.tile[0] * 100 + hit.tile[1]
+        header[_CASCADE_SCORE_MILLI] = int(hit.score * 1000)
+        # Timestamp last: the reader treats a new timestamp as a new hit.
+        header[_CASCADE_NS] = int(hit.at * 1e9)
+
+    @property
+    def heartbeat_age_sec(self) -> float:
+        beat = int(self._header[_HEARTBEAT_NS])
+        return float("inf") if beat == 0 else (time.monotonic_ns() - beat) / 1e9
+
+    def touch(self) -> None:
+        self._header[_HEARTBEAT_NS] = time.monotonic_ns()
+
+    @property
+    def read_failures(self) -> int:
+        return int(self._header[_READ_FAILURES])
+
+    def add_read_failure(self) -> int:
+        self._header[_READ_FAILURES] += 1
+        return int(self._header[_READ_FAILURES])
+
+    def close(self) -> None:
+        self._header = np.zeros_like(self._header)
+        try:
+            self._shm.close()
+        except BufferError:
+            # A caller still holds a frame view; the mapping is released when it is collected.
+            pass
+
+    def unlink(self) -> None:
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
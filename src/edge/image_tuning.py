@@ -0,0 +1,207 @@
+import base64
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+import cv2
+
+from src.edge.capture_sources import EncodedFrame, Frame, as_pixels
+
+# Highest to lowest cost. max_side 0 keeps the camera resolution (and lets MJPEG frames pass through).
+IMAGE_LADDER: tuple[tuple[int, int], ...] = (
+    (0, 85),
+    (1280, 85),
+    (1024, 85),
+    (896, 80),
+    (768, 80),
+    (640, 75),
+    (512, 70),
+    (448, 65),
+    (384, 60),
+)
+
+
+@dataclass(frozen=True)
+class ImageSettings:
+    max_side: int
+    jpeg_quality: int
+
+
+@dataclass
+class _LevelStats:
+    latency_ms: float | None = None
+    prompt_eval_count: float | None = None
+    samples: int = 0
+
+
+def encode_image(frame: Frame, settings: ImageSettings) -> tuple[str, dict[str, Any]]:
+    if isinstance(frame, EncodedFrame) and settings.max_side <= 0:
+        # Native size requested and the camera already sent a JPEG: no decode, no re-encode.
+        return base64.b64encode(frame.jpeg).decode("ascii"), {
+            "max_side": 0,
+            "jpeg_quality": None,
+            "jpeg_bytes": frame.nbytes,
+            "passthrough": True,
+        }
+    pixels = as_pixels(frame)
+    height, width = pixels.shape[:2]
+    longest = max(height, width)
+    if 0 < settings.max_side < longest:
+        scale = settings.max_side / longest
+        pixels = cv2.resize(
+            pixels,
+            (max(1, round(width * scale)), max(1, round(height * scale))),
+            interpolation=cv2.INTER_AREA,
+        )
+    ok, encoded = cv2.imencode(".jpg", pixels, [int(cv2.IMWRITE_JPEG_QUALITY), settings.jpeg_quality])
+    if not ok:
+        raise RuntimeError("Failed to encode frame to JPEG.")
+    return base64.b64encode(encoded).decode("ascii"), {
+        "max_side": settings.max_side,
+        "jpeg_quality": settings.jpeg_quality,
+        "width": int(pixels.shape[1]),
+        "height": int(pixels.shape[0]),
+        "jpeg_bytes": int(encoded.size),
+    }
+
+
+class ImageController:
+    # "fixed" always sends the configured size/quality. "auto" walks IMAGE_LADDER so the classify call
+    # stays inside the latency budget: step down after repeated overruns, step up only when the next
+    # richer level has not itself been measured over budget.
+    EWMA_ALPHA = 0.3
+    STEP_DOWN_AFTER = 3
+    STEP_UP_AFTER = 10
+    HEADROOM = 0.7
+
+    def __init__(
+        self,
+        mode: str = "fixed",
+        max_side: int = 0,
+        jpeg_quality: int = 85,
+        latency_budget_ms: float = 4000.0,
+        min_side: int = 448,
+    ) -> None:
+        if mode not in {"fixed", "auto"}:
+            raise ValueError(f"Unsupported image mode: {mode}")
+        self.mode = mode
+        self.latency_budget_ms = max(1.0, float(latency_budget_ms))
+        self.logger = logging.getLogger(__name__)
+        self._fixed = ImageSettings(max(0, int(max_side)), min(100, max(10, int(jpeg_quality))))
+        # Auto mode never goes richer than the configured size, nor smaller than min_side.
+        self._levels = [
+            level
+            for level in IMAGE_LADDER
+            if (self._fixed.max_side <= 0 or 0 < level[0] <= self._fixed.max_side)
+            and (level[0] <= 0 or level[0] >= min_side)
+        ] or [(self._fixed.max_side, self._fixed.jpeg_quality)]
+        self._level = 0
+        self._stats = [_LevelStats() for _ in self._levels]
+        self._over = 0
+        self._under = 0
+        self.changes = 0
+        self.ceiling_side: int | None = None
+
+    @property
+    def settings(self) -> ImageSettings:
+        if self.mode == "fixed":
+            settings = self._fixed
+        else:
+            settings = ImageSettings(*self._levels[self._level])
+        if self.ceiling_side is None or 0 < settings.max_side <= self.ceiling_side:
+            return settings
+        ladder_quality = next((quality for side, quality in IMAGE_LADDER if 0 < side <= self.ceiling_side), settings.jpeg_quality)
+        return ImageSettings(self.ceiling_side, min(settings.jpeg_quality, ladder_quality))
+
+    def set_ceiling(self, max_side: int | None) -> None:
+        # External cap (e.g. thermal throttling) on top of the fixed or auto settings; None lifts it.
+        if max_side == self.ceiling_side:
+            return
+        previous = self.settings
+        self.ceiling_side = max_side if max_side is None or max_side > 0 else None
+        self.logger.info("VLM image ceiling changed: ceiling=%s from=%s to=%s", self.ceiling_side, previous, self.settings)
+
+    @property
+    def capped(self) -> bool:
+        if self.ceiling_side is None:
+            return False
+        level_side = self._fixed.max_side if self.mode == "fixed" else self._levels[self._level][0]
+        return level_side <= 0 or level_side > self.ceiling_side
+
+    def encode(self, frame: Frame) -> tuple[str, dict[str, Any]]:
+        encoded, meta = encode_image(frame, self.settings)
+        meta["mode"] = self.mode
+        if self.mode == "auto":
+            meta["level"] = self._level
+        if self.capped:
+            meta["ceiling"] = self.ceiling_side
+        return encoded, meta
+
+    def observe(self, total_duration_ns: Any, prompt_eval_count: Any = None, wall_sec: float | None = None) -> None:
+        # Latency measured under a ceiling belongs to the capped size, not to the current ladder level.
+        if self.mode != "auto" or self.capped:
+            return
+        if isinstance(total_duration_ns, (int, float)) and total_duration_ns > 0:
+            latency_ms = total_duration_ns / 1e6
+        elif wall_sec is not None:
+            latency_ms = wall_sec * 1000.0
+        else:
+            return
+        stats = self._stats[self._level]
+        stats.latency_ms = latency_ms if stats.latency_ms is None else (
+            self.EWMA_ALPHA * latency_ms + (1 - self.EWMA_ALPHA) * stats.latency_ms
+        )
+        if isinstance(prompt_eval_count, (int, float)):
+            stats.prompt_eval_count = prompt_eval_count if stats.prompt_eval_count is None else (
+                self.EWMA_ALPHA * prompt_eval_count + (1 - self.EWMA_ALPHA) * stats.prompt_eval_count
+            )
+        stats.samples += 1
+
+        if stats.latency_ms > self.latency_budget_ms:
+            self._over, self._under = self._over + 1, 0
+        elif stats.latency_ms < self.latency_budget_ms * self.HEADROOM:
+            self._over, self._under = 0, self._under + 1
+        else:
+            self._over, self._under = 0, 0
+
+        if self._over >= self.STEP_DOWN_AFTER and self._level < len(self._levels) - 1:
+            self._set_level(self._level + 1, "over-budget")
+        elif self._under >= self.STEP_UP_AFTER and self._level > 0:
+            richer = self._stats[self._level - 1]
+            if richer.latency_ms is None or richer.latency_ms <= self.latency_budget_ms:
+                self._set_level(self._level - 1, "under-budget")
+            else:
+                # The richer level was over budget last time; forget that sample so it is probed again
+                # after another quiet window (conditions such as clock throttling change over time).
+                richer.latency_ms = None
+                self._under = 0
+
+    def _set_level(self, level: int, reason: str) -> None:
+        previous = self.settings
+        self._level = level
+        self._over = self._under = 0
+        self.changes += 1
+        self.logger.info(
+            "VLM image settings changed: reason=%s from=%s to=%s budget_ms=%.0f",
+            reason,
+            previous,
+            self.settings,
+            self.latency_budget_ms,
+        )
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "settings": self.settings.__dict__,
+            "ceiling": self.ceiling_side,
+            "changes": self.changes,
+            "levels": {
+                f"{side or 'native'}@q{quality}": {
+                    "latency_ms": round(item.latency_ms, 1) if item.latency_ms is not None else None,
+                    "prompt_eval_count": round(item.prompt_eval_count, 1) if item.prompt_eval_count is not None else None,
+                    "samples": item.samples,
+                }
+                for (side, quality), item in zip(self._levels, self._stats)
+                if item.samples
+            },
+        }
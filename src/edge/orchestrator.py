@@ -1,18 +1,34 @@
 import base64
 import binascii
 import logging
+import math
 import signal
 import time
 import uuid
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any
 
-import cv2
-
 from src.edge.alerts import AlertController
+from src.edge.cameras import (
+    CameraSpec,
+    CameraWorker,
+    ProcessCameraWorker,
+    parse_camera_sources,
+    process_memory_stats,
+)
+from src.edge.capture_sources import Frame
+from src.edge.cascade import CascadeHit
 from src.edge.config import EdgeConfig
+from src.edge.confirmation import ConfirmDecision, TemporalConfirmer
+from src.edge.frame_ring import ring_name
+from src.edge.sampling import SAMPLING_MODES, AdaptiveSampler, parse_sampling_schedule
+from src.edge.scheduler import InferenceScheduler
 from src.edge.server_client import DangerEventClient
+from src.edge.thermal import SysfsLoadReader, ThermalGovernor, ThrottleState
+from src.edge.quality import FrameQualityGate, QualityVerdict
 from src.edge.vlm_client import VLMClient
+from src.edge.zones import ZONE_MODES, Zone, ZoneCropper, load_camera_zones
 
 
 def extract_tts_summary(ack: dict[str, Any]) -> str:
@@ -24,6 +40,10 @@ def extract_tts_summary(ack: dict[str, Any]) -> str:
     return ""
 
 
+def is_throttled_ack(ack: dict[str, Any]) -> bool:
+    return ack.get("status") == "throttled"
+
+
 def extract_tts_wav_bytes(ack: dict[str, Any]) -> bytes | None:
     response = ack.get("response")
     if not isinstance(response, dict):
@@ -46,11 +66,12 @@ def build_danger_payload(
     summary: str,
     confidence: float,
     infer_meta: dict[str, Any],
+    source: str | None = None,
 ) -> dict[str, Any]:
     return {
         "event_id": event_id,
         "timestamp": datetime.now(timezone.utc).isoformat(),
-        "source": cfg.source_id,
+        "source": source or cfg.source_id,
         "is_danger": True,
         "summary": summary,
         "confidence": confidence,
@@ -59,7 +80,41 @@ def build_danger_payload(
     }
 
 
+@dataclass
+class _LoopState:
+    workers: dict[str, Any]
+    scheduler: InferenceScheduler
+    sources: dict[str, str]
+    vlm_turns: int
+    last_stats_log: float
+    throttle: ThrottleState | None = None
+    # Cooldowns are kept per camera, or per zone for cameras with ROI zones. Local alerts and server
+    # escalations cool down separately so a local_first alert does not swallow the later escalation.
+    last_local: dict[str, float] = field(default_factory=dict)
+    last_escalated: dict[str, float] = field(default_factory=dict)
+    last_seq: dict[str, int] = field(default_factory=dict)
+    cascade_seen: dict[str, float] = field(default_factory=dict)
+    pending_cascade: dict[str, CascadeHit] = field(default_factory=dict)
+    # Cameras with an unconfirmed DANGER episode; like cascade hits, their frames skip the quality gate.
+    confirm_pending: set[str] = field(default_factory=set)
+    quality_retry_at: dict[str, float] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class _TargetVerdict:
+    key: str
+    camera_id: str
+    zone: Zone | None
+    is_danger: bool
+    summary: str
+    confidence: float
+    infer_meta: dict[str, Any]
+    decision: ConfirmDecision
+
+
 class EdgeOrchestrator:
+    QUALITY_RETRY_SEC = 1.0
+
     def __init__(
         self,
         cfg: EdgeConfig,
@@ -90,6 +145,7 @@ class EdgeOrchestrator:
             endpoint=cfg.danger_endpoint,
             timeout_sec=cfg.request_timeout_sec,
             retries=cfg.request_retries,
+            throttle_max_backoff_sec=cfg.request_throttle_max_backoff_sec,
         )
         self.vlm = vlm or VLMClient(
             provider=cfg.vlm_provider,
@@ -100,6 +156,68 @@ class EdgeOrchestrator:
             use_heuristic_fallback=cfg.vlm_use_heuristic_fallback,
             raw_log_enabled=cfg.vlm_raw_log_enabled,
             raw_log_path=cfg.vlm_raw_log_path,
+            raw_log_rotate_max_bytes=cfg.vlm_raw_log_rotate_max_bytes,
+            raw_log_compress=cfg.vlm_raw_log_compress,
+            raw_log_retention_max_bytes=cfg.vlm_raw_log_retention_max_bytes,
+            raw_log_retention_max_age_sec=cfg.vlm_raw_log_retention_max_age_sec,
+            raw_log_sample_safe=cfg.vlm_raw_log_sample_safe,
+            raw_log_sample_danger=cfg.vlm_raw_log_sample_danger,
+            raw_log_sample_error=cfg.vlm_raw_log_sample_error,
+            raw_log_include_metadata=cfg.vlm_raw_log_include_metadata,
+            raw_log_queue_max=cfg.vlm_raw_log_queue_max,
+            mosaic_tile_width=cfg.vlm_mosaic_tile_width,
+            image_mode=cfg.vlm_image_mode,
+            image_max_side=cfg.vlm_image_max_side,
+            image_jpeg_quality=cfg.vlm_image_jpeg_quality,
+            image_min_side=cfg.vlm_image_min_side,
+            latency_budget_ms=cfg.vlm_latency_budget_ms,
+        )
+        if cfg.zone_mode not in ZONE_MODES:
+            raise ValueError(f"Unsupported zone mode: {cfg.zone_mode}")
+        self.zones = load_camera_zones(cfg.camera_zones_path)
+        self.quality_gate = (
+            FrameQualityGate(
+                dark_max_fraction=cfg.quality_dark_max_fraction,
+                bright_max_fraction=cfg.quality_bright_max_fraction,
+                blur_ratio=cfg.quality_blur_ratio,
+                frozen_after=cfg.quality_frozen_after,
+            )
+            if cfg.quality_gate_enabled
+            else None
+        )
+        self.zone_cropper = ZoneCropper()
+        if cfg.sampling_mode not in SAMPLING_MODES:
+            raise ValueError(f"Unsupported sampling mode: {cfg.sampling_mode}")
+        self.sampler = (
+            AdaptiveSampler(
+                base_interval_sec=float(cfg.capture_interval_sec),
+                min_interval_sec=cfg.sampling_min_interval_sec,
+                max_interval_sec=cfg.sampling_max_interval_sec,
+                schedule=parse_sampling_schedule(cfg.sampling_schedule),
+                danger_hold_sec=cfg.sampling_danger_hold_sec,
+                idle_after_sec=cfg.sampling_idle_after_sec,
+                change_threshold=cfg.motion_threshold,
+            )
+            if cfg.sampling_mode == "adaptive"
+            else None
+        )
+        self.thermal = (
+            ThermalGovernor(
+                SysfsLoadReader(cfg.thermal_sysfs_root),
+                soft_temp_c=cfg.thermal_soft_temp_c,
+                hard_temp_c=cfg.thermal_hard_temp_c,
+                load_high=cfg.thermal_load_high,
+                max_slowdown=cfg.thermal_max_slowdown,
+                poll_sec=cfg.thermal_poll_sec,
+            )
+            if cfg.thermal_enabled
+            else None
+        )
+        self.confirmer = TemporalConfirmer(
+            policy=cfg.confirm_policy,
+            k=cfg.confirm_k,
+            n=cfg.confirm_n,
+            window_sec=cfg.confirm_window_sec,
         )
 
         self.logger.info(
@@ -113,13 +231,18 @@ class EdgeOrchestrator:
         )
 
     def run(self) -> None:
-        cap = cv2.VideoCapture(self.cfg.camera_index)
-        if not cap.isOpened():
-            raise RuntimeError(f"Failed to open camera index={self.cfg.camera_index}")
-
+        cameras = parse_camera_sources(
+            self.cfg.camera_sources,
+            default_index=self.cfg.camera_index,
+            min_interval_sec=float(self.cfg.capture_interval_sec),
+            max_interval_sec=self.cfg.camera_max_interval_sec,
+        )
+        workers = {spec.camera_id: self._build_worker(spec) for spec in cameras}
+        unknown_zone_cameras = sorted(set(self.zones) - set(workers))
+        if unknown_zone_cameras:
+            self.logger.warning("Zones configured for unknown cameras: %s", unknown_zone_cameras)
+        state = self._new_loop_state(cameras, workers)
         running = True
-        last_capture = 0.0
-        last_danger = 0.0
 
         def _shutdown_handler(signum: int, _frame: object) -> None:
             nonlocal running
@@ -130,86 +253,378 @@ class EdgeOrchestrator:
         signal.signal(signal.SIGTERM, _shutdown_handler)
 
         self.logger.info(
-            "Edge loop started: interval=%ss cooldown=%ss",
-            self.cfg.capture_interval_sec,
+            "Edge loop started: cameras=%s min_interval=%ss max_interval=%ss cooldown=%ss",
+            [f"{spec.camera_id}={spec.source}" for spec in cameras],
+            cameras[0].min_interval_sec,
+            cameras[0].max_interval_sec,
             self.cfg.danger_cooldown_sec,
         )
 
         try:
+            for worker in workers.values():
+                worker.start()
+
             while running:
-                ok, frame = cap.read()
-                now = time.monotonic()
-
-                if not ok:
-                    self.logger.warning("Failed to read frame from camera.")
-                    time.sleep(0.2)
-                    continue
-
-                if now - last_capture < self.cfg.capture_interval_sec:
-                    time.sleep(0.05)
-                    continue
-
-                last_capture = now
-                is_danger, summary, confidence, infer_meta = self.vlm.analyze_frame(frame)
-                self.logger.info(
-                    "Frame analyzed: is_danger=%s confidence=%.3f meta=%s",
-                    is_danger,
-                    confidence,
-                    infer_meta,
+                if not self._step(state):
+                    time.sleep(min(0.05, max(0.01, state.scheduler.next_due_in(time.monotonic()))))
+        finally:
+            for worker in workers.values():
+                worker.stop()
+            self.alerts.cleanup()
+            self.vlm.close()
+            self.logger.info("Scheduler throughput: %s", state.scheduler.stats())
+            self.logger.info("Danger confirmation: %s", self.confirmer.stats())
+            self._log_capture_stats(workers)
+            self.logger.info("Edge loop stopped cleanly.")
+
+    def _new_loop_state(self, cameras: list[CameraSpec], workers: dict[str, Any]) -> _LoopState:
+        # A single camera keeps the device-level source id; several cameras report as separate sources.
+        multi_camera = len(cameras) > 1
+        return _LoopState(
+            workers=workers,
+            scheduler=InferenceScheduler(cameras, boost_sec=self.cfg.scheduler_boost_sec),
+            sources={
+                spec.camera_id: f"{self.cfg.source_id}/{spec.camera_id}" if multi_camera else self.cfg.source_id
+                for spec in cameras
+            },
+            # Mosaic mode serves several cameras per VLM call, so fewer calls share the latency budget.
+            vlm_turns=(
+                math.ceil(len(cameras) / max(1, self.cfg.vlm_mosaic_max_tiles))
+                if self.cfg.vlm_mosaic_enabled
+                else len(cameras)
+            ),
+            last_stats_log=time.monotonic(),
+        )
+
+    def _step(self, state: _LoopState) -> bool:
+        # One pass of the edge loop; False means no camera was due and the caller should idle briefly.
+        now = time.monotonic()
+        self._refresh_cameras(state, now)
+        self._log_stats_if_due(state, now)
+        frames = self._select_batch(state, now)
+        if frames is None:
+            return False
+        batch, quality_warnings = self._gate_batch(
+            frames,
+            bypass=set(state.pending_cascade) | state.confirm_pending,
+            retry_at=state.quality_retry_at,
+            now=now,
+        )
+        if not batch:
+            return True
+        targets = self._inference_targets({camera_id: frames[camera_id] for camera_id in batch})
+        results = self._analyze_targets({key: image for key, (_, _, image) in targets.items()})
+        finished = time.monotonic()
+        verdicts = self._decide(state, batch, targets, results, quality_warnings, started=now, finished=finished)
+        self._dispatch(state, verdicts, now)
+        return True
+
+    def _refresh_cameras(self, state: _LoopState, now: float) -> None:
+        state.throttle = self.thermal.update(now) if self.thermal is not None else None
+        if state.throttle is not None:
+            self.vlm.image_controller.set_ceiling(state.throttle.image_max_side)
+        for camera_id, worker in state.workers.items():
+            worker.supervise()
+            if worker.last_motion:
+                state.scheduler.boost(camera_id, worker.last_motion)
+            hit = worker.last_cascade
+            if hit is not None and hit.at > state.cascade_seen.get(camera_id, 0.0):
+                state.cascade_seen[camera_id] = hit.at
+                state.pending_cascade[camera_id] = hit
+                state.scheduler.request_immediate(camera_id, hit.at)
+                self.logger.info("Cascade trigger: camera=%s hit=%s", camera_id, hit.as_meta())
+            interval: float | None = None
+            if self.sampler is not None:
+                self.sampler.observe_scene(camera_id, worker.scene_change, now)
+                interval = self.sampler.interval(camera_id, now, state.vlm_turns)
+            if state.throttle is not None and state.throttle.interval_scale > 1.0:
+                # Sampling a little slower beats VLM timeouts that fall back to the heuristic.
+                base = interval if interval is not None else worker.spec.min_interval_sec
+                interval = base * state.throttle.interval_scale
+            state.scheduler.set_interval(camera_id, interval)
+
+    def _log_stats_if_due(self, state: _LoopState, now: float) -> None:
+        if now - state.last_stats_log < self.cfg.scheduler_stats_interval_sec:
+            return
+        state.last_stats_log = now
+        self.logger.info("Scheduler throughput: %s", state.scheduler.stats(now))
+        self.logger.info("VLM image settings: %s", self.vlm.image_controller.stats())
+        if self.quality_gate is not None:
+            self.logger.info("Frame quality gate: %s", self.quality_gate.stats())
+        if self.sampler is not None:
+            self.logger.info("Adaptive sampling: %s", self.sampler.stats(now))
+        if self.thermal is not None:
+            self.logger.info("Thermal governor: %s", self.thermal.stats())
+        self.confirmer.sweep(now)
+        self.logger.info("Danger confirmation: %s", self.confirmer.stats())
+        self._log_capture_stats(state.workers)
+
+    def _select_batch(self, state: _LoopState, now: float) -> dict[str, Frame] | None:
+        # A stalled camera must not hold the shared VLM; only cameras with a fresh frame compete.
+        # Sequence numbers are cheap to read, so nothing is decoded until a camera is picked.
+        ready = {
+            camera_id
+            for camera_id, worker in state.workers.items()
+            if worker.latest_seq
+            and worker.latest_seq != state.last_seq.get(camera_id, 0)
+            and state.quality_retry_at.get(camera_id, 0.0) <= now
+        }
+        due = state.scheduler.due_cameras(now, ready=ready)
+        if not due:
+            return None
+        # Mosaic mode folds every due camera into one VLM call; otherwise one camera per call.
+        batch = due[: max(1, self.cfg.vlm_mosaic_max_tiles)] if self.cfg.vlm_mosaic_enabled else due[:1]
+        frames: dict[str, Frame] = {}
+        for camera_id in batch:
+            seq, frame = state.workers[camera_id].latest()
+            state.last_seq[camera_id] = seq
+            if frame is not None:
+                frames[camera_id] = frame
+        return frames
+
+    def _decide(
+        self,
+        state: _LoopState,
+        batch: list[str],
+        targets: dict[str, tuple[str, Zone | None, Frame]],
+        results: dict[str, tuple[bool, str, float, dict[str, Any]]],
+        quality_warnings: dict[str, tuple[str, ...]],
+        started: float,
+        finished: float,
+    ) -> list[_TargetVerdict]:
+        zone_verdicts: dict[str, dict[str, str]] = {}
+        for key, (camera_id, zone, _) in targets.items():
+            if zone is not None:
+                zone_verdicts.setdefault(camera_id, {})[zone.zone_id] = "DANGER" if results[key][0] else "SAFE"
+        for camera_id in batch:
+            camera_danger = any(results[key][0] for key, target in targets.items() if target[0] == camera_id)
+            state.scheduler.record(camera_id, latency_sec=finished - started, is_danger=camera_danger, now=finished)
+            if self.sampler is not None:
+                self.sampler.observe_verdict(camera_id, camera_danger, finished - started, finished)
+
+        triggers = {
+            camera_id: state.pending_cascade.pop(camera_id) for camera_id in batch if camera_id in state.pending_cascade
+        }
+        state.confirm_pending.difference_update(batch)
+        verdicts: list[_TargetVerdict] = []
+        for key, (camera_id, zone, _) in targets.items():
+            is_danger, summary, confidence, infer_meta = results[key]
+            infer_meta["camera_id"] = camera_id
+            if self.sampler is not None:
+                infer_meta["sampling"] = self.sampler.describe(camera_id)
+            if state.throttle is not None:
+                infer_meta["throttle"] = state.throttle.as_meta()
+            if quality_warnings.get(camera_id):
+                infer_meta["quality_warnings"] = list(quality_warnings[camera_id])
+            if camera_id in triggers:
+                infer_meta["trigger"] = "cascade"
+                infer_meta["cascade"] = {
+                    **triggers[camera_id].as_meta(),
+                    "to_verdict_ms": round((finished - triggers[camera_id].at) * 1000.0, 1),
+                }
+            if zone is not None:
+                infer_meta["zone_id"] = zone.zone_id
+                infer_meta["zone_verdicts"] = zone_verdicts[camera_id]
+                if zone.scenario:
+                    infer_meta["scenario"] = zone.scenario
+            decision = self.confirmer.observe(key, is_danger, finished)
+            if self.confirmer.policy != "immediate":
+                infer_meta["confirmation"] = decision.as_meta(self.confirmer.policy)
+            if decision.pending:
+                state.confirm_pending.add(camera_id)
+                # Sample the camera again soon so the vote settles in seconds, not sampling intervals.
+                state.scheduler.request_immediate(camera_id, finished + self.cfg.confirm_burst_interval_sec)
+            self.logger.info(
+                "Frame analyzed: camera=%s zone=%s is_danger=%s confidence=%.3f meta=%s",
+                camera_id,
+                zone.zone_id if zone is not None else "-",
+                is_danger,
+                confidence,
+                infer_meta,
+            )
+            verdicts.append(_TargetVerdict(key, camera_id, zone, is_danger, summary, confidence, infer_meta, decision))
+        return verdicts
+
+    def _dispatch(self, state: _LoopState, verdicts: list[_TargetVerdict], now: float) -> None:
+        for verdict in verdicts:
+            key, camera_id, zone, decision = verdict.key, verdict.camera_id, verdict.zone, verdict.decision
+            if not decision.local_alert and not decision.escalate:
+                if verdict.is_danger:
+                    self.logger.info("Danger awaiting confirmation. camera=%s target=%s", camera_id, key)
+                continue
+
+            cooldown_sec = (
+                zone.cooldown_sec if zone is not None and zone.cooldown_sec is not None else self.cfg.danger_cooldown_sec
+            )
+            local_alert = decision.local_alert and now - state.last_local.get(key, 0.0) >= cooldown_sec
+            escalate = decision.escalate and now - state.last_escalated.get(key, 0.0) >= cooldown_sec
+            if local_alert:
+                state.last_local[key] = now
+            if escalate:
+                state.last_escalated[key] = now
+                self._handle_danger(
+                    verdict.summary,
+                    verdict.confidence,
+                    verdict.infer_meta,
+                    state.sources[camera_id],
+                    trigger_local=local_alert,
                 )
+            elif local_alert:
+                self.logger.info("Local alert before confirmation. camera=%s target=%s", camera_id, key)
+                self.alerts.trigger_danger(duration_sec=self.cfg.alert_duration_sec)
+            else:
+                self.logger.info("Danger detected but skipped by cooldown. camera=%s target=%s", camera_id, key)
+
+    def _log_capture_stats(self, workers: dict[str, CameraWorker | ProcessCameraWorker]) -> None:
+        self.logger.info(
+            "Capture buffers: %s memory=%s",
+            {camera_id: worker.frame_stats() for camera_id, worker in workers.items()},
+            process_memory_stats(),
+        )
+
+    def _gate_batch(
+        self,
+        frames: dict[str, Frame],
+        bypass: set[str],
+        retry_at: dict[str, float],
+        now: float,
+    ) -> tuple[list[str], dict[str, tuple[str, ...]]]:
+        if self.quality_gate is None:
+            return list(frames), {}
+        passed: list[str] = []
+        warnings: dict[str, tuple[str, ...]] = {}
+        for camera_id, frame in frames.items():
+            verdict = self._check_quality(camera_id, frame)
+            # A cascade hit or an open confirmation asked the VLM to look at exactly this scene, so even a dark
+            # frame goes. A frozen one never does: it repeats a frame already judged, and the confirmation vote
+            # would count every copy as fresh evidence. It abstains until the feed moves again.
+            if verdict.ok or (camera_id in bypass and verdict.reason != "frozen"):
+                passed.append(camera_id)
+                warnings[camera_id] = verdict.warnings if verdict.ok else (verdict.reason or "",)
+            else:
+                # Try a later frame soon rather than waiting a full sampling interval.
+                retry_at[camera_id] = now + self.QUALITY_RETRY_SEC
+        return passed, warnings
+
+    def _check_quality(self, camera_id: str, frame: Frame) -> QualityVerdict:
+        assert self.quality_gate is not None
+        verdict = self.quality_gate.check(camera_id, frame)
+        if not verdict.ok:
+            self.logger.info(
+                "Frame rejected by quality gate. camera=%s reason=%s metrics=%s",
+                camera_id,
+                verdict.reason,
+                verdict.metrics,
+            )
+        change = self.quality_gate.health_change(camera_id)
+        if change is not None:
+            self.logger.warning("Camera health changed. camera=%s status=%s metrics=%s", camera_id, change, verdict.metrics)
+            self.client.send_health(
+                self.cfg.health_endpoint,
+                {
+                    "source": self.cfg.source_id,
+                    "camera_id": camera_id,
+                    "status": change,
+                    "reason": "frozen" if change == "degraded" else None,
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "metrics": verdict.metrics,
+                },
+            )
+        return verdict
+
+    def _inference_targets(self, frames: dict[str, Frame]) -> dict[str, tuple[str, Zone | None, Frame]]:
+        targets: dict[str, tuple[str, Zone | None, Frame]] = {}
+        for camera_id, frame in frames.items():
+            zones = self.zones.get(camera_id)
+            if not zones:
+                targets[camera_id] = (camera_id, None, frame)
+                continue
+            for zone in zones:
+                targets[f"{camera_id}:{zone.zone_id}"] = (camera_id, zone, self.zone_cropper.crop(frame, zone))
+        return targets
 
-                if not is_danger:
-                    continue
-
-                if now - last_danger < self.cfg.danger_cooldown_sec:
-                    self.logger.info("Danger detected but skipped by cooldown.")
-                    continue
-
-                last_danger = now
-                event_id = f"evt_{uuid.uuid4().hex[:12]}"
-                payload = build_danger_payload(
-                    cfg=self.cfg,
-                    event_id=event_id,
-                    summary=summary,
-                    confidence=confidence,
-                    infer_meta=infer_meta,
+    def _analyze_targets(self, images: dict[str, Frame]) -> dict[str, tuple[bool, str, float, dict[str, Any]]]:
+        # Mosaic mode, or several zone crops in composite mode, share VLM calls of at most
+        # vlm_mosaic_max_tiles tiles each; beyond that the tiles get too small to read.
+        if len(images) < 2 or not (self.cfg.vlm_mosaic_enabled or self.cfg.zone_mode == "composite"):
+            return {key: self.vlm.analyze_frame(image) for key, image in images.items()}
+        keys = list(images)
+        size = max(1, self.cfg.vlm_mosaic_max_tiles)
+        results: dict[str, tuple[bool, str, float, dict[str, Any]]] = {}
+        for start in range(0, len(keys), size):
+            results.update(self.vlm.analyze_mosaic({key: images[key] for key in keys[start : start + size]}))
+        return results
+
+    def _build_worker(self, spec: CameraSpec) -> CameraWorker | ProcessCameraWorker:
+        if self.cfg.capture_mode == "process":
+            return ProcessCameraWorker(
+                spec,
+                ring_name=ring_name(self.cfg.source_id, spec.camera_id),
+                slots=self.cfg.capture_ring_slots,
+                slot_bytes=self.cfg.capture_slot_bytes,
+                motion_threshold=self.cfg.motion_threshold,
+                cascade_fps=self.cfg.cascade_fps,
+            )
+        return CameraWorker(spec, motion_threshold=self.cfg.motion_threshold, cascade_fps=self.cfg.cascade_fps)
+
+    def _handle_danger(
+        self,
+        summary: str,
+        confidence: float,
+        infer_meta: dict[str, Any],
+        source: str,
+        trigger_local: bool = True,
+    ) -> None:
+        event_id = f"evt_{uuid.uuid4().hex[:12]}"
+        payload = build_danger_payload(
+            cfg=self.cfg,
+            event_id=event_id,
+            summary=summary,
+            confidence=confidence,
+            infer_meta=infer_meta,
+            source=source,
+        )
+
+        # Under local_first the siren already sounded on the first positive.
+        if trigger_local:
+            self.alerts.trigger_danger(duration_sec=self.cfg.alert_duration_sec)
+        ack = self.client.send(payload)
+        if ack is None or is_throttled_ack(ack):
+            if ack is None:
+                self.logger.error("Server send failed. event_id=%s payload=%s", event_id, payload)
+            else:
+                self.logger.warning(
+                    "Server throttled this source. Local alert only. event_id=%s retry_after=%s",
+                    event_id,
+                    ack.get("retry_after_sec"),
                 )
+            if self.cfg.server_wav_only:
+                self.logger.warning("EDGE_SERVER_WAV_ONLY=true. Skip text TTS fallback. event_id=%s", event_id)
+                return
+            if self.cfg.tts_use_event_summary_fallback:
+                self.alerts.speak(summary)
+            return
 
-                self.alerts.trigger_danger(duration_sec=self.cfg.alert_duration_sec)
-                ack = self.client.send(payload)
-                if ack is None:
-                    self.logger.error("Server send failed. event_id=%s payload=%s", event_id, payload)
-                    if self.cfg.server_wav_only:
-                        self.logger.warning("EDGE_SERVER_WAV_ONLY=true. Skip text TTS fallback. event_id=%s", event_id)
-                        continue
-                    if self.cfg.tts_use_event_summary_fallback:
-                        self.alerts.speak(summary)
-                    continue
-
-                server_wav = extract_tts_wav_bytes(ack)
-                if server_wav:
-                    if self.alerts.play_wav_bytes(server_wav):
-                        continue
-                    self.logger.warning("Server WAV playback failed. Falling back to text TTS. event_id=%s", event_id)
-                    if self.cfg.server_wav_only:
-                        self.logger.warning("EDGE_SERVER_WAV_ONLY=true. Skip text TTS fallback. event_id=%s", event_id)
-                        continue
-                elif self.cfg.server_wav_only:
-                    self.logger.warning(
-                        "Server ACK had no WAV. EDGE_SERVER_WAV_ONLY=true so text TTS is skipped. event_id=%s",
-                        event_id,
-                    )
-                    continue
-
-                tts_summary = extract_tts_summary(ack)
-                if not tts_summary and self.cfg.tts_use_event_summary_fallback:
-                    tts_summary = summary
-
-                if tts_summary:
-                    self.alerts.speak(tts_summary)
-                else:
-                    self.logger.info("No TTS summary returned by server. event_id=%s", event_id)
-        finally:
-            self.alerts.cleanup()
-            cap.release()
-            self.logger.info("Edge loop stopped cleanly.")
+        server_wav = extract_tts_wav_bytes(ack)
+        if server_wav:
+            if self.alerts.play_wav_bytes(server_wav):
+                return
+            self.logger.warning("Server WAV playback failed. Falling back to text TTS. event_id=%s", event_id)
+            if self.cfg.server_wav_only:
+                self.logger.warning("EDGE_SERVER_WAV_ONLY=true. Skip text TTS fallback. event_id=%s", event_id)
+                return
+        elif self.cfg.server_wav_only:
+            self.logger.warning(
+                "Server ACK had no WAV. EDGE_SERVER_WAV_ONLY=true so text TTS is skipped. event_id=%s",
+                event_id,
+            )
+            return
+
+        tts_summary = extract_tts_summary(ack)
+        if not tts_summary and self.cfg.tts_use_event_summary_fallback:
+            tts_summary = summary
+
+        if tts_summary:
+            self.alerts.speak(tts_summary)
+        else:
+            self.logger.info("No TTS summary returned by server. event_id=%s", event_id)
@@ -0,0 +1,131 @@
+import hashlib
+from dataclasses import dataclass, field
+from typing import Any
+
+import cv2
+import numpy as np
+
+from src.edge.capture_sources import EncodedFrame, Frame
+
+QUALITY_SIZE = (320, 240)
+# Only these make a frame unusable. Overexposure and blur are reported but never rejected:
+# a flame or flash saturates the image and smoke collapses its contrast, which is what the VLM must see.
+QUALITY_REASONS = ("frozen", "dark")
+QUALITY_WARNINGS = ("overexposed", "blur")
+
+
+@dataclass(frozen=True)
+class QualityVerdict:
+    ok: bool
+    reason: str | None
+    metrics: dict[str, float]
+    warnings: tuple[str, ...] = ()
+
+
+@dataclass
+class _CameraQuality:
+    last_hash: bytes | None = None
+    frozen_streak: int = 0
+    sharpness_baseline: float | None = None
+    degraded: bool = False
+    counts: dict[str, int] = field(default_factory=lambda: {"passed": 0, **{reason: 0 for reason in QUALITY_REASONS}})
+    warnings: dict[str, int] = field(default_factory=lambda: {warning: 0 for warning in QUALITY_WARNINGS})
+
+
+class FrameQualityGate:
+    # Screens frames before they reach the VLM: unusable frames cost two Ollama calls and are the
+    # usual source of false DANGER verdicts.
+    SHARPNESS_ALPHA = 0.1
+
+    def __init__(
+        self,
+        dark_level: int = 20,
+        dark_max_fraction: float = 0.85,
+        lit_level: int = 128,
+        lit_min_fraction: float = 0.001,
+        bright_level: int = 245,
+        bright_max_fraction: float = 0.5,
+        blur_ratio: float = 0.3,
+        frozen_after: int = 3,
+    ) -> None:
+        self.dark_level = dark_level
+        self.dark_max_fraction = dark_max_fraction
+        self.lit_level = lit_level
+        self.lit_min_fraction = lit_min_fraction
+        self.bright_level = bright_level
+        self.bright_max_fraction = bright_max_fraction
+        self.blur_ratio = blur_ratio
+        self.frozen_after = max(1, frozen_after)
+        self._cameras: dict[str, _CameraQuality] = {}
+
+    def check(self, camera_id: str, frame: Frame) -> QualityVerdict:
+        state = self._cameras.setdefault(camera_id, _CameraQuality())
+        # MJPEG frames are hashed as delivered; a stuck encoder repeats the exact same bytes.
+        if isinstance(frame, EncodedFrame):
+            digest = hashlib.blake2b(frame.jpeg, digest_size=16).digest()
+            pixels = frame.preview()
+        else:
+            digest = hashlib.blake2b(np.ascontiguousarray(frame).data, digest_size=16).digest()
+            pixels = frame
+        state.frozen_streak = state.frozen_streak + 1 if digest == state.last_hash else 0
+        state.last_hash = digest
+
+        gray = cv2.cvtColor(cv2.resize(pixels, QUALITY_SIZE, interpolation=cv2.INTER_AREA), cv2.COLOR_BGR2GRAY)
+        hist = cv2.calcHist([gray], [0], None, [256], [0, 256]).ravel() / gray.size
+        metrics = {
+            "dark_fraction": round(float(hist[: self.dark_level + 1].sum()), 4),
+            "lit_fraction": round(float(hist[self.lit_level :].sum()), 4),
+            "bright_fraction": round(float(hist[self.bright_level :].sum()), 4),
+            "sharpness": round(float(cv2.Laplacian(gray, cv2.CV_64F).var()), 2),
+            "frozen_streak": float(state.frozen_streak),
+        }
+
+        reason: str | None = None
+        if state.frozen_streak > 0:
+            reason = "frozen"
+        elif metrics["dark_fraction"] > self.dark_max_fraction and metrics["lit_fraction"] < self.lit_min_fraction:
+            # A dark frame with any lit area (a flame at night, a torch) still goes to the VLM.
+            reason = "dark"
+
+        warnings: list[str] = []
+        if reason is None:
+            if metrics["bright_fraction"] > self.bright_max_fraction:
+                warnings.append("overexposed")
+            # Blur is judged against the camera's own history; a plain wall is not a blurred frame.
+            if state.sharpness_baseline is not None and metrics["sharpness"] < self.blur_ratio * state.sharpness_baseline:
+                warnings.append("blur")
+            # Every usable frame feeds the baseline, so a lasting change of scene becomes the new normal.
+            state.sharpness_baseline = metrics["sharpness"] if state.sharpness_baseline is None else (
+                state.sharpness_baseline + self.SHARPNESS_ALPHA * (metrics["sharpness"] - state.sharpness_baseline)
+            )
+            state.counts["passed"] += 1
+            for warning in warnings:
+                state.warnings[warning] += 1
+        else:
+            state.counts[reason] += 1
+        return QualityVerdict(reason is None, reason, metrics, tuple(warnings))
+
+    def health_change(self, camera_id: str) -> str | None:
+        # Returns "degraded" or "ok" when a camera's feed freezes or recovers, otherwise None.
+        state = self._cameras.get(camera_id)
+        if state is None:
+            return None
+        frozen = state.frozen_streak >= self.frozen_after
+        if frozen == state.degraded:
+            return None
+        state.degraded = frozen
+        return "degraded" if frozen else "ok"
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        return {
+            camera_id: {
+                **state.counts,
+                "warnings": dict(state.warnings),
+                "rejected_ratio": round(
+                    1.0 - state.counts["passed"] / max(1, sum(state.counts.values())),
+                    3,
+                ),
+                "degraded": state.degraded,
+            }
+            for camera_id, state in self._cameras.items()
+        }
@@ -0,0 +1,158 @@
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+SAMPLING_MODES = ("fixed", "adaptive")
+
+
+@dataclass(frozen=True)
+class ScheduleWindow:
+    # Minutes since local midnight; a window whose end is before its start wraps past midnight.
+    start_min: int
+    end_min: int
+    interval_sec: float
+
+    def contains(self, minute: int) -> bool:
+        if self.start_min <= self.end_min:
+            return self.start_min <= minute < self.end_min
+        return minute >= self.start_min or minute < self.end_min
+
+
+def _parse_clock(value: str) -> int:
+    hours, sep, minutes = value.strip().partition(":")
+    if not sep or not hours.isdigit() or not minutes.isdigit() or int(hours) > 24 or int(minutes) > 59:
+        raise ValueError(f"Invalid time of day {value!r}; expected HH:MM.")
+    return min(24 * 60, int(hours) * 60 + int(minutes))
+
+
+def parse_sampling_schedule(items: list[str] | None) -> list[ScheduleWindow]:
+    # ["22:00-06:00=60", "07:30-18:00=5"]: base sampling interval per time-of-day window, first match wins.
+    windows: list[ScheduleWindow] = []
+    for item in items or []:
+        span, sep, interval = item.partition("=")
+        start, dash, end = span.partition("-")
+        if not sep or not dash:
+            raise ValueError(f"Invalid sampling schedule entry {item!r}; expected HH:MM-HH:MM=SECONDS.")
+        interval_sec = float(interval)
+        if interval_sec <= 0:
+            raise ValueError(f"Sampling schedule entry {item!r} needs a positive interval.")
+        windows.append(ScheduleWindow(_parse_clock(start), _parse_clock(end), interval_sec))
+    return windows
+
+
+@dataclass
+class _CameraSampling:
+    last_active: float
+    last_danger: float = float("-inf")
+    scene_change: float = 0.0
+    interval_sec: float = 0.0
+    reason: str = "base"
+    served: deque[float] = field(default_factory=deque)
+
+
+class AdaptiveSampler:
+    # Picks each camera's sampling interval between min_interval_sec and max_interval_sec:
+    # dense after a DANGER verdict or a large scene change, sparse once the scene has been idle,
+    # a time-of-day schedule sets the base, and measured VLM latency sets the floor.
+    IDLE_STRETCH = 3.0
+    LATENCY_ALPHA = 0.2
+    RATE_WINDOW_SEC = 300.0
+
+    def __init__(
+        self,
+        base_interval_sec: float,
+        min_interval_sec: float = 2.0,
+        max_interval_sec: float = 60.0,
+        schedule: list[ScheduleWindow] | None = None,
+        danger_hold_sec: float = 60.0,
+        idle_after_sec: float = 120.0,
+        change_threshold: float = 8.0,
+        clock: Callable[[], datetime] = datetime.now,
+    ) -> None:
+        self.min_interval_sec = max(0.1, min_interval_sec)
+        self.max_interval_sec = max(self.min_interval_sec, max_interval_sec)
+        self.base_interval_sec = base_interval_sec
+        self.schedule = schedule or []
+        self.danger_hold_sec = danger_hold_sec
+        self.idle_after_sec = idle_after_sec
+        self.change_threshold = max(1e-3, change_threshold)
+        self.latency_sec: float | None = None
+        self._clock = clock
+        self._cameras: dict[str, _CameraSampling] = {}
+
+    def _camera(self, camera_id: str, now: float) -> _CameraSampling:
+        return self._cameras.setdefault(camera_id, _CameraSampling(last_active=now))
+
+    def observe_scene(self, camera_id: str, change: float, now: float) -> None:
+        state = self._camera(camera_id, now)
+        state.scene_change = change
+        if change >= self.change_threshold:
+            state.last_active = now
+
+    def observe_verdict(self, camera_id: str, is_danger: bool, latency_sec: float, now: float) -> None:
+        state = self._camera(camera_id, now)
+        if is_danger:
+            state.last_danger = now
+            state.last_active = now
+        state.served.append(now)
+        while state.served and now - state.served[0] > self.RATE_WINDOW_SEC:
+            state.served.popleft()
+        latency_sec = max(0.0, latency_sec)
+        self.latency_sec = latency_sec if self.latency_sec is None else (
+            self.latency_sec + self.LATENCY_ALPHA * (latency_sec - self.latency_sec)
+        )
+
+    def base_interval(self) -> tuple[float, str]:
+        moment = self._clock()
+        minute = moment.hour * 60 + moment.minute
+        for window in self.schedule:
+            if window.contains(minute):
+                return window.interval_sec, "schedule"
+        return self.base_interval_sec, "base"
+
+    def interval(self, camera_id: str, now: float, camera_count: int = 1) -> float:
+        state = self._camera(camera_id, now)
+        interval, reason = self.base_interval()
+        ratio = state.scene_change / self.change_threshold
+        if now - state.last_danger <= self.danger_hold_sec:
+            interval, reason = self.min_interval_sec, "danger"
+        elif ratio >= 1.0:
+            # The bigger the change, the closer to the dense bound.
+            interval, reason = interval / ratio, "scene_change"
+        elif now - state.last_active >= self.idle_after_sec:
+            interval, reason = interval * self.IDLE_STRETCH, "idle"
+        # One VLM serves every camera in turn, so sampling faster than that only queues work.
+        latency_floor = (self.latency_sec or 0.0) * max(1, camera_count)
+        if latency_floor > interval:
+            interval, reason = latency_floor, "latency"
+        state.interval_sec = min(self.max_interval_sec, max(self.min_interval_sec, interval))
+        state.reason = reason
+        return state.interval_sec
+
+    def describe(self, camera_id: str) -> dict[str, Any]:
+        state = self._cameras.get(camera_id)
+        if state is None:
+            return {}
+        return {"interval_sec": round(state.interval_sec, 2), "reason": state.reason}
+
+    def stats(self, now: float | None = None) -> dict[str, Any]:
+        now = time.monotonic() if now is None else now
+        cameras: dict[str, Any] = {}
+        for camera_id, state in self._cameras.items():
+            recent = [at for at in state.served if now - at <= self.RATE_WINDOW_SEC]
+            cameras[camera_id] = {
+                **self.describe(camera_id),
+                "target_per_min": round(60.0 / state.interval_sec, 2) if state.interval_sec else None,
+                # Measured from served samples, so it shows what the shared VLM actually delivered.
+                "effective_per_min": (
+                    round((len(recent) - 1) * 60.0 / max(1e-6, recent[-1] - recent[0]), 2) if len(recent) > 1 else None
+                ),
+                "scene_change": round(state.scene_change, 2),
+            }
+        return {
+            "cameras": cameras,
+            "vlm_latency_ms": round(self.latency_sec * 1000.0, 1) if self.latency_sec is not None else None,
+        }
@@ -0,0 +1,139 @@
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from src.edge.cameras import CameraSpec
+
+
+@dataclass
+class _CameraSchedule:
+    spec: CameraSpec
+    last_served: float | None = None
+    boost_until: float = 0.0
+    urgent_at: float | None = None
+    interval_sec: float | None = None
+    inferences: int = 0
+    boosted_runs: int = 0
+    urgent_runs: int = 0
+    overdue_runs: int = 0
+    latency_total_sec: float = 0.0
+
+
+class InferenceScheduler:
+    # One VLM is shared by every camera, so at most one camera is served per call.
+    def __init__(self, cameras: list[CameraSpec], boost_sec: float = 30.0) -> None:
+        if not cameras:
+            raise ValueError("InferenceScheduler needs at least one camera.")
+        self.boost_sec = max(0.0, float(boost_sec))
+        self._cameras = {spec.camera_id: _CameraSchedule(spec) for spec in cameras}
+        self._started_at = time.monotonic()
+
+    @property
+    def camera_ids(self) -> list[str]:
+        return list(self._cameras)
+
+    def next_camera(self, now: float | None = None, ready: set[str] | None = None) -> str | None:
+        due = self.due_cameras(now, ready)
+        return due[0] if due else None
+
+    def due_cameras(self, now: float | None = None, ready: set[str] | None = None) -> list[str]:
+        now = time.monotonic() if now is None else now
+        eligible = [
+            item
+            for item in self._cameras.values()
+            if (self._urgent(item, now) or self._since_served(item, now) >= self._min_interval(item))
+            and (ready is None or item.spec.camera_id in ready)
+        ]
+        # Urgent requests jump the queue and ignore min_interval; then overdue cameras, boosted ones,
+        # and plain round-robin by least recently served.
+        eligible.sort(
+            key=lambda item: (
+                not self._urgent(item, now),
+                self._since_served(item, now) < self._max_interval(item),
+                item.boost_until <= now,
+                item.last_served if item.last_served is not None else float("-inf"),
+            ),
+        )
+        return [item.spec.camera_id for item in eligible]
+
+    def next_due_in(self, now: float | None = None) -> float:
+        now = time.monotonic() if now is None else now
+        return max(
+            0.0,
+            min(
+                min(self._min_interval(item) - self._since_served(item, now), self._urgent_in(item, now))
+                for item in self._cameras.values()
+            ),
+        )
+
+    def record(self, camera_id: str, latency_sec: float, is_danger: bool = False, now: float | None = None) -> None:
+        now = time.monotonic() if now is None else now
+        item = self._cameras[camera_id]
+        # Intervals are measured start to start, so slow inferences do not stretch the sampling period.
+        started = now - max(0.0, latency_sec)
+        if item.last_served is not None and started - item.last_served > self._max_interval(item):
+            item.overdue_runs += 1
+        if item.boost_until > started:
+            item.boosted_runs += 1
+        if item.urgent_at is not None and item.urgent_at <= started:
+            item.urgent_runs += 1
+            item.urgent_at = None
+        item.last_served = started
+        item.inferences += 1
+        item.latency_total_sec += max(0.0, latency_sec)
+        if is_danger:
+            self.boost(camera_id, now)
+
+    def request_immediate(self, camera_id: str, at: float) -> None:
+        # Out-of-schedule run at `at` (now or a little later), e.g. the cascade detector wants the VLM
+        # to confirm something, or a confirmation burst wants the next sample sooner than min_interval.
+        item = self._cameras[camera_id]
+        if item.urgent_at is None or at < item.urgent_at:
+            item.urgent_at = at
+        self.boost(camera_id, at)
+
+    def set_interval(self, camera_id: str, interval_sec: float | None) -> None:
+        # Overrides the camera's sampling interval (adaptive sampling); None restores the configured one.
+        self._cameras[camera_id].interval_sec = interval_sec
+
+    def boost(self, camera_id: str, at: float) -> None:
+        item = self._cameras[camera_id]
+        item.boost_until = max(item.boost_until, at + self.boost_sec)
+
+    def stats(self, now: float | None = None) -> dict[str, dict[str, Any]]:
+        now = time.monotonic() if now is None else now
+        elapsed = max(1e-6, now - self._started_at)
+        return {
+            camera_id: {
+                "inferences": item.inferences,
+                "per_min": round(item.inferences * 60.0 / elapsed, 2),
+                "avg_latency_ms": round(item.latency_total_sec * 1000.0 / item.inferences, 1) if item.inferences else None,
+                "boosted_runs": item.boosted_runs,
+                "overdue_runs": item.overdue_runs,
+                "urgent_runs": item.urgent_runs,
+                "interval_sec": round(self._min_interval(item), 2),
+                "boosted": item.boost_until > now,
+            }
+            for camera_id, item in self._cameras.items()
+        }
+
+    @staticmethod
+    def _min_interval(item: _CameraSchedule) -> float:
+        return item.spec.min_interval_sec if item.interval_sec is None else item.interval_sec
+
+    @staticmethod
+    def _max_interval(item: _CameraSchedule) -> float:
+        # A camera sampled sparsely on purpose is not overdue.
+        return item.spec.max_interval_sec if item.interval_sec is None else max(item.spec.max_interval_sec, item.interval_sec)
+
+    @staticmethod
+    def _urgent(item: _CameraSchedule, now: float) -> bool:
+        return item.urgent_at is not None and item.urgent_at <= now
+
+    @staticmethod
+    def _urgent_in(item: _CameraSchedule, now: float) -> float:
+        return float("inf") if item.urgent_at is None else item.urgent_at - now
+
+    @staticmethod
+    def _since_served(item: _CameraSchedule, now: float) -> float:
+        return float("inf") if item.last_served is None else now - item.last_served
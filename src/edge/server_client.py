@@ -9,22 +9,69 @@ from src.api.models import DangerEventAck
 
 
 class DangerEventClient:
-    def __init__(self, base_url: str, endpoint: str, timeout_sec: int = 5, retries: int = 2) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        endpoint: str,
+        timeout_sec: int = 5,
+        retries: int = 2,
+        throttle_max_backoff_sec: float = 300.0,
+    ) -> None:
         self.base_url = base_url.rstrip("/")
         self.endpoint = endpoint
         self.timeout_sec = timeout_sec
         self.retries = retries
+        self.throttle_max_backoff_sec = max(1.0, float(throttle_max_backoff_sec))
         self.logger = logging.getLogger(__name__)
         self.session = requests.Session()
+        self._throttled_until = 0.0
+        self._throttle_streak = 0
+
+    def _throttled_ack(self, event_id: str, retry_after_sec: float) -> dict[str, Any]:
+        return {
+            "status": "throttled",
+            "event_id": event_id,
+            "response": None,
+            "retry_after_sec": round(max(0.0, retry_after_sec), 3),
+        }
+
+    def _handle_throttled(self, response: requests.Response, event_id: str) -> dict[str, Any]:
+        ack = self._parse_ack(response)
+        retry_after = ack.get("retry_after_sec")
+        if not isinstance(retry_after, (int, float)):
+            try:
+                retry_after = float(response.headers.get("retry-after", "1"))
+            except ValueError:
+                retry_after = 1.0
+
+        # Back off exponentially while the server keeps throttling this source.
+        self._throttle_streak += 1
+        backoff = min(self.throttle_max_backoff_sec, max(float(retry_after), 2.0 ** (self._throttle_streak - 1)))
+        self._throttled_until = time.monotonic() + backoff
+        self.logger.warning(
+            "Danger event throttled by server. event_id=%s backoff=%.1fs streak=%s",
+            event_id,
+            backoff,
+            self._throttle_streak,
+        )
+        return self._throttled_ack(event_id, backoff)
 
     def send(self, payload: dict[str, Any]) -> dict[str, Any] | None:
         url = f"{self.base_url}{self.endpoint}"
         last_error = None
 
+        remaining = self._throttled_until - time.monotonic()
+        if remaining > 0:
+            self.logger.info("Server backoff active. Skip send. event_id=%s remaining=%.1fs", payload["event_id"], remaining)
+            return self._throttled_ack(payload["event_id"], remaining)
+
         for attempt in range(1, self.retries + 2):
             try:
                 response = self.session.post(url, json=payload, timeout=self.timeout_sec)
+                if response.status_code == 429:
+                    return self._handle_throttled(response, payload["event_id"])
                 if response.ok:
+                    self._throttle_streak = 0
                     self.logger.info("Danger event sent: status=%s event_id=%s", response.status_code, payload["event_id"])
                     return self._parse_ack(response)
                 last_error = RuntimeError(f"status={response.status_code} body={response.text[:200]}")
@@ -37,6 +84,17 @@ class DangerEventClient:
         self.logger.error("Danger event send failed after retries: %s", last_error)
         return None
 
+    def send_health(self, endpoint: str, payload: dict[str, Any]) -> bool:
+        # Health reports are best effort: one attempt, never retried or queued behind danger events.
+        try:
+            response = self.session.post(f"{self.base_url}{endpoint}", json=payload, timeout=self.timeout_sec)
+        except Exception as exc:
+            self.logger.warning("Camera health report failed: %s", exc)
+            return False
+        if not response.ok:
+            self.logger.warning("Camera health report rejected: status=%s", response.status_code)
+        return response.ok
+
     def _parse_ack(self, response: requests.Response) -> dict[str, Any]:
         content_type = response.headers.get("content-type", "")
         if "application/json" not in content_type.lower():
@@ -0,0 +1,199 @@
+import logging
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+THROTTLE_LEVELS = ("normal", "warm", "hot", "critical")
+# Jetson exposes the integrated GPU's busy ratio (0..1000) under different names per module generation.
+GPU_LOAD_PATHS = (
+    "sys/devices/platform/gpu.0/load",
+    "sys/devices/gpu.0/load",
+    "sys/devices/platform/17000000.ga10b/load",
+    "sys/devices/platform/17000000.gpu/load",
+)
+
+
+@dataclass(frozen=True)
+class DeviceReading:
+    max_temp_c: float | None = None
+    hottest_zone: str | None = None
+    cpu_load: float | None = None
+    gpu_load: float | None = None
+
+
+def _read_text(path: Path) -> str | None:
+    try:
+        return path.read_text(encoding="utf-8").strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+class SysfsLoadReader:
+    # Reads thermal zones and CPU/GPU load below `root`, so tests can point it at a fake tree.
+    def __init__(self, root: str = "/") -> None:
+        self.root = Path(root)
+        self._cpu_times: tuple[int, int] | None = None
+
+    def read(self) -> DeviceReading:
+        max_temp_c, hottest_zone = self._read_temperature()
+        return DeviceReading(max_temp_c, hottest_zone, self._read_cpu_load(), self._read_gpu_load())
+
+    def _read_temperature(self) -> tuple[float | None, str | None]:
+        hottest: tuple[float, str] | None = None
+        for zone in sorted((self.root / "sys/class/thermal").glob("thermal_zone*")):
+            raw = _read_text(zone / "temp")
+            if raw is None or not raw.lstrip("-").isdigit():
+                continue
+            temp_c = int(raw) / 1000.0
+            # Disabled sensors report placeholders such as -256 C.
+            if not -40.0 < temp_c < 150.0:
+                continue
+            if hottest is None or temp_c > hottest[0]:
+                hottest = (temp_c, _read_text(zone / "type") or zone.name)
+        return (hottest[0], hottest[1]) if hottest is not None else (None, None)
+
+    def _read_cpu_load(self) -> float | None:
+        # Busy share of CPU time since the previous read; the first read only primes the counters.
+        raw = _read_text(self.root / "proc/stat")
+        if raw is None or not raw.startswith("cpu "):
+            return None
+        values = [int(value) for value in raw.splitlines()[0].split()[1:] if value.isdigit()]
+        if len(values) < 4:
+            return None
+        idle = values[3] + (values[4] if len(values) > 4 else 0)
+        total = sum(values)
+        previous, self._cpu_times = self._cpu_times, (total, idle)
+        if previous is None or total <= previous[0]:
+            return None
+        return max(0.0, min(1.0, 1.0 - (idle - previous[1]) / (total - previous[0])))
+
+    def _read_gpu_load(self) -> float | None:
+        for relative in GPU_LOAD_PATHS:
+            raw = _read_text(self.root / relative)
+            if raw is not None and raw.isdigit():
+                return min(1.0, int(raw) / 1000.0)
+        return None
+
+
+@dataclass(frozen=True)
+class ThrottleState:
+    level: str
+    pressure: float
+    interval_scale: float
+    image_max_side: int | None
+    reading: DeviceReading
+
+    def as_meta(self) -> dict[str, Any]:
+        return {
+            "level": self.level,
+            "pressure": round(self.pressure, 3),
+            "interval_scale": round(self.interval_scale, 2),
+            "image_max_side": self.image_max_side,
+            "max_temp_c": self.reading.max_temp_c,
+            "cpu_load": round(self.reading.cpu_load, 3) if self.reading.cpu_load is not None else None,
+            "gpu_load": round(self.reading.gpu_load, 3) if self.reading.gpu_load is not None else None,
+        }
+
+
+class ThermalGovernor:
+    # Backs inference off before the SoC's own clock throttling starts: temperature between soft_temp_c
+    # and hard_temp_c (and, at half weight, sustained CPU/GPU load above load_high) becomes a pressure in
+    # 0..1 that stretches the sampling interval and caps the VLM image size. Levels drop back only after
+    # RELEASE_AFTER calmer polls, so the edge does not oscillate around a threshold.
+    LOAD_WEIGHT = 0.5
+    LOAD_ALPHA = 0.3
+    RELEASE_AFTER = 3
+
+    def __init__(
+        self,
+        reader: SysfsLoadReader,
+        soft_temp_c: float = 75.0,
+        hard_temp_c: float = 90.0,
+        load_high: float = 0.9,
+        max_slowdown: float = 3.0,
+        image_sides: tuple[int, int, int] = (896, 640, 448),
+        poll_sec: float = 5.0,
+    ) -> None:
+        self.reader = reader
+        self.soft_temp_c = soft_temp_c
+        self.hard_temp_c = max(soft_temp_c + 1.0, hard_temp_c)
+        self.load_high = min(0.99, max(0.0, load_high))
+        self.max_slowdown = max(1.0, max_slowdown)
+        self.image_sides = image_sides
+        self.poll_sec = poll_sec
+        self.logger = logging.getLogger(__name__)
+        self.transitions = 0
+        self._polled = float("-inf")
+        self._cpu_load: float | None = None
+        self._gpu_load: float | None = None
+        self._level = 0
+        self._calm_polls = 0
+        self._state = ThrottleState("normal", 0.0, 1.0, None, DeviceReading())
+        self._level_polls = [0 for _ in THROTTLE_LEVELS]
+
+    @property
+    def state(self) -> ThrottleState:
+        return self._state
+
+    def _smooth(self, previous: float | None, value: float | None) -> float | None:
+        if value is None:
+            return previous
+        return value if previous is None else previous + self.LOAD_ALPHA * (value - previous)
+
+    def update(self, now: float | None = None) -> ThrottleState:
+        now = time.monotonic() if now is None else now
+        if now - self._polled < self.poll_sec:
+            return self._state
+        self._polled = now
+        raw = self.reader.read()
+        # GPU load swings between 0 and 100% across each VLM call; only the trend says anything.
+        self._cpu_load = self._smooth(self._cpu_load, raw.cpu_load)
+        self._gpu_load = self._smooth(self._gpu_load, raw.gpu_load)
+        reading = DeviceReading(raw.max_temp_c, raw.hottest_zone, self._cpu_load, self._gpu_load)
+
+        pressure = 0.0
+        if reading.max_temp_c is not None:
+            pressure = (reading.max_temp_c - self.soft_temp_c) / (self.hard_temp_c - self.soft_temp_c)
+        for load in (reading.cpu_load, reading.gpu_load):
+            if load is not None:
+                pressure = max(pressure, self.LOAD_WEIGHT * (load - self.load_high) / (1.0 - self.load_high))
+        pressure = min(1.0, max(0.0, pressure))
+
+        level = 0 if pressure <= 0.0 else 1 if pressure < 0.5 else 2 if pressure < 1.0 else 3
+        if level >= self._level:
+            self._calm_polls = 0
+        else:
+            self._calm_polls += 1
+            if self._calm_polls < self.RELEASE_AFTER:
+                level = self._level
+            else:
+                self._calm_polls = 0
+        if level != self._level:
+            self.transitions += 1
+            self.logger.warning(
+                "Thermal throttle level changed: %s -> %s pressure=%.2f reading=%s",
+                THROTTLE_LEVELS[self._level],
+                THROTTLE_LEVELS[level],
+                pressure,
+                reading,
+            )
+            self._level = level
+        self._level_polls[level] += 1
+        # A held level keeps at least that level's slowdown while the pressure eases off.
+        held_pressure = max(pressure, (0.0, 0.0, 0.5, 1.0)[level])
+        self._state = ThrottleState(
+            THROTTLE_LEVELS[level],
+            pressure,
+            1.0 + held_pressure * (self.max_slowdown - 1.0),
+            self.image_sides[level - 1] if level > 0 else None,
+            reading,
+        )
+        return self._state
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            **self._state.as_meta(),
+            "transitions": self.transitions,
+            "polls": dict(zip(THROTTLE_LEVELS, self._level_polls)),
+        }
@@ -1,6 +1,8 @@
-import base64
 import json
 import logging
+import math
+import random
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -9,6 +11,53 @@ import cv2
 import numpy as np
 import requests
 
+from src.api.repositories.jsonl_writer import JsonlWriter
+from src.edge.capture_sources import Frame, as_pixels
+from src.edge.image_tuning import ImageController, ImageSettings, encode_image
+
+SAFE_SUMMARY = "특이 위험 상황은 감지되지 않았습니다."
+MOSAIC_RESPONSE_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "tiles": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "tile": {"type": "integer"},
+                    "verdict": {"type": "string", "enum": ["DANGER", "SAFE"]},
+                },
+                "required": ["tile", "verdict"],
+            },
+        }
+    },
+    "required": ["tiles"],
+}
+
+
+def build_mosaic(frames: list[Frame], tile_width: int = 448) -> np.ndarray:
+    frames = [as_pixels(frame) for frame in frames]
+    cols = math.ceil(math.sqrt(len(frames)))
+    rows = math.ceil(len(frames) / cols)
+    height, width = frames[0].shape[:2]
+    tile_height = max(1, round(tile_width * height / max(1, width)))
+    canvas = np.zeros((rows * tile_height, cols * tile_width, 3), dtype=np.uint8)
+    for idx, frame in enumerate(frames):
+        row, col = divmod(idx, cols)
+        top, left = row * tile_height, col * tile_width
+        # Fit each tile without stretching; ROI crops rarely share the first frame's aspect ratio.
+        scale = min(tile_width / max(1, frame.shape[1]), tile_height / max(1, frame.shape[0]))
+        fit_width = max(1, min(tile_width, round(frame.shape[1] * scale)))
+        fit_height = max(1, min(tile_height, round(frame.shape[0] * scale)))
+        offset_y, offset_x = top + (tile_height - fit_height) // 2, left + (tile_width - fit_width) // 2
+        canvas[offset_y : offset_y + fit_height, offset_x : offset_x + fit_width] = cv2.resize(
+            frame, (fit_width, fit_height), interpolation=cv2.INTER_AREA
+        )
+        # Tile numbers are what the model reports back, so draw them large and high-contrast.
+        cv2.rectangle(canvas, (left, top), (left + 44, top + 40), (0, 0, 0), thickness=-1)
+        cv2.putText(canvas, str(idx + 1), (left + 8, top + 31), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (255, 255, 255), 2)
+    return canvas
+
 
 class VLMClient:
     def __init__(
@@ -21,6 +70,21 @@ class VLMClient:
         use_heuristic_fallback: bool = True,
         raw_log_enabled: bool = True,
         raw_log_path: str = "data/edge/vlm_raw_responses.jsonl",
+        raw_log_rotate_max_bytes: int = 32 * 1024 * 1024,
+        raw_log_compress: str = "gzip",
+        raw_log_retention_max_bytes: int = 256 * 1024 * 1024,
+        raw_log_retention_max_age_sec: float = 0.0,
+        raw_log_sample_safe: float = 0.05,
+        raw_log_sample_danger: float = 1.0,
+        raw_log_sample_error: float = 1.0,
+        raw_log_include_metadata: bool = False,
+        raw_log_queue_max: int = 256,
+        mosaic_tile_width: int = 448,
+        image_mode: str = "fixed",
+        image_max_side: int = 0,
+        image_jpeg_quality: int = 85,
+        image_min_side: int = 448,
+        latency_budget_ms: float = 4000.0,
     ) -> None:
         self.provider = provider
         self.model = model
@@ -32,21 +96,55 @@ class VLMClient:
         self.raw_log_path = Path(raw_log_path)
         self.logger = logging.getLogger(__name__)
         self.session = requests.Session()
+        self.raw_log_sample_rates = {
+            "safe": min(1.0, max(0.0, raw_log_sample_safe)),
+            "danger": min(1.0, max(0.0, raw_log_sample_danger)),
+            "error": min(1.0, max(0.0, raw_log_sample_error)),
+        }
+        self.raw_log_include_metadata = raw_log_include_metadata
+        self.mosaic_tile_width = max(64, int(mosaic_tile_width))
+        self.image_controller = ImageController(
+            mode=image_mode,
+            max_side=image_max_side,
+            jpeg_quality=image_jpeg_quality,
+            latency_budget_ms=latency_budget_ms,
+            min_side=image_min_side,
+        )
+        self.raw_log_counters = {"written": 0, "sampled_out": 0, "dropped": 0}
+        self._random = random.Random()
+        # The raw log holds full Ollama bodies per frame; rotate, compress and cap it so eMMC cannot fill.
+        self._raw_log_writer = (
+            JsonlWriter(
+                self.raw_log_path,
+                background=True,
+                fsync_policy="none",
+                queue_max=raw_log_queue_max,
+                drop_when_full=True,
+                rotate_max_bytes=raw_log_rotate_max_bytes,
+                compress=raw_log_compress,
+                retention_max_bytes=raw_log_retention_max_bytes,
+                retention_max_age_sec=raw_log_retention_max_age_sec,
+                timestamp_key="timestamp_utc",
+            )
+            if raw_log_enabled
+            else None
+        )
 
-    def analyze_frame(self, frame: np.ndarray) -> tuple[bool, str, float, dict[str, Any]]:
+    def analyze_frame(self, frame: Frame) -> tuple[bool, str, float, dict[str, Any]]:
         if self.provider == "ollama":
             try:
                 return self._analyze_with_ollama(frame)
             except Exception as exc:
                 self.logger.warning("Ollama VLM call failed. fallback=%s error=%s", self.use_heuristic_fallback, exc)
                 self._write_raw_log(
+                    "error",
                     {
                         "timestamp_utc": datetime.now(timezone.utc).isoformat(),
                         "status": "ollama-error",
                         "provider": self.provider,
                         "model": self.model,
                         "error": str(exc),
-                    }
+                    },
                 )
         else:
             self.logger.warning("Unsupported EDGE_VLM_PROVIDER=%s", self.provider)
@@ -55,6 +153,7 @@ class VLMClient:
             is_danger, summary, confidence, meta = self._analyze_with_heuristic(frame)
             meta["fallback_reason"] = "vlm_call_failed_or_unsupported_provider"
             self._write_raw_log(
+                "error",
                 {
                     "timestamp_utc": datetime.now(timezone.utc).isoformat(),
                     "status": "heuristic-fallback",
@@ -63,15 +162,104 @@ class VLMClient:
                     "is_danger": is_danger,
                     "summary": summary,
                     "confidence": confidence,
-                    "meta": meta,
-                }
+                    # The writer thread serializes later; the caller goes on to annotate `meta`.
+                    "meta": dict(meta),
+                },
             )
             return is_danger, summary, confidence, meta
 
         raise RuntimeError("VLM analysis failed and heuristic fallback is disabled.")
 
-    def _analyze_with_ollama(self, frame: np.ndarray) -> tuple[bool, str, float, dict[str, Any]]:
-        encoded_image = self._encode_frame_to_base64(frame)
+    def analyze_mosaic(self, frames: dict[str, Frame]) -> dict[str, tuple[bool, str, float, dict[str, Any]]]:
+        if self.provider != "ollama" or len(frames) < 2:
+            return {key: self.analyze_frame(frame) for key, frame in frames.items()}
+
+        keys = list(frames)
+        try:
+            mosaic = build_mosaic([frames[key] for key in keys], self.mosaic_tile_width)
+            raw, mosaic_meta = self._call_ollama(
+                prompt=(
+                    f"이미지는 카메라 {len(keys)}대의 화면을 격자로 배치한 것이며 각 타일 왼쪽 위에 번호가 있다. "
+                    "타일마다 산업안전 위험 여부를 DANGER 또는 SAFE로 판정하라. "
+                    '출력은 JSON만: {"tiles": [{"tile": 번호, "verdict": "DANGER" 또는 "SAFE"}]}'
+                ),
+                image_base64=encode_image(mosaic, ImageSettings(0, self.image_controller.settings.jpeg_quality))[0],
+                response_format=MOSAIC_RESPONSE_SCHEMA,
+            )
+            verdicts = self._parse_mosaic_verdicts(raw, len(keys))
+        except Exception as exc:
+            self.logger.warning("Mosaic VLM call failed. Falling back to per-frame analysis. error=%s", exc)
+            self._write_raw_log(
+                "error",
+                {
+                    "timestamp_utc": datetime.now(timezone.utc).isoformat(),
+                    "status": "mosaic-error",
+                    "provider": self.provider,
+                    "model": self.model,
+                    "tiles": keys,
+                    "error": str(exc),
+                },
+            )
+            return {key: self.analyze_frame(frame) for key, frame in frames.items()}
+
+        results: dict[str, tuple[bool, str, float, dict[str, Any]]] = {}
+        for tile, key in enumerate(keys, start=1):
+            verdict = verdicts.get(tile)
+            if verdict == "SAFE":
+                results[key] = (
+                    False,
+                    SAFE_SUMMARY,
+                    0.88,
+                    {
+                        "provider": "ollama",
+                        "model": self.model,
+                        "classification": "SAFE",
+                        "mode": "mosaic",
+                        "mosaic_tile": tile,
+                        "mosaic_tiles": len(keys),
+                        "request_total_duration_ns": mosaic_meta.get("total_duration"),
+                    },
+                )
+                continue
+            # Flagged or unreadable tiles are confirmed on the full-resolution frame.
+            is_danger, summary, confidence, meta = self.analyze_frame(frames[key])
+            meta.update({"mode": "mosaic-requery", "mosaic_tile": tile, "mosaic_verdict": verdict or "missing"})
+            results[key] = (is_danger, summary, confidence, meta)
+
+        flagged = [key for tile, key in enumerate(keys, start=1) if verdicts.get(tile) != "SAFE"]
+        self._write_raw_log(
+            "danger" if flagged else "safe",
+            {
+                "timestamp_utc": datetime.now(timezone.utc).isoformat(),
+                "status": "mosaic",
+                "provider": "ollama",
+                "model": self.model,
+                "tiles": keys,
+                "mosaic_raw": (raw or "").strip(),
+                "flagged": flagged,
+                "total_duration_ns": mosaic_meta.get("total_duration"),
+            },
+        )
+        return results
+
+    def _parse_mosaic_verdicts(self, raw_text: str, tile_count: int) -> dict[int, str]:
+        body = json.loads(raw_text)
+        tiles = body.get("tiles") if isinstance(body, dict) else None
+        if not isinstance(tiles, list):
+            raise RuntimeError(f"Unexpected mosaic response: {raw_text!r}")
+        verdicts: dict[int, str] = {}
+        for item in tiles:
+            if not isinstance(item, dict):
+                continue
+            tile = item.get("tile")
+            label = self._normalize_label(str(item.get("verdict", "")))
+            if isinstance(tile, int) and 1 <= tile <= tile_count and label is not None:
+                verdicts[tile] = label
+        return verdicts
+
+    def _analyze_with_ollama(self, frame: Frame) -> tuple[bool, str, float, dict[str, Any]]:
+        encoded_image, image_meta = self.image_controller.encode(frame)
+        started = time.monotonic()
         classify_raw, classify_meta = self._call_ollama(
             prompt=(
                 "당신은 산업안전 감시 분류기다. "
@@ -80,13 +268,18 @@ class VLMClient:
             ),
             image_base64=encoded_image,
         )
+        self.image_controller.observe(
+            classify_meta.get("total_duration"),
+            classify_meta.get("prompt_eval_count"),
+            wall_sec=time.monotonic() - started,
+        )
         label = self._normalize_label(classify_raw)
         if label is None:
             raise RuntimeError(f"Unexpected classification response: {classify_raw!r}")
 
         is_danger = label == "DANGER"
         confidence = 0.93 if is_danger else 0.88
-        summary = "특이 위험 상황은 감지되지 않았습니다."
+        summary = SAFE_SUMMARY
         summary_source = "safe-default"
         summary_raw = ""
         summary_meta: dict[str, Any] = {}
@@ -114,26 +307,36 @@ class VLMClient:
             "request_prompt_eval_count": classify_meta.get("prompt_eval_count"),
             "request_eval_count": classify_meta.get("eval_count"),
             "request_total_duration_ns": classify_meta.get("total_duration"),
+            "image": image_meta,
         }
-        self._write_raw_log(
-            {
+        if self._should_write_raw_log("danger" if is_danger else "safe"):
+            raw_record: dict[str, Any] = {
                 "timestamp_utc": datetime.now(timezone.utc).isoformat(),
                 "status": "ok",
                 "provider": "ollama",
                 "model": self.model,
                 "classification": label,
                 "classification_raw": (classify_raw or "").strip(),
-                "classification_response": classify_meta,
                 "summary_raw": (summary_raw or "").strip(),
-                "summary_response": summary_meta,
                 "summary_used": summary,
                 "confidence": confidence,
                 "summary_source": summary_source,
+                "total_duration_ns": classify_meta.get("total_duration"),
+                "prompt_eval_count": classify_meta.get("prompt_eval_count"),
+                "image": dict(image_meta),
             }
-        )
+            if self.raw_log_include_metadata:
+                raw_record["classification_response"] = classify_meta
+                raw_record["summary_response"] = summary_meta
+            self._enqueue_raw_log(raw_record)
         return is_danger, summary, confidence, meta
 
-    def _call_ollama(self, prompt: str, image_base64: str) -> tuple[str, dict[str, Any]]:
+    def _call_ollama(
+        self,
+        prompt: str,
+        image_base64: str,
+        response_format: dict[str, Any] | None = None,
+    ) -> tuple[str, dict[str, Any]]:
         payload: dict[str, Any] = {
             "model": self.model,
             "stream": False,
@@ -149,6 +352,8 @@ class VLMClient:
                 "temperature": 0,
             },
         }
+        if response_format is not None:
+            payload["format"] = response_format
         response = self.session.post(self.ollama_url, json=payload, timeout=self.timeout_sec)
         response.raise_for_status()
         body = response.json()
@@ -158,11 +363,8 @@ class VLMClient:
         return content, body
 
     @staticmethod
-    def _encode_frame_to_base64(frame: np.ndarray) -> str:
-        ok, encoded = cv2.imencode(".jpg", frame, [int(cv2.IMWRITE_JPEG_QUALITY), 85])
-        if not ok:
-            raise RuntimeError("Failed to encode frame to JPEG.")
-        return base64.b64encode(encoded.tobytes()).decode("utf-8")
+    def _encode_frame_to_base64(frame: Frame) -> str:
+        return encode_image(frame, ImageSettings(0, 85))[0]
 
     @staticmethod
     def _normalize_label(raw_text: str) -> str | None:
@@ -187,8 +389,8 @@ class VLMClient:
             text = text[:120].rstrip()
         return text
 
-    def _analyze_with_heuristic(self, frame: np.ndarray) -> tuple[bool, str, float, dict[str, Any]]:
-        mean_bgr = frame.mean(axis=(0, 1))
+    def _analyze_with_heuristic(self, frame: Frame) -> tuple[bool, str, float, dict[str, Any]]:
+        mean_bgr = as_pixels(frame).mean(axis=(0, 1))
         blue, green, red = float(mean_bgr[0]), float(mean_bgr[1]), float(mean_bgr[2])
         red_ratio = red / max(1.0, blue + green)
 
@@ -207,7 +409,7 @@ class VLMClient:
                 hazard_type = "general"
                 summary = "작업 구역 경계에서 비정상 위험 행동 징후가 감지되었습니다."
         else:
-            summary = "특이 위험 상황은 감지되지 않았습니다."
+            summary = SAFE_SUMMARY
 
         meta = {
             "provider": "heuristic",
@@ -220,13 +422,33 @@ class VLMClient:
         }
         return is_danger, summary, confidence, meta
 
-    def _write_raw_log(self, payload: dict[str, Any]) -> None:
-        if not self.raw_log_enabled:
-            return
+    def _should_write_raw_log(self, outcome: str) -> bool:
+        if not self.raw_log_enabled or self._raw_log_writer is None:
+            return False
+        rate = self.raw_log_sample_rates.get(outcome, 1.0)
+        if rate >= 1.0 or (rate > 0.0 and self._random.random() < rate):
+            return True
+        self.raw_log_counters["sampled_out"] += 1
+        return False
+
+    def _write_raw_log(self, outcome: str, payload: dict[str, Any]) -> None:
+        if self._should_write_raw_log(outcome):
+            self._enqueue_raw_log(payload)
 
+    def _enqueue_raw_log(self, payload: dict[str, Any]) -> None:
+        if self._raw_log_writer is None:
+            return
         try:
-            self.raw_log_path.parent.mkdir(parents=True, exist_ok=True)
-            with self.raw_log_path.open("a", encoding="utf-8") as fp:
-                fp.write(json.dumps(payload, ensure_ascii=False) + "\n")
+            # Never blocks the inference loop; a full buffer drops the record and counts it.
+            if self._raw_log_writer.write(payload):
+                self.raw_log_counters["written"] += 1
+            else:
+                self.raw_log_counters["dropped"] += 1
         except Exception as exc:
             self.logger.warning("Failed to write VLM raw log: %s", exc)
+
+    def close(self) -> None:
+        if self._raw_log_writer is not None:
+            self._raw_log_writer.close()
+            self.logger.info("VLM raw log counters: %s", self.raw_log_counters)
+        self.logger.info("VLM image settings: %s", self.image_controller.stats())
@@ -0,0 +1,84 @@
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from src.edge.capture_sources import Frame, as_pixels
+
+ZONE_SCENARIOS = {"fire", "fall", "intrusion", "electrical"}
+# "composite" shares VLM calls between zone crops as mosaics; "crops" sends every crop on its own.
+ZONE_MODES = ("composite", "crops")
+
+
+@dataclass(frozen=True)
+class Zone:
+    zone_id: str
+    # Vertices as fractions of frame width/height, so one config serves any capture resolution.
+    polygon: tuple[tuple[float, float], ...]
+    scenario: str | None = None
+    cooldown_sec: float | None = None
+
+
+def load_camera_zones(path: str | None) -> dict[str, list[Zone]]:
+    # {"cam0": [{"zone_id": "panel", "polygon": [[0.1, 0.2], ...], "scenario": "electrical", "cooldown_sec": 60}]}
+    if not path:
+        return {}
+    raw = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(raw, dict):
+        raise ValueError("Camera zone file must map camera ids to zone lists.")
+    zones: dict[str, list[Zone]] = {}
+    for camera_id, items in raw.items():
+        if not isinstance(items, list):
+            raise ValueError(f"Zones for camera {camera_id} must be a list.")
+        parsed: list[Zone] = []
+        for idx, item in enumerate(items):
+            polygon = tuple((float(x), float(y)) for x, y in item.get("polygon", []))
+            if len(polygon) < 3 or not all(0.0 <= value <= 1.0 for point in polygon for value in point):
+                raise ValueError(f"Zone {camera_id}[{idx}] needs at least 3 vertices within 0..1.")
+            scenario = item.get("scenario")
+            if scenario is not None and scenario not in ZONE_SCENARIOS:
+                raise ValueError(f"Zone {camera_id}[{idx}] has unknown scenario {scenario!r}.")
+            zone_id = str(item.get("zone_id") or f"zone{idx}")
+            if any(existing.zone_id == zone_id for existing in parsed):
+                raise ValueError(f"Duplicate zone id {zone_id!r} for camera {camera_id}.")
+            cooldown = item.get("cooldown_sec")
+            parsed.append(
+                Zone(
+                    zone_id=zone_id,
+                    polygon=polygon,
+                    scenario=scenario,
+                    cooldown_sec=float(cooldown) if cooldown is not None else None,
+                )
+            )
+        if parsed:
+            zones[str(camera_id)] = parsed
+    return zones
+
+
+class ZoneCropper:
+    # Masks are rebuilt only when a camera's resolution changes.
+    def __init__(self) -> None:
+        self._masks: dict[tuple[Zone, int, int], tuple[tuple[int, int, int, int], np.ndarray]] = {}
+
+    def crop(self, frame: Frame, zone: Zone) -> np.ndarray:
+        pixels = as_pixels(frame)
+        height, width = pixels.shape[:2]
+        key = (zone, width, height)
+        if key not in self._masks:
+            points = np.array(
+                [(round(x * (width - 1)), round(y * (height - 1))) for x, y in zone.polygon],
+                dtype=np.int32,
+            )
+            left, top, box_width, box_height = cv2.boundingRect(points)
+            mask = np.zeros((box_height, box_width), dtype=np.uint8)
+            cv2.fillPoly(mask, [points - (left, top)], 255)
+            self._masks[key] = ((left, top, box_width, box_height), mask)
+        (left, top, box_width, box_height), mask = self._masks[key]
+        # Pixels outside the polygon are blacked out so the model only judges the zone itself.
+        return cv2.bitwise_and(
+            pixels[top : top + box_height, left : left + box_width],
+            pixels[top : top + box_height, left : left + box_width],
+            mask=mask,
+        )
@@ -1,3 +1,4 @@
+import hashlib
 import json
 import re
 from dataclasses import dataclass
@@ -32,6 +33,13 @@ def load_manuals(manual_path: Path | None = None) -> list[ManualEntry]:
     return manuals
 
 
+def corpus_version(manuals: list[ManualEntry]) -> str:
+    digest = hashlib.sha1()
+    for entry in manuals:
+        digest.update(json.dumps([entry.id, entry.title, entry.content, entry.tags], ensure_ascii=False).encode("utf-8"))
+    return digest.hexdigest()[:12]
+
+
 def search_manuals(query: str, manuals: list[ManualEntry], top_k: int = 3) -> list[ManualEntry]:
     q_tokens = _tokenize(query)
     scored: list[tuple[int, ManualEntry]] = []
@@ -0,0 +1,95 @@
+import argparse
+import statistics
+import time
+from typing import Any, Callable
+
+import cv2
+import numpy as np
+
+from src.edge.vlm_client import VLMClient
+
+
+def _load_frames(paths: list[str], count: int) -> list[np.ndarray]:
+    if paths:
+        frames = [cv2.imread(path) for path in paths]
+        missing = [path for path, frame in zip(paths, frames) if frame is None]
+        if missing:
+            raise SystemExit(f"Failed to read images: {missing}")
+        return [frames[idx % len(frames)] for idx in range(count)]
+    rng = np.random.default_rng(7)
+    return [rng.integers(0, 255, size=(720, 1280, 3), dtype=np.uint8) for _ in range(count)]
+
+
+def _count_calls(client: VLMClient) -> Callable[[], int]:
+    calls = 0
+    original = client._call_ollama
+
+    def _wrapped(*args: Any, **kwargs: Any) -> tuple[str, dict[str, Any]]:
+        nonlocal calls
+        calls += 1
+        return original(*args, **kwargs)
+
+    client._call_ollama = _wrapped  # type: ignore[method-assign]
+    return lambda: calls
+
+
+def _run(client: VLMClient, frames: dict[str, np.ndarray], rounds: int, mosaic: bool) -> dict[str, Any]:
+    calls = _count_calls(client)
+    latencies: dict[str, list[float]] = {key: [] for key in frames}
+    started = time.perf_counter()
+    for _ in range(rounds):
+        round_started = time.perf_counter()
+        if mosaic:
+            client.analyze_mosaic(frames)
+            for key in frames:
+                latencies[key].append(time.perf_counter() - round_started)
+        else:
+            # One call per frame: later cameras wait for every call ahead of them.
+            for key, frame in frames.items():
+                client.analyze_frame(frame)
+                latencies[key].append(time.perf_counter() - round_started)
+    elapsed = time.perf_counter() - started
+    return {
+        "calls": calls(),
+        "elapsed_sec": round(elapsed, 2),
+        "calls_per_sec": round(calls() / elapsed, 3),
+        "frames_per_sec": round(len(frames) * rounds / elapsed, 3),
+        "detection_latency_ms": {key: round(statistics.mean(values) * 1000.0, 1) for key, values in latencies.items()},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare one-call-per-frame VLM inference with mosaic inference.")
+    parser.add_argument("--ollama-url", default="http://127.0.0.1:11434/api/chat")
+    parser.add_argument("--model", default="gemma3:4b")
+    parser.add_argument("--cameras", type=int, default=4)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--tile-width", type=int, default=448)
+    parser.add_argument("--timeout", type=int, default=60)
+    parser.add_argument("--images", nargs="*", default=[], help="Frames to tile; synthetic noise when omitted.")
+    args = parser.parse_args()
+
+    client = VLMClient(
+        model=args.model,
+        ollama_url=args.ollama_url,
+        timeout_sec=args.timeout,
+        use_heuristic_fallback=False,
+        raw_log_enabled=False,
+        mosaic_tile_width=args.tile_width,
+    )
+    frames = {f"cam{idx}": frame for idx, frame in enumerate(_load_frames(args.images, args.cameras))}
+    # Warm the model so the first measured call does not include the load time.
+    client.analyze_frame(next(iter(frames.values())))
+
+    for label, mosaic in (("per-frame", False), ("mosaic", True)):
+        result = _run(client, frames, args.rounds, mosaic)
+        print(
+            f"[{label}] calls={result['calls']} elapsed={result['elapsed_sec']}s "
+            f"calls/s={result['calls_per_sec']} frames/s={result['frames_per_sec']}\n"
+            f"  detection_latency_ms={result['detection_latency_ms']}"
+        )
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+import asyncio
+
+from src.api.services.admission import AdmissionController
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 500.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_token_bucket_per_source() -> None:
+    clock = FakeClock()
+    controller = AdmissionController(rate_per_sec=0.5, burst=2, clock=clock)
+
+    assert controller.try_admit("cam-a").admitted
+    assert controller.try_admit("cam-a").admitted
+    throttled = controller.try_admit("cam-a")
+    assert throttled.admitted is False
+    assert throttled.reason == "rate-limited"
+    assert throttled.retry_after_sec == 2.0
+
+    # Another source keeps its own budget.
+    assert controller.try_admit("cam-b").admitted
+
+    clock.now += 2.0
+    assert controller.try_admit("cam-a").admitted
+    assert controller.snapshot()["throttled_by_source"] == {"cam-a": 1}
+
+
+def test_fair_queue_interleaves_sources() -> None:
+    controller = AdmissionController(max_concurrent=1, max_queue_per_source=10)
+    order: list[str] = []
+
+    async def worker(source: str, gate: asyncio.Event | None = None) -> None:
+        async with controller.slot(source):
+            order.append(source)
+            if gate is not None:
+                await gate.wait()
+
+    async def scenario() -> None:
+        gate = asyncio.Event()
+        holder = asyncio.create_task(worker("noisy", gate))
+        await asyncio.sleep(0)
+        tasks = [asyncio.create_task(worker("noisy")) for _ in range(3)]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(worker("quiet")))
+        await asyncio.sleep(0)
+        assert controller.snapshot()["queued"] == 4
+        gate.set()
+        await asyncio.gather(holder, *tasks)
+
+    asyncio.run(scenario())
+    assert order[:3] == ["noisy", "noisy", "quiet"]
+    assert controller.snapshot()["active"] == 0
+    # Finish tags of drained sources are dropped rather than kept per source forever.
+    assert controller._last_finish == {}
@@ -2,6 +2,9 @@ import os
 from contextlib import contextmanager
 from typing import Iterator
 
+import pytest
+from pydantic import ValidationError
+
 from src.api.config import ApiConfig
 
 
@@ -49,3 +52,10 @@ def test_settings_env_parsing_and_url_hydration() -> None:
 def test_from_env_compatibility_method() -> None:
     config = ApiConfig.from_env()
     assert isinstance(config, ApiConfig)
+
+
+def test_routing_heuristic_max_tier_is_validated() -> None:
+    with _temporary_env({"ROUTING_HEURISTIC_MAX_TIER": " Full "}):
+        assert ApiConfig(_env_file=None).routing_heuristic_max_tier == "full"
+    with _temporary_env({"ROUTING_HEURISTIC_MAX_TIER": "premium"}), pytest.raises(ValidationError):
+        ApiConfig(_env_file=None)
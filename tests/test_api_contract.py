@@ -8,6 +8,7 @@ from src.api.config import ApiConfig
 from src.api.main import create_app
 from src.api.models import DangerResponse
 from src.api.repositories.event_repository import EventRepository
+from src.api.services.admission import AdmissionController
 
 
 class FakePipeline:
@@ -28,7 +29,10 @@ class FakeOpsPublisher:
         return {"discord": {"status": "ok"}}
 
 
-def _build_client(tmp_path: Path) -> tuple[TestClient, Path, Path]:
+def _build_client(
+    tmp_path: Path,
+    admission: AdmissionController | None = None,
+) -> tuple[TestClient, Path, Path]:
     event_log = tmp_path / "danger_events.jsonl"
     response_log = tmp_path / "danger_responses.jsonl"
 
@@ -47,6 +51,7 @@ def _build_client(tmp_path: Path) -> tuple[TestClient, Path, Path]:
             recents_max=100,
         ),
         admin_dir=Path(__file__).resolve().parents[1] / "src" / "api" / "static" / "admin",
+        admission=admission or AdmissionController(),
     )
     app = create_app(runtime=runtime)
     return TestClient(app), event_log, response_log
@@ -61,6 +66,24 @@ def test_health_contract(tmp_path: Path) -> None:
     assert "rag_mcp_enabled" in body
     assert "llm_provider" in body
     assert "gemini_model" in body
+    assert body["degradation"]["level_name"] == "normal"
+
+
+def test_camera_health_reports_show_up_in_health(tmp_path: Path) -> None:
+    client, _, _ = _build_client(tmp_path)
+    report = {
+        "source": "jetson-a",
+        "camera_id": "cam1",
+        "status": "degraded",
+        "reason": "frozen",
+        "timestamp": "2026-02-21T01:00:00+00:00",
+        "metrics": {"frozen_streak": 3},
+    }
+    assert client.post("/health/cameras", json=report).json() == {"status": "accepted"}
+
+    cameras = client.get("/health").json()["cameras"]
+    assert cameras["jetson-a/cam1"]["status"] == "degraded"
+    assert cameras["jetson-a/cam1"]["reason"] == "frozen"
 
 
 def test_danger_event_contract_and_storage(tmp_path: Path) -> None:
@@ -131,3 +154,148 @@ def test_non_danger_event_is_ignored(tmp_path: Path) -> None:
     recent = recent_res.json()
     assert recent["event_count"] == 1
     assert recent["response_count"] == 0
+
+
+def test_danger_event_throttled_per_source(tmp_path: Path) -> None:
+    client, event_log, _ = _build_client(tmp_path, admission=AdmissionController(rate_per_sec=0.01, burst=1))
+    payload = {
+        "event_id": "evt_contract_003",
+        "timestamp": "2026-02-21T01:02:03+00:00",
+        "source": "jetson-noisy",
+        "summary": "테스트 위험 상황",
+        "confidence": 0.93,
+    }
+
+    assert client.post("/events/danger", json=payload).status_code == 200
+
+    throttled_res = client.post("/events/danger", json={**payload, "event_id": "evt_contract_004"})
+    assert throttled_res.status_code == 429
+    assert int(throttled_res.headers["retry-after"]) >= 1
+    ack = throttled_res.json()
+    assert ack["status"] == "throttled"
+    assert ack["retry_after_sec"] > 0
+
+    other_res = client.post("/events/danger", json={**payload, "event_id": "evt_contract_005", "source": "jetson-quiet"})
+    assert other_res.status_code == 200
+
+    # Heartbeats from a throttled source do not use up its danger budget.
+    heartbeat = client.post("/events/danger", json={**payload, "event_id": "evt_contract_006", "is_danger": False})
+    assert heartbeat.json()["status"] == "ignored_non_danger"
+
+    # The throttled event still reaches the event log and the dashboard; only its response is skipped.
+    logged_ids = [json.loads(line)["event_id"] for line in event_log.read_text(encoding="utf-8").splitlines()]
+    assert logged_ids == ["evt_contract_003", "evt_contract_004", "evt_contract_005", "evt_contract_006"]
+    recent = client.get("/events/recent").json()
+    assert recent["event_count"] == 4 and recent["response_count"] == 2
+
+
+def test_list_events_filters_recent_events(tmp_path: Path) -> None:
+    client, _, _ = _build_client(tmp_path)
+    base = {
+        "timestamp": "2026-02-21T01:02:03+00:00",
+        "is_danger": False,
+        "summary": "정상 상황",
+    }
+    client.post("/events/danger", json={**base, "event_id": "evt_list_1", "source": "cam-a"})
+    client.post("/events/danger", json={**base, "event_id": "evt_list_2", "source": "cam-b"})
+    client.post("/events/danger", json={**base, "event_id": "evt_list_3", "source": "cam-a"})
+
+    page = client.get("/events", params={"source": "cam-a", "limit": 1}).json()
+    assert [item["event_id"] for item in page["events"]] == ["evt_list_3"]
+    next_page = client.get("/events", params={"source": "cam-a", "limit": 1, "cursor": page["next_cursor"]}).json()
+    assert [item["event_id"] for item in next_page["events"]] == ["evt_list_1"]
+    assert next_page["next_cursor"] is None
+
+
+def test_recent_snapshot_etag_and_since_delta(tmp_path: Path) -> None:
+    client, _, _ = _build_client(tmp_path)
+    base = {
+        "timestamp": "2026-02-21T01:02:03+00:00",
+        "source": "jetson-orin-nano-01",
+        "is_danger": False,
+        "summary": "정상 상황",
+    }
+    client.post("/events/danger", json={**base, "event_id": "evt_etag_1"})
+
+    first = client.get("/events/recent")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    version = first.json()["version"]
+    assert first.json()["delta"] is False
+
+    assert client.get("/events/recent", headers={"If-None-Match": etag}).status_code == 304
+
+    client.post("/events/danger", json={**base, "event_id": "evt_etag_2"})
+    assert client.get("/events/recent", headers={"If-None-Match": etag}).status_code == 200
+
+    epoch = first.json()["epoch"]
+    delta = client.get("/events/recent", params={"since": version, "epoch": epoch}).json()
+    assert delta["delta"] is True
+    assert [item["event_id"] for item in delta["events"]] == ["evt_etag_2"]
+
+    future = client.get("/events/recent", params={"since": version + 100, "epoch": epoch}).json()
+    assert future["delta"] is False
+    assert future["event_count"] == 2
+
+
+def test_recent_snapshot_cursor_from_previous_run_gets_full_snapshot(tmp_path: Path) -> None:
+    client, _, _ = _build_client(tmp_path)
+    base = {
+        "timestamp": "2026-02-21T01:02:03+00:00",
+        "source": "jetson-orin-nano-01",
+        "is_danger": False,
+        "summary": "정상 상황",
+    }
+    client.post("/events/danger", json={**base, "event_id": "evt_boot_1"})
+    before = client.get("/events/recent")
+    etag, cursor = before.headers["etag"], before.json()
+
+    # Same version number after a restart, but a different run: no false 304, no partial delta.
+    restarted, _, _ = _build_client(tmp_path)
+    restarted.post("/events/danger", json={**base, "event_id": "evt_boot_2"})
+    assert restarted.get("/events/recent", headers={"If-None-Match": etag}).status_code == 200
+    snapshot = restarted.get("/events/recent", params={"since": 0, "epoch": cursor["epoch"]}).json()
+    assert snapshot["delta"] is False and snapshot["epoch"] != cursor["epoch"]
+    assert restarted.get("/events/recent", params={"since": 0}).json()["delta"] is False
+
+
+def test_stats_aggregates_events_and_responses(tmp_path: Path) -> None:
+    client, _, _ = _build_client(tmp_path)
+    base = {
+        "timestamp": "2026-02-21T01:02:03+00:00",
+        "source": "jetson-orin-nano-01",
+        "summary": "불꽃과 연기 감지",
+        "confidence": 0.85,
+        "metadata": {"scenario": "fire"},
+    }
+    client.post("/events/danger", json={**base, "event_id": "evt_stats_1", "is_danger": True})
+    client.post("/events/danger", json={**base, "event_id": "evt_stats_2", "is_danger": False})
+
+    body = client.get("/stats", params={"window": "1h"}).json()
+    assert body["events"] == 2
+    assert body["responses"] == 1
+    assert body["by_source"] == {"jetson-orin-nano-01": 2}
+    assert body["by_hazard"] == {"fire": 2}
+    assert body["rag_source_ratio"] == {"mcp": 1.0}
+    assert body["confidence"]["avg"] == 0.85
+    assert body["latency_ms"]["p95"] is not None
+    assert client.get("/stats", params={"window": "2y"}).status_code == 400
+
+
+def test_search_events_by_korean_text(tmp_path: Path) -> None:
+    client, _, _ = _build_client(tmp_path)
+    client.post(
+        "/events/danger",
+        json={
+            "event_id": "evt_search_1",
+            "timestamp": "2026-02-21T01:02:03+00:00",
+            "source": "jetson-orin-nano-01",
+            "is_danger": True,
+            "summary": "배전반에서 스파크 발생",
+        },
+    )
+
+    body = client.get("/events/search", params={"q": "스파크"}).json()
+    assert [hit["event_id"] for hit in body["hits"]] == ["evt_search_1"]
+    assert client.get("/events/search", params={"q": "운영자 대응"}).json()["hits"][0]["event_id"] == "evt_search_1"
+    assert client.get("/events/search", params={"q": "!!"}).status_code == 400
@@ -0,0 +1,114 @@
+from src.api.services.degradation import DegradationController
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _controller(clock: FakeClock) -> DegradationController:
+    return DegradationController(
+        latency_slo_sec=2.0,
+        max_inflight=4,
+        window_sec=60.0,
+        min_samples=3,
+        step_cooldown_sec=10.0,
+        recover_ratio=0.5,
+        clock=clock,
+    )
+
+
+def test_steps_down_on_latency_breach_with_cooldown() -> None:
+    clock = FakeClock()
+    controller = _controller(clock)
+    for _ in range(3):
+        controller.record("total", 5.0)
+    assert controller.policy().level_name == "skip-tts"
+    assert controller.policy().skip_tts is True
+
+    for _ in range(3):
+        controller.record("total", 5.0)
+    # Still inside the step cooldown window.
+    assert controller.level == 1
+
+    clock.now += 11
+    for _ in range(3):
+        controller.record("total", 5.0)
+    policy = controller.policy()
+    assert policy.level_name == "local-rag"
+    assert policy.local_rag_only is True
+    assert policy.template_only is False
+
+
+def test_recovers_with_hysteresis() -> None:
+    clock = FakeClock()
+    controller = _controller(clock)
+    for _ in range(3):
+        controller.record("total", 5.0)
+    assert controller.level == 1
+
+    clock.now += 11
+    # A single fast reply right after a step is not enough evidence to step back.
+    controller.record("total", 0.5)
+    assert controller.level == 1
+    for _ in range(3):
+        controller.record("total", 1.5)
+    # Below the SLO but above the recovery threshold: hold the level.
+    assert controller.level == 1
+
+    clock.now += 9
+    for _ in range(80):
+        controller.record("total", 0.5)
+    assert controller.level == 0
+    snapshot = controller.snapshot()
+    assert snapshot["level_name"] == "normal"
+    # The window restarted at the level change.
+    assert snapshot["stages"]["total"]["samples"] < 80
+
+
+def test_recovers_at_low_traffic_after_a_burst() -> None:
+    clock = FakeClock()
+    controller = _controller(clock)
+    for _ in range(3):
+        for _ in range(3):
+            controller.record("total", 5.0)
+        clock.now += 11
+    assert controller.level_name == "template"
+
+    # One fast reply every 30 s never fills the window to min_samples, yet each quiet window steps back once.
+    levels = []
+    for _ in range(12):
+        clock.now += 30
+        controller.record("total", 0.4)
+        levels.append(controller.level)
+    assert levels[-1] == 0
+    assert levels.count(3) >= 1 and levels.count(2) >= 2
+
+    # A slow reply in a thin window restarts the quiet period instead of being ignored.
+    for _ in range(3):
+        controller.record("total", 5.0)
+    assert controller.level == 1
+    clock.now += 61
+    controller.record("total", 1.5)
+    clock.now += 30
+    assert controller.snapshot()["level_name"] == "skip-tts"
+    clock.now += 31
+    assert controller.snapshot()["level_name"] == "normal"
+
+
+def test_queue_depth_breach_and_disabled_controller() -> None:
+    clock = FakeClock()
+    controller = _controller(clock)
+    contexts = [controller.track() for _ in range(5)]
+    for ctx in contexts:
+        ctx.__enter__()
+    assert controller.level == 1
+    for ctx in contexts:
+        ctx.__exit__(None, None, None)
+
+    disabled = DegradationController(enabled=False, latency_slo_sec=0.001, min_samples=1, clock=clock)
+    disabled.record("total", 10.0)
+    assert disabled.policy().level_name == "normal"
@@ -0,0 +1,158 @@
+import base64
+import io
+import threading
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+from src.edge.capture_sources import (
+    EncodedFrame,
+    JpegDirectorySource,
+    PassthroughSource,
+    iter_multipart_jpegs,
+    open_capture_source,
+)
+from src.edge import cameras
+from src.edge.cameras import CameraSpec, CameraWorker
+from src.edge.frame_ring import SharedFrameRing, ring_name
+from src.edge.vlm_client import VLMClient
+
+
+def _jpeg(value: int) -> bytes:
+    ok, encoded = cv2.imencode(".jpg", np.full((48, 64, 3), value, dtype=np.uint8))
+    assert ok
+    return encoded.tobytes()
+
+
+def test_multipart_parser_handles_length_and_boundary_delimited_parts() -> None:
+    first, second = _jpeg(10), _jpeg(200)
+    body = (
+        b"--frame\r\nContent-Type: image/jpeg\r\nContent-Length: " + str(len(first)).encode() + b"\r\n\r\n"
+        + first + b"\r\n"
+        + b"--frame\r\nContent-Type: image/jpeg\r\n\r\n"
+        + second + b"\r\n"
+        + b"--frame--\r\n"
+    )
+    assert list(iter_multipart_jpegs(io.BytesIO(body), b"frame")) == [first, second]
+
+
+def test_directory_source_passes_jpeg_bytes_to_the_vlm_untouched(tmp_path: Path) -> None:
+    payloads = [_jpeg(value) for value in (20, 40, 60)]
+    for idx, payload in enumerate(payloads):
+        (tmp_path / f"{idx:03d}.jpg").write_bytes(payload)
+    (tmp_path / "notes.txt").write_text("ignored", encoding="utf-8")
+
+    source = open_capture_source(f"jpegdir:{tmp_path}")
+    assert isinstance(source, JpegDirectorySource)
+    frames = []
+    while source.grab():
+        ok, frame = source.retrieve()
+        assert ok and isinstance(frame, EncodedFrame)
+        frames.append(frame)
+    assert [frame.jpeg for frame in frames] == payloads
+
+    assert VLMClient._encode_frame_to_base64(frames[0]) == base64.b64encode(payloads[0]).decode("ascii")
+    assert frames[0].preview().shape == (6, 8, 3)
+    assert frames[0].pixels().shape == (48, 64, 3)
+
+
+def test_worker_and_ring_carry_encoded_frames(tmp_path: Path) -> None:
+    for idx in range(5):
+        (tmp_path / f"{idx:03d}.jpg").write_bytes(_jpeg(idx * 40))
+    spec = CameraSpec(camera_id="cam0", source=f"jpegdir:{tmp_path}", min_interval_sec=1.0, max_interval_sec=3.0)
+    worker = CameraWorker(spec)
+    worker.start()
+    try:
+        deadline = time.monotonic() + 5.0
+        seq, frame = worker.latest()
+        # A frame grabbed mid-read comes back empty once and is decoded on the next ask.
+        while frame is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+            seq, frame = worker.latest()
+        assert seq >= 1 and isinstance(frame, EncodedFrame)
+        assert worker.frame_stats()["buffer_allocations"] == 0
+    finally:
+        worker.stop()
+
+    ring = SharedFrameRing(ring_name("test", "jpeg", str(time.monotonic_ns())), slots=3, slot_bytes=64 * 48 * 3, create=True)
+    try:
+        ring.write(frame)
+        _, carried = ring.latest()
+        assert isinstance(carried, EncodedFrame) and carried.jpeg == frame.jpeg
+    finally:
+        ring.close()
+        ring.unlink()
+
+
+def test_passthrough_source_requires_a_jpeg_producer() -> None:
+    class Incomplete(PassthroughSource):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()  # type: ignore[abstract]
+
+
+class _GatedCapture:
+    # Each grab() waits for a permit, like a camera that has stopped delivering frames.
+    def __init__(self) -> None:
+        self.permits = threading.Semaphore(0)
+        self.value = 0
+
+    def isOpened(self) -> bool:  # noqa: N802 - mirrors cv2.VideoCapture
+        return True
+
+    def grab(self) -> bool:
+        self.permits.acquire()
+        self.value += 1
+        return True
+
+    def retrieve(self, image: np.ndarray | None = None) -> tuple[bool, np.ndarray]:
+        return True, np.full((24, 32, 3), self.value, dtype=np.uint8)
+
+    def release(self) -> None:
+        return None
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> None:  # type: ignore[no-untyped-def]
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    assert predicate()
+
+
+def test_latest_never_waits_on_a_stalled_grab(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    capture = _GatedCapture()
+    monkeypatch.setattr(cameras, "open_capture_source", lambda source: capture)
+    worker = CameraWorker(CameraSpec(camera_id="cam0", source=0, min_interval_sec=1.0, max_interval_sec=3.0))
+    worker.start()
+    try:
+        capture.permits.release()
+        _wait_for(lambda: worker.latest_seq == 1)
+        # The first frame feeds the motion probe, so it is already decoded.
+        _wait_for(lambda: worker.latest()[1] is not None)
+        seq, frame = worker.latest()
+        assert seq == 1 and int(frame[0, 0, 0]) == 1
+
+        # The reader is now blocked inside grab(); latest() answers at once.
+        started = time.monotonic()
+        assert worker.latest()[0] == 1
+        assert time.monotonic() - started < 0.1
+
+        # A frame grabbed between probes is not decoded until asked for; the ask is served by the next grab.
+        capture.permits.release()
+        _wait_for(lambda: worker.latest_seq == 2)
+        started = time.monotonic()
+        assert worker.latest() == (2, None)
+        assert time.monotonic() - started < 0.1
+        capture.permits.release()
+        _wait_for(lambda: worker.latest_seq == 3)
+        seq, frame = worker.latest()
+        assert seq == 3 and int(frame[0, 0, 0]) == 3
+        assert worker.frame_stats()["decoded"] == 2
+    finally:
+        worker._stop.set()
+        capture.permits.release()
+        worker.stop()
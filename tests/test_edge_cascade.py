@@ -0,0 +1,79 @@
+import numpy as np
+
+from src.edge.cascade import CascadeDetector, probe_image
+from src.edge.frame_ring import SharedFrameRing, ring_name
+
+
+def _scene() -> np.ndarray:
+    # Textured grey background so contrast-based features have something to compare against.
+    rng = np.random.default_rng(3)
+    return rng.integers(60, 160, size=(120, 160, 3), dtype=np.uint8)
+
+
+def test_static_scene_never_fires() -> None:
+    detector = CascadeDetector(fps=10)
+    scene = _scene()
+    hits = [detector.update(scene, now=idx * 0.1) for idx in range(40)]
+    assert hits == [None] * 40
+    assert detector.updates == 40
+
+
+def test_flickering_flame_fires_in_its_tile_and_respects_retrigger() -> None:
+    detector = CascadeDetector(fps=10, retrigger_sec=5.0)
+    scene = _scene()
+    for idx in range(15):
+        detector.update(scene, now=idx * 0.1)
+
+    hits = []
+    for idx in range(15, 30):
+        frame = scene.copy()
+        if idx % 2:
+            # Orange blob in the bottom-right tile (rows 90-119, cols 120-159).
+            frame[92:118, 122:158] = (20, 120, 240)
+        hits.append(detector.update(frame, now=idx * 0.1))
+
+    fired = [hit for hit in hits if hit is not None]
+    assert len(fired) == 1
+    assert fired[0].tile == (3, 3)
+    assert fired[0].reason in {"fire_color", "flicker", "flash"}
+
+
+def test_haze_fires_when_contrast_collapses() -> None:
+    detector = CascadeDetector(fps=10)
+    scene = _scene()
+    for idx in range(20):
+        detector.update(scene, now=idx * 0.1)
+    hazy = np.full_like(scene, 110)
+    hits = [detector.update(hazy, now=2.0 + idx * 0.1) for idx in range(3)]
+    fired = [hit for hit in hits if hit is not None]
+    assert fired and fired[0].reason == "haze"
+
+
+def test_ring_carries_cascade_hits() -> None:
+    detector = CascadeDetector(fps=10, persist_updates=1)
+    scene = _scene()
+    detector.update(probe_image(scene), now=1.0)
+    frame = scene.copy()
+    frame[:30, :40] = (20, 120, 240)
+    hit = detector.update(frame, now=1.2)
+    assert hit is not None and hit.tile == (0, 0)
+
+    ring = SharedFrameRing(ring_name("test", "cascade"), slots=3, slot_bytes=64, create=True)
+    try:
+        assert ring.last_cascade is None
+        ring.mark_cascade(hit)
+        carried = ring.last_cascade
+        assert carried is not None
+        assert (carried.reason, carried.tile, carried.at) == (hit.reason, hit.tile, hit.at)
+        assert abs(carried.score - hit.score) < 1e-3
+    finally:
+        ring.close()
+        ring.unlink()
+
+
+def test_static_red_object_does_not_keep_firing() -> None:
+    detector = CascadeDetector(fps=10)
+    scene = _scene()
+    scene[:30, :40] = (20, 120, 240)
+    hits = [detector.update(scene, now=idx * 0.1) for idx in range(60)]
+    assert hits == [None] * 60
@@ -0,0 +1,50 @@
+import pytest
+
+from src.edge.confirmation import TemporalConfirmer
+
+
+def test_immediate_policy_alerts_on_every_positive() -> None:
+    confirmer = TemporalConfirmer("immediate")
+    decision = confirmer.observe("cam0", True, 10.0)
+    assert decision.local_alert and decision.escalate and not decision.pending
+    assert not confirmer.observe("cam0", False, 11.0).local_alert
+    assert confirmer.stats()["confirm_latency_ms_p50"] == 0.0
+
+    with pytest.raises(ValueError):
+        TemporalConfirmer("majority")
+
+
+def test_k_of_n_waits_for_votes_and_counts_expired_episodes() -> None:
+    confirmer = TemporalConfirmer("k_of_n", k=2, n=3, window_sec=10.0)
+    first = confirmer.observe("cam0", True, 100.0)
+    assert not first.local_alert and not first.escalate and first.pending
+    assert confirmer.observe("cam0", False, 101.0).pending
+    second = confirmer.observe("cam0", True, 102.0)
+    assert second.local_alert and second.escalate and not second.pending
+    assert second.as_meta("k_of_n") == {"policy": "k_of_n", "votes": 2, "window": 3, "confirmed": True}
+
+    # A lone positive on another camera never confirms and is suppressed once the window passes.
+    assert confirmer.observe("cam1", True, 100.0).pending
+    assert not confirmer.observe("cam1", False, 105.0).escalate
+    confirmer.sweep(111.0)
+    stats = confirmer.stats()
+    assert stats["first_positives"] == 2
+    assert stats["confirmed"] == 1
+    assert stats["suppressed_unconfirmed"] == 1
+    assert stats["confirm_latency_ms_max"] == 2000.0
+
+
+def test_k_of_n_votes_expire_with_the_window() -> None:
+    confirmer = TemporalConfirmer("k_of_n", k=2, n=3, window_sec=5.0)
+    confirmer.observe("cam0", True, 100.0)
+    decision = confirmer.observe("cam0", True, 106.0)
+    assert decision.votes == 1 and not decision.escalate and decision.pending
+
+
+def test_local_first_alerts_locally_then_escalates_on_confirmation() -> None:
+    confirmer = TemporalConfirmer("local_first", k=2, n=3, window_sec=10.0)
+    first = confirmer.observe("cam0:bay", True, 50.0)
+    assert first.local_alert and not first.escalate and first.pending
+    second = confirmer.observe("cam0:bay", True, 51.0)
+    assert second.local_alert and second.escalate
+    assert confirmer.stats()["local_only_alerts"] == 1
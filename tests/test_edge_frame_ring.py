@@ -0,0 +1,167 @@
+import multiprocessing
+import os
+import signal
+import time
+import uuid
+from multiprocessing import shared_memory
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+from src.edge.cameras import CameraSpec, FrameBufferPool, ProcessCameraWorker, process_memory_stats
+from src.edge.frame_ring import SharedFrameRing, ring_name
+
+
+def _frame(value: int, shape: tuple[int, int, int] = (24, 32, 3)) -> np.ndarray:
+    return np.full(shape, value, dtype=np.uint8)
+
+
+def _name() -> str:
+    return ring_name("test", uuid.uuid4().hex[:8])
+
+
+def test_ring_returns_latest_frame_without_overwriting_pinned_slot() -> None:
+    writer = SharedFrameRing(_name(), slots=3, slot_bytes=32 * 24 * 3, create=True)
+    reader = SharedFrameRing(writer.name, slots=3, slot_bytes=writer.slot_bytes)
+    try:
+        assert reader.latest() == (0, None)
+        writer.write(_frame(1))
+        seq, view = reader.latest()
+        assert seq == 1 and view is not None and int(view[0, 0, 0]) == 1
+
+        # The reader keeps looking at frame 1 while the writer laps the ring several times.
+        for value in range(2, 10):
+            writer.write(_frame(value))
+        assert int(view[0, 0, 0]) == 1
+
+        seq, view = reader.latest()
+        assert seq == 9 and int(view[0, 0, 0]) == 9
+        assert reader.heartbeat_age_sec < 5.0
+    finally:
+        reader.close()
+        writer.close()
+        writer.unlink()
+
+
+def test_ring_downscales_oversized_frames_and_shares_counters() -> None:
+    writer = SharedFrameRing(_name(), slots=3, slot_bytes=32 * 24 * 3, create=True)
+    reader = SharedFrameRing(writer.name, slots=3, slot_bytes=writer.slot_bytes)
+    try:
+        writer.write(_frame(5, shape=(96, 128, 3)))
+        _, view = reader.latest()
+        assert view is not None and view.nbytes <= writer.slot_bytes and view.shape[2] == 3
+
+        writer.add_read_failure()
+        writer.mark_motion(12.5)
+        writer.set_scene_change(9.25)
+        assert reader.read_failures == 1
+        assert reader.last_motion == pytest.approx(12.5)
+        assert reader.scene_change == pytest.approx(9.25)
+    finally:
+        reader.close()
+        writer.close()
+        writer.unlink()
+
+
+def _clip(tmp_path: Path, frames: int = 20) -> Path:
+    video = tmp_path / "clip.avi"
+    out = cv2.VideoWriter(str(video), cv2.VideoWriter_fourcc(*"MJPG"), 10.0, (64, 48))
+    for idx in range(frames):
+        out.write(_frame(idx * 5 % 256, shape=(48, 64, 3)))
+    out.release()
+    return video
+
+
+def test_buffer_pool_reuses_arrays_and_keeps_the_handed_out_frame(tmp_path: Path) -> None:
+    cap = cv2.VideoCapture(str(_clip(tmp_path)))
+    pool = FrameBufferPool(slots=2)
+    try:
+        assert cap.grab()
+        kept = pool.retrieve(cap)
+        assert kept is not None
+        kept_value = int(kept[0, 0, 0])
+        decoded = []
+        while cap.grab():
+            frame = pool.retrieve(cap, keep=(kept,))
+            assert frame is not None and frame is not kept
+            decoded.append(frame)
+    finally:
+        cap.release()
+
+    assert int(kept[0, 0, 0]) == kept_value
+    assert len(decoded) == 19
+    assert pool.allocations == 2
+    assert pool.reuses == 18
+    assert process_memory_stats()["rss_mb"] > 0
+
+
+def test_process_worker_streams_frames_and_releases_ring(tmp_path: Path) -> None:
+    video = _clip(tmp_path)
+
+    spec = CameraSpec(camera_id="cam0", source=str(video), min_interval_sec=1.0, max_interval_sec=3.0)
+    worker = ProcessCameraWorker(spec, ring_name=_name(), slots=3, slot_bytes=64 * 48 * 3)
+    worker.start()
+    try:
+        deadline = time.monotonic() + 20.0
+        seq, frame = worker.latest()
+        while seq == 0 and time.monotonic() < deadline:
+            time.sleep(0.1)
+            worker.supervise()
+            seq, frame = worker.latest()
+        assert seq > 0 and frame is not None and frame.shape == (48, 64, 3)
+    finally:
+        frame = None
+        worker.stop()
+
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=worker.ring_name)
+
+
+def _orphaning_parent(source: str, name: str, pids: "multiprocessing.Queue[int]") -> None:
+    spec = CameraSpec(camera_id="cam0", source=source, min_interval_sec=1.0, max_interval_sec=3.0)
+    worker = ProcessCameraWorker(spec, ring_name=name, slots=3, slot_bytes=64 * 48 * 3)
+    worker.start()
+    assert worker._process is not None
+    pids.put(worker._process.pid)
+    time.sleep(60)
+
+
+def _running(pid: int) -> bool:
+    try:
+        with open(f"/proc/{pid}/stat", encoding="ascii") as handle:
+            return handle.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/stat"), reason="needs /proc")
+def test_capture_process_exits_when_the_orchestrator_is_killed(tmp_path: Path) -> None:
+    # Once the few frames run out the child keeps retrying reads, like a device that went quiet.
+    frames = tmp_path / "frames"
+    frames.mkdir()
+    for idx in range(3):
+        cv2.imwrite(str(frames / f"{idx:03d}.jpg"), _frame(idx * 60, shape=(48, 64, 3)))
+    ctx = multiprocessing.get_context("spawn")
+    pids: "multiprocessing.Queue[int]" = ctx.Queue()
+    name = _name()
+    parent = ctx.Process(target=_orphaning_parent, args=(f"jpegdir:{frames}", name, pids))
+    parent.start()
+    try:
+        child_pid = pids.get(timeout=20.0)
+        assert _running(child_pid)
+        os.kill(parent.pid, signal.SIGKILL)
+        parent.join(timeout=5.0)
+
+        deadline = time.monotonic() + 10.0
+        while _running(child_pid) and time.monotonic() < deadline:
+            time.sleep(0.1)
+        assert not _running(child_pid)
+    finally:
+        if parent.is_alive():
+            parent.kill()
+        try:
+            shared_memory.SharedMemory(name=name).unlink()
+        except FileNotFoundError:
+            pass
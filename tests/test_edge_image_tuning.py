@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from src.edge.image_tuning import ImageController, ImageSettings, encode_image
+
+
+def test_encode_image_downscales_to_max_side() -> None:
+    frame = np.zeros((720, 1280, 3), dtype=np.uint8)
+    _, meta = encode_image(frame, ImageSettings(max_side=640, jpeg_quality=70))
+    assert (meta["width"], meta["height"]) == (640, 360)
+    assert meta["jpeg_quality"] == 70
+
+    _, native = encode_image(frame, ImageSettings(max_side=0, jpeg_quality=85))
+    assert (native["width"], native["height"]) == (1280, 720)
+
+
+def test_auto_controller_steps_down_over_budget_and_recovers() -> None:
+    controller = ImageController(mode="auto", latency_budget_ms=1000.0, min_side=448)
+    assert controller.settings == ImageSettings(0, 85)
+
+    for _ in range(ImageController.STEP_DOWN_AFTER):
+        controller.observe(total_duration_ns=3_000_000_000, prompt_eval_count=300)
+    assert controller.settings == ImageSettings(1280, 85)
+
+    # Fast replies at the smaller size walk back up, but not while the richer level is known to be slow.
+    for _ in range(ImageController.STEP_UP_AFTER):
+        controller.observe(total_duration_ns=200_000_000)
+    assert controller.settings == ImageSettings(1280, 85)
+    for _ in range(ImageController.STEP_UP_AFTER):
+        controller.observe(total_duration_ns=200_000_000)
+    assert controller.settings == ImageSettings(0, 85)
+
+    stats = controller.stats()
+    assert stats["changes"] == 2
+    assert stats["levels"]["native@q85"]["prompt_eval_count"] == pytest.approx(300)
+
+
+def test_fixed_controller_ignores_latency() -> None:
+    controller = ImageController(mode="fixed", max_side=896, jpeg_quality=75)
+    for _ in range(10):
+        controller.observe(total_duration_ns=9_000_000_000)
+    assert controller.settings == ImageSettings(896, 75)
+    _, meta = controller.encode(np.zeros((1080, 1920, 3), dtype=np.uint8))
+    assert (meta["width"], meta["mode"]) == (896, "fixed")
+
+
+def test_ceiling_caps_settings_and_pauses_auto_tuning() -> None:
+    controller = ImageController(mode="auto", max_side=0, latency_budget_ms=1000.0)
+    controller.set_ceiling(640)
+    assert controller.settings == ImageSettings(640, 75)
+    for _ in range(5):
+        controller.observe(5_000_000_000)
+    assert controller.changes == 0
+
+    _, meta = controller.encode(np.zeros((480, 1280, 3), dtype=np.uint8))
+    assert meta["ceiling"] == 640 and meta["width"] == 640
+
+    controller.set_ceiling(None)
+    assert controller.settings == ImageSettings(0, 85)
+
+    fixed = ImageController(mode="fixed", max_side=512, jpeg_quality=90)
+    fixed.set_ceiling(896)
+    assert fixed.settings == ImageSettings(512, 90)
@@ -1,7 +1,21 @@
 import base64
+import json
+import time
+from pathlib import Path
+from typing import Any
 
+import numpy as np
+
+from src.edge.cameras import CameraSpec
+from src.edge.cascade import CascadeHit
 from src.edge.config import EdgeConfig
-from src.edge.orchestrator import build_danger_payload, extract_tts_summary, extract_tts_wav_bytes
+from src.edge.orchestrator import (
+    EdgeOrchestrator,
+    build_danger_payload,
+    extract_tts_summary,
+    extract_tts_wav_bytes,
+    is_throttled_ack,
+)
 
 
 def test_extract_tts_summary_from_ack() -> None:
@@ -19,6 +33,11 @@ def test_extract_tts_wav_bytes_from_ack() -> None:
     assert extract_tts_wav_bytes(ack) == raw
 
 
+def test_is_throttled_ack() -> None:
+    assert is_throttled_ack({"status": "throttled", "retry_after_sec": 2.0}) is True
+    assert is_throttled_ack({"status": "accepted"}) is False
+
+
 def test_build_danger_payload_shape() -> None:
     cfg = EdgeConfig()
     payload = build_danger_payload(
@@ -36,3 +55,187 @@ def test_build_danger_payload_shape() -> None:
     assert payload["metadata"]["classification"] == "DANGER"
     assert payload["is_danger"] is True
     assert isinstance(payload["timestamp"], str)
+
+
+def _textured(seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return rng.integers(40, 200, size=(240, 320, 3), dtype=np.uint8)
+
+
+def _dark(level: int = 5) -> np.ndarray:
+    return np.full((240, 320, 3), level, dtype=np.uint8)
+
+
+class _FakeWorker:
+    def __init__(self, camera_id: str, min_interval_sec: float = 0.0) -> None:
+        self.spec = CameraSpec(camera_id=camera_id, source=0, min_interval_sec=min_interval_sec, max_interval_sec=600.0)
+        self.latest_seq = 0
+        self.last_motion = 0.0
+        self.last_cascade: CascadeHit | None = None
+        self.scene_change = 0.0
+        self._frame: np.ndarray | None = None
+
+    def push(self, frame: np.ndarray) -> None:
+        self.latest_seq += 1
+        self._frame = frame
+
+    def latest(self) -> tuple[int, np.ndarray | None]:
+        return self.latest_seq, self._frame
+
+    def supervise(self) -> None:
+        return None
+
+    def frame_stats(self) -> dict[str, Any]:
+        return {}
+
+
+class _ScriptedVLM:
+    # Calls a target DANGER when its key is listed: "camera:zone" for mosaic tiles, "frame" for a single frame.
+    def __init__(self, danger: set[str]) -> None:
+        self.danger = danger
+        self.calls: list[list[str]] = []
+
+    def _verdict(self, key: str) -> tuple[bool, str, float, dict[str, Any]]:
+        is_danger = key in self.danger
+        return is_danger, "연기 감지" if is_danger else "이상 없음", 0.9, {"provider": "fake"}
+
+    def analyze_frame(self, image: np.ndarray) -> tuple[bool, str, float, dict[str, Any]]:
+        self.calls.append(["frame"])
+        return self._verdict("frame")
+
+    def analyze_mosaic(self, images: dict[str, np.ndarray]) -> dict[str, tuple[bool, str, float, dict[str, Any]]]:
+        self.calls.append(list(images))
+        return {key: self._verdict(key) for key in images}
+
+
+class _Client:
+    def __init__(self) -> None:
+        self.sent: list[dict[str, Any]] = []
+
+    def send(self, payload: dict[str, Any]) -> dict[str, Any]:
+        self.sent.append(payload)
+        return {"status": "accepted"}
+
+    def send_health(self, endpoint: str, payload: dict[str, Any]) -> None:
+        return None
+
+
+class _Alerts:
+    def __init__(self) -> None:
+        self.triggered = 0
+        self.spoken: list[str] = []
+
+    def trigger_danger(self, duration_sec: float) -> None:
+        self.triggered += 1
+
+    def speak(self, text: str) -> None:
+        self.spoken.append(text)
+
+
+def _orchestrator(cfg: EdgeConfig, vlm: _ScriptedVLM, workers: list[_FakeWorker]) -> tuple[EdgeOrchestrator, Any]:
+    orchestrator = EdgeOrchestrator(cfg, alerts=_Alerts(), client=_Client(), vlm=vlm)  # type: ignore[arg-type]
+    state = orchestrator._new_loop_state([worker.spec for worker in workers], {w.spec.camera_id: w for w in workers})
+    return orchestrator, state
+
+
+def test_cascade_hit_is_confirmed_by_a_burst_sample_before_escalating() -> None:
+    cfg = EdgeConfig(
+        thermal_enabled=False,
+        confirm_policy="k_of_n",
+        confirm_k=2,
+        confirm_n=3,
+        confirm_burst_interval_sec=0.0,
+    )
+    vlm = _ScriptedVLM(danger=set())
+    # A long sampling interval: only the cascade hit and the confirmation burst make the camera due again.
+    worker = _FakeWorker("cam0", min_interval_sec=600.0)
+    orchestrator, state = _orchestrator(cfg, vlm, [worker])
+
+    worker.push(_textured(0))
+    assert orchestrator._step(state)
+    worker.push(_textured(1))
+    assert not orchestrator._step(state)
+
+    # The cascade asks the VLM to look now; the frame is dark, yet the hit lets it through the gate.
+    vlm.danger = {"frame"}
+    worker.last_cascade = CascadeHit(reason="flame", tile=(1, 2), score=0.8, at=time.monotonic())
+    worker.push(_dark())
+    assert orchestrator._step(state)
+    assert orchestrator.client.sent == []
+    assert state.confirm_pending == {"cam0"} and not state.pending_cascade
+
+    # The burst sample is dark too but not a repeat, so the open vote lets it through as well.
+    worker.push(_dark(6))
+    assert orchestrator._step(state)
+    assert len(orchestrator.client.sent) == 1
+    meta = orchestrator.client.sent[0]["metadata"]
+    assert meta["confirmation"] == {"policy": "k_of_n", "votes": 2, "window": 3, "confirmed": True}
+    assert meta["quality_warnings"] == ["dark"] and "trigger" not in meta
+    assert orchestrator.alerts.triggered == 1
+    assert not state.confirm_pending
+
+
+def test_zone_votes_confirm_per_zone_and_share_the_cooldown(tmp_path: Path) -> None:
+    zones_path = tmp_path / "zones.json"
+    zones_path.write_text(
+        json.dumps(
+            {
+                "cam0": [
+                    {"zone_id": "left", "polygon": [[0, 0], [0.5, 0], [0.5, 1], [0, 1]], "scenario": "fire"},
+                    {"zone_id": "right", "polygon": [[0.5, 0], [1, 0], [1, 1], [0.5, 1]]},
+                ]
+            }
+        ),
+        encoding="utf-8",
+    )
+    cfg = EdgeConfig(
+        thermal_enabled=False,
+        camera_zones_path=str(zones_path),
+        confirm_policy="k_of_n",
+        confirm_k=2,
+        confirm_n=2,
+        confirm_burst_interval_sec=0.0,
+    )
+    vlm = _ScriptedVLM(danger={"cam0:left"})
+    worker = _FakeWorker("cam0")
+    orchestrator, state = _orchestrator(cfg, vlm, [worker])
+
+    worker.push(_textured(0))
+    assert orchestrator._step(state)
+    assert vlm.calls == [["cam0:left", "cam0:right"]]
+    assert orchestrator.client.sent == [] and state.confirm_pending == {"cam0"}
+
+    worker.push(_textured(1))
+    assert orchestrator._step(state)
+    assert len(orchestrator.client.sent) == 1
+    meta = orchestrator.client.sent[0]["metadata"]
+    assert (meta["zone_id"], meta["scenario"]) == ("left", "fire")
+    assert meta["zone_verdicts"] == {"left": "DANGER", "right": "SAFE"}
+
+    # The left zone is still burning, but its cooldown holds the next escalation back.
+    worker.push(_textured(2))
+    assert orchestrator._step(state)
+    assert len(orchestrator.client.sent) == 1
+    assert set(state.last_escalated) == {"cam0:left"}
+
+
+def test_rejected_frame_retries_the_camera_after_the_quality_delay() -> None:
+    cfg = EdgeConfig(thermal_enabled=False)
+    vlm = _ScriptedVLM(danger=set())
+    worker = _FakeWorker("cam0")
+    orchestrator, state = _orchestrator(cfg, vlm, [worker])
+    orchestrator.QUALITY_RETRY_SEC = 0.2
+
+    worker.push(_dark())
+    assert orchestrator._step(state)
+    assert vlm.calls == [] and state.quality_retry_at["cam0"] > time.monotonic()
+
+    # A fresh frame waits out the retry delay instead of being picked at once.
+    worker.push(_textured(0))
+    assert not orchestrator._step(state)
+    assert vlm.calls == []
+
+    time.sleep(0.25)
+    assert orchestrator._step(state)
+    assert vlm.calls == [["frame"]]
+    assert orchestrator.client.sent == [] and orchestrator.alerts.triggered == 0
@@ -0,0 +1,93 @@
+import cv2
+import numpy as np
+
+from src.edge.capture_sources import EncodedFrame
+from src.edge.config import EdgeConfig
+from src.edge.orchestrator import EdgeOrchestrator
+from src.edge.quality import FrameQualityGate
+
+
+def _textured(seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return rng.integers(40, 200, size=(240, 320, 3), dtype=np.uint8)
+
+
+def test_gate_rejects_only_unlit_dark_frames_and_warns_on_exposure_and_blur() -> None:
+    gate = FrameQualityGate()
+    assert gate.check("cam0", _textured(1)).ok
+
+    dark = gate.check("cam0", np.full((240, 320, 3), 5, dtype=np.uint8))
+    assert (dark.ok, dark.reason) == (False, "dark")
+    night_with_flame = np.full((240, 320, 3), 5, dtype=np.uint8)
+    night_with_flame[100:120, 150:170] = (40, 160, 250)
+    assert gate.check("cam0", night_with_flame).ok
+
+    bright = gate.check("cam0", np.full((240, 320, 3), 252, dtype=np.uint8))
+    assert (bright.ok, bright.warnings) == (True, ("overexposed", "blur"))
+
+    # A flat scene on a fresh camera has no sharpness history and is not called blurred.
+    assert gate.check("cam1", np.full((240, 320, 3), 120, dtype=np.uint8)).warnings == ()
+    stats = gate.stats()["cam0"]
+    assert (stats["passed"], stats["dark"], stats["frozen"]) == (3, 1, 0)
+    assert stats["warnings"] == {"overexposed": 1, "blur": 2}
+    assert stats["rejected_ratio"] == 0.25
+
+
+def test_flame_and_haze_frames_reach_the_vlm() -> None:
+    gate = FrameQualityGate()
+    for seed in range(5):
+        assert gate.check("cam0", _textured(seed)).ok
+
+    flame = _textured(10)
+    flame[:, : int(320 * 0.6)] = (80, 220, 255)
+    assert gate.check("cam0", flame).ok
+
+    # Lasting smoke keeps passing: it is only flagged, and the baseline follows it.
+    hazy = [gate.check("cam0", cv2.GaussianBlur(_textured(20 + idx), (31, 31), 0)) for idx in range(10)]
+    assert all(verdict.ok for verdict in hazy)
+    assert "blur" in hazy[0].warnings
+    assert gate.stats()["cam0"]["rejected_ratio"] == 0.0
+
+
+def test_frozen_feed_degrades_and_recovers() -> None:
+    gate = FrameQualityGate(frozen_after=2)
+    ok, encoded = cv2.imencode(".jpg", _textured(3))
+    assert ok
+    frozen = EncodedFrame(encoded.tobytes())
+
+    assert gate.check("cam0", frozen).ok
+    assert gate.health_change("cam0") is None
+    verdicts = [gate.check("cam0", frozen) for _ in range(2)]
+    assert [verdict.reason for verdict in verdicts] == ["frozen", "frozen"]
+    assert gate.health_change("cam0") == "degraded"
+    assert gate.health_change("cam0") is None
+
+    assert gate.check("cam0", _textured(4)).ok
+    assert gate.health_change("cam0") == "ok"
+
+
+class _HealthClient:
+    def __init__(self) -> None:
+        self.reports: list[dict] = []  # type: ignore[type-arg]
+
+    def send_health(self, endpoint: str, payload: dict) -> None:  # type: ignore[type-arg]
+        self.reports.append(payload)
+
+
+def test_frozen_frames_never_bypass_the_gate_for_a_pending_vote() -> None:
+    orchestrator = EdgeOrchestrator(EdgeConfig(), alerts=object(), client=_HealthClient(), vlm=object())  # type: ignore[arg-type]
+    retry_at: dict[str, float] = {}
+    stale = _textured(7)
+
+    passed, _ = orchestrator._gate_batch({"cam0": stale}, bypass={"cam0"}, retry_at=retry_at, now=10.0)
+    assert passed == ["cam0"]
+    # An open confirmation vote must not see the same frame again as a second, independent observation.
+    passed, _ = orchestrator._gate_batch({"cam0": stale.copy()}, bypass={"cam0"}, retry_at=retry_at, now=11.0)
+    assert passed == [] and retry_at["cam0"] == 11.0 + orchestrator.QUALITY_RETRY_SEC
+
+    # A dark frame still reaches the VLM while a cascade hit or a vote asks for this scene, flagged as such.
+    dark = np.full((240, 320, 3), 5, dtype=np.uint8)
+    passed, warnings = orchestrator._gate_batch({"cam0": dark}, bypass={"cam0"}, retry_at=retry_at, now=12.0)
+    assert (passed, warnings) == (["cam0"], {"cam0": ("dark",)})
+    passed, _ = orchestrator._gate_batch({"cam1": dark}, bypass=set(), retry_at=retry_at, now=12.0)
+    assert passed == []
@@ -0,0 +1,62 @@
+from datetime import datetime
+
+import pytest
+
+from src.edge.sampling import AdaptiveSampler, parse_sampling_schedule
+
+
+def test_parse_sampling_schedule_wraps_midnight() -> None:
+    night, day = parse_sampling_schedule(["22:00-06:00=60", "07:30-18:00=5"])
+    assert night.contains(23 * 60) and night.contains(60) and not night.contains(12 * 60)
+    assert day.contains(7 * 60 + 30) and not day.contains(18 * 60)
+    assert parse_sampling_schedule(None) == []
+
+    with pytest.raises(ValueError):
+        parse_sampling_schedule(["22:00=60"])
+    with pytest.raises(ValueError):
+        parse_sampling_schedule(["25:00-06:00=60"])
+    with pytest.raises(ValueError):
+        parse_sampling_schedule(["22:00-06:00=0"])
+
+
+def test_interval_follows_schedule_verdicts_scene_change_and_idle() -> None:
+    clock = {"now": datetime(2026, 1, 1, 12, 0)}
+    sampler = AdaptiveSampler(
+        base_interval_sec=10.0,
+        min_interval_sec=2.0,
+        max_interval_sec=60.0,
+        schedule=parse_sampling_schedule(["22:00-06:00=40"]),
+        danger_hold_sec=30.0,
+        idle_after_sec=100.0,
+        change_threshold=8.0,
+        clock=lambda: clock["now"],
+    )
+    assert sampler.interval("cam0", 0.0) == 10.0
+    assert sampler.describe("cam0") == {"interval_sec": 10.0, "reason": "base"}
+
+    sampler.observe_scene("cam0", 20.0, 5.0)
+    assert sampler.interval("cam0", 5.0) == 4.0
+
+    sampler.observe_scene("cam0", 1.0, 6.0)
+    sampler.observe_verdict("cam0", True, 0.5, 6.0)
+    assert sampler.interval("cam0", 10.0) == 2.0
+    assert sampler.describe("cam0")["reason"] == "danger"
+
+    # Quiet for longer than idle_after_sec: the interval stretches, at night from the scheduled base.
+    assert sampler.interval("cam0", 200.0) == 30.0
+    clock["now"] = datetime(2026, 1, 1, 23, 0)
+    assert sampler.interval("cam0", 200.0) == 60.0
+    assert sampler.describe("cam0")["reason"] == "idle"
+
+
+def test_latency_floor_and_effective_rate() -> None:
+    sampler = AdaptiveSampler(base_interval_sec=2.0, min_interval_sec=1.0, max_interval_sec=60.0, clock=lambda: datetime(2026, 1, 1, 12, 0))
+    for at in (10.0, 14.0, 18.0):
+        sampler.observe_verdict("cam0", False, 3.0, at)
+    # Three cameras share a VLM that takes ~3 s per call.
+    assert sampler.interval("cam0", 18.0, camera_count=3) == pytest.approx(9.0)
+    stats = sampler.stats(18.0)
+    assert stats["vlm_latency_ms"] == 3000.0
+    assert stats["cameras"]["cam0"]["reason"] == "latency"
+    assert stats["cameras"]["cam0"]["effective_per_min"] == 15.0
+    assert stats["cameras"]["cam0"]["target_per_min"] == pytest.approx(6.67)
@@ -0,0 +1,81 @@
+from src.edge.cameras import parse_camera_sources
+from src.edge.scheduler import InferenceScheduler
+
+
+def test_parse_camera_sources_defaults_and_named_entries() -> None:
+    single = parse_camera_sources(None, default_index=2, min_interval_sec=10, max_interval_sec=0)
+    assert [(spec.camera_id, spec.source, spec.max_interval_sec) for spec in single] == [("cam0", 2, 30)]
+
+    multi = parse_camera_sources(["line3=rtsp://cam/1", "1"], default_index=0, min_interval_sec=2, max_interval_sec=5)
+    assert [(spec.camera_id, spec.source) for spec in multi] == [("line3", "rtsp://cam/1"), ("cam1", 1)]
+
+
+def test_scheduler_round_robin_boost_and_intervals() -> None:
+    cameras = parse_camera_sources(["a=0", "b=1", "c=2"], default_index=0, min_interval_sec=2, max_interval_sec=6)
+    scheduler = InferenceScheduler(cameras, boost_sec=10)
+
+    served = []
+    now = 100.0
+    for _ in range(3):
+        camera_id = scheduler.next_camera(now)
+        served.append(camera_id)
+        scheduler.record(camera_id, latency_sec=0.5, now=now + 0.5)
+        now += 0.5
+    assert served == ["a", "b", "c"]
+    # Everyone was served within the minimum interval.
+    assert scheduler.next_camera(now) is None
+    assert scheduler.next_due_in(now) == 0.5
+
+    scheduler.boost("c", now)
+    assert scheduler.next_camera(now + 2.0) == "c"
+    scheduler.record("c", latency_sec=0.1, is_danger=True, now=now + 2.1)
+    assert scheduler.next_camera(now + 2.1, ready={"b"}) == "b"
+
+    # Past the maximum interval a camera outranks boosted ones.
+    assert scheduler.next_camera(now + 6.6) == "a"
+    stats = scheduler.stats(now + 7)
+    assert stats["c"]["inferences"] == 2 and stats["c"]["boosted_runs"] == 1 and stats["c"]["boosted"] is True
+
+
+def test_immediate_request_bypasses_min_interval_once() -> None:
+    cameras = parse_camera_sources(["a=0", "b=1"], default_index=0, min_interval_sec=10, max_interval_sec=30)
+    scheduler = InferenceScheduler(cameras, boost_sec=5)
+    scheduler.record("a", latency_sec=0.5, now=100.0)
+    scheduler.record("b", latency_sec=0.5, now=100.0)
+    assert scheduler.next_camera(101.0) is None
+
+    scheduler.request_immediate("b", at=101.0)
+    assert scheduler.next_due_in(101.0) == 0.0
+    assert scheduler.next_camera(101.0) == "b"
+    scheduler.record("b", latency_sec=0.5, now=101.5)
+    assert scheduler.next_camera(101.6) is None
+    assert scheduler.stats(101.6)["b"]["urgent_runs"] == 1
+
+
+def test_future_immediate_request_waits_for_its_time() -> None:
+    cameras = parse_camera_sources(["a=0"], default_index=0, min_interval_sec=10, max_interval_sec=30)
+    scheduler = InferenceScheduler(cameras, boost_sec=5)
+    scheduler.record("a", latency_sec=0.5, now=100.0)
+
+    scheduler.request_immediate("a", at=102.0)
+    scheduler.request_immediate("a", at=104.0)
+    assert scheduler.next_camera(101.0) is None
+    assert scheduler.next_due_in(101.0) == 1.0
+    assert scheduler.next_camera(102.0) == "a"
+
+
+def test_interval_override_changes_eligibility_and_overdue_threshold() -> None:
+    cameras = parse_camera_sources(["a=0"], default_index=0, min_interval_sec=10, max_interval_sec=30)
+    scheduler = InferenceScheduler(cameras)
+    scheduler.record("a", latency_sec=0.0, now=100.0)
+
+    scheduler.set_interval("a", 2.0)
+    assert scheduler.next_camera(102.0) == "a"
+    scheduler.set_interval("a", 45.0)
+    assert scheduler.next_camera(140.0) is None
+    scheduler.record("a", latency_sec=0.0, now=145.0)
+    assert scheduler.stats(145.0)["a"]["overdue_runs"] == 0
+    assert scheduler.stats(145.0)["a"]["interval_sec"] == 45.0
+
+    scheduler.set_interval("a", None)
+    assert scheduler.next_due_in(150.0) == 5.0
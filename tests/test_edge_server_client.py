@@ -0,0 +1,50 @@
+import json
+
+from src.edge.server_client import DangerEventClient
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, body: dict, headers: dict | None = None) -> None:
+        self.status_code = status_code
+        self.ok = 200 <= status_code < 300
+        self.text = json.dumps(body)
+        self.headers = {"content-type": "application/json", **(headers or {})}
+        self._body = body
+
+    def json(self) -> dict:
+        return self._body
+
+
+class FakeSession:
+    def __init__(self, responses: list[FakeResponse]) -> None:
+        self.responses = responses
+        self.calls = 0
+
+    def post(self, url, json=None, timeout=None):  # type: ignore[no-untyped-def]
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+def test_throttled_ack_starts_backoff_without_retry() -> None:
+    client = DangerEventClient(base_url="http://server", endpoint="/events/danger", retries=2)
+    client.session = FakeSession(
+        [
+            FakeResponse(
+                429,
+                {"status": "throttled", "event_id": "evt_1", "retry_after_sec": 5.0},
+                headers={"retry-after": "5"},
+            )
+        ]
+    )  # type: ignore[assignment]
+
+    ack = client.send({"event_id": "evt_1"})
+    assert ack is not None
+    assert ack["status"] == "throttled"
+    assert ack["retry_after_sec"] == 5.0
+    assert client.session.calls == 1  # type: ignore[attr-defined]
+
+    # While the backoff is active the client does not hit the server at all.
+    second = client.send({"event_id": "evt_2"})
+    assert second is not None
+    assert second["status"] == "throttled"
+    assert client.session.calls == 1  # type: ignore[attr-defined]
@@ -0,0 +1,65 @@
+from pathlib import Path
+
+import pytest
+
+from src.edge.thermal import SysfsLoadReader, ThermalGovernor
+
+
+def _write(root: Path, relative: str, text: str) -> None:
+    path = root / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def _fake_tree(root: Path, temp_c: float, gpu_permille: int, cpu_busy: int, cpu_idle: int) -> None:
+    _write(root, "sys/class/thermal/thermal_zone0/type", "cpu-thermal\n")
+    _write(root, "sys/class/thermal/thermal_zone0/temp", f"{int(temp_c * 1000)}\n")
+    _write(root, "sys/class/thermal/thermal_zone1/type", "gpu-thermal\n")
+    _write(root, "sys/class/thermal/thermal_zone1/temp", f"{int((temp_c - 2) * 1000)}\n")
+    # A disabled sensor reporting a placeholder must be ignored.
+    _write(root, "sys/class/thermal/thermal_zone2/type", "PMIC-Die\n")
+    _write(root, "sys/class/thermal/thermal_zone2/temp", "-256000\n")
+    _write(root, "sys/devices/platform/gpu.0/load", f"{gpu_permille}\n")
+    _write(root, "proc/stat", f"cpu  {cpu_busy} 0 0 {cpu_idle} 0 0 0 0 0 0\ncpu0 1 0 0 1 0 0 0 0 0 0\n")
+
+
+def test_reader_parses_fake_sysfs_tree(tmp_path: Path) -> None:
+    reader = SysfsLoadReader(str(tmp_path))
+    assert reader.read().max_temp_c is None
+
+    _fake_tree(tmp_path, temp_c=61.5, gpu_permille=420, cpu_busy=100, cpu_idle=300)
+    first = reader.read()
+    assert first.max_temp_c == 61.5 and first.hottest_zone == "cpu-thermal"
+    assert first.gpu_load == 0.42
+    assert first.cpu_load is None
+
+    _fake_tree(tmp_path, temp_c=61.5, gpu_permille=420, cpu_busy=175, cpu_idle=325)
+    assert reader.read().cpu_load == pytest.approx(0.75)
+
+
+def test_governor_scales_down_with_temperature_and_releases_slowly(tmp_path: Path) -> None:
+    governor = ThermalGovernor(SysfsLoadReader(str(tmp_path)), soft_temp_c=70.0, hard_temp_c=90.0, max_slowdown=3.0, poll_sec=5.0)
+    _fake_tree(tmp_path, temp_c=60.0, gpu_permille=300, cpu_busy=0, cpu_idle=100)
+    state = governor.update(0.0)
+    assert state.level == "normal" and state.interval_scale == 1.0 and state.image_max_side is None
+
+    _fake_tree(tmp_path, temp_c=85.0, gpu_permille=300, cpu_busy=0, cpu_idle=200)
+    assert governor.update(1.0) is state  # not due yet
+    state = governor.update(5.0)
+    assert state.level == "hot" and state.pressure == pytest.approx(0.75)
+    assert state.interval_scale == pytest.approx(2.5) and state.image_max_side == 640
+    assert state.as_meta()["max_temp_c"] == 85.0
+
+    # Cooling down holds the level for a few polls before releasing it.
+    _fake_tree(tmp_path, temp_c=60.0, gpu_permille=300, cpu_busy=0, cpu_idle=300)
+    assert governor.update(10.0).level == "hot"
+    assert governor.update(15.0).level == "hot"
+    assert governor.update(20.0).level == "normal"
+    assert governor.stats()["transitions"] == 2
+
+
+def test_governor_counts_sustained_gpu_load_at_half_weight(tmp_path: Path) -> None:
+    governor = ThermalGovernor(SysfsLoadReader(str(tmp_path)), load_high=0.8, poll_sec=0.0)
+    _fake_tree(tmp_path, temp_c=50.0, gpu_permille=1000, cpu_busy=0, cpu_idle=100)
+    state = governor.update(0.0)
+    assert state.level == "hot" and state.pressure == pytest.approx(0.5)
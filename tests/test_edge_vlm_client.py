@@ -0,0 +1,86 @@
+import json
+import queue
+from pathlib import Path
+
+import numpy as np
+
+from src.api.repositories.jsonl_writer import JsonlWriter
+from src.edge.vlm_client import VLMClient, build_mosaic
+
+
+def _client(tmp_path: Path, label: str, mosaic_reply: str = "", **kwargs) -> VLMClient:  # type: ignore[no-untyped-def]
+    client = VLMClient(raw_log_path=str(tmp_path / "vlm_raw.jsonl"), **kwargs)
+    replies = {"classify": label, "summary": "즉시 대피하세요", "mosaic": mosaic_reply}
+    client.calls = []  # type: ignore[attr-defined]
+
+    def _fake_call(prompt: str, image_base64: str, response_format: dict | None = None) -> tuple[str, dict]:
+        if response_format is not None:
+            key = "mosaic"
+        else:
+            key = "classify" if "DANGER 또는 SAFE" in prompt else "summary"
+        client.calls.append(key)  # type: ignore[attr-defined]
+        return replies[key], {"total_duration": 1000, "message": {"content": replies[key]}}
+
+    client._call_ollama = _fake_call  # type: ignore[method-assign]
+    return client
+
+
+def test_raw_log_samples_by_outcome_and_omits_metadata(tmp_path: Path) -> None:
+    frame = np.zeros((8, 8, 3), dtype=np.uint8)
+    safe = _client(tmp_path, "SAFE", raw_log_sample_safe=0.0)
+    for _ in range(3):
+        safe.analyze_frame(frame)
+    safe.close()
+    assert safe.raw_log_counters == {"written": 0, "sampled_out": 3, "dropped": 0}
+
+    danger = _client(tmp_path, "DANGER")
+    danger.analyze_frame(frame)
+    danger.close()
+    records = [json.loads(line) for line in (tmp_path / "vlm_raw.jsonl").read_text(encoding="utf-8").splitlines()]
+    assert [record["classification"] for record in records] == ["DANGER"]
+    assert "classification_response" not in records[0]
+    assert records[0]["total_duration_ns"] == 1000
+
+
+def test_writer_drops_and_counts_when_buffer_full(tmp_path: Path) -> None:
+    writer = JsonlWriter(tmp_path / "raw.jsonl", background=True, drop_when_full=True)
+    drained = writer._queue
+    # Swap in a queue the drain thread never reads to simulate a stalled disk.
+    writer._queue = queue.Queue(maxsize=1)
+    results = [writer.write({"idx": idx}) for idx in range(5)]
+    writer._queue = drained
+    writer.close()
+    assert results == [True, False, False, False, False]
+    assert writer.dropped == 4
+
+
+def test_mosaic_maps_tiles_and_requeries_flagged_frames(tmp_path: Path) -> None:
+    frames = {f"cam{idx}": np.full((36, 64, 3), idx * 40, dtype=np.uint8) for idx in range(3)}
+    assert build_mosaic(list(frames.values()), tile_width=64).shape == (72, 128, 3)
+
+    reply = json.dumps({"tiles": [{"tile": 1, "verdict": "SAFE"}, {"tile": 2, "verdict": "DANGER"}]})
+    client = _client(tmp_path, "DANGER", mosaic_reply=reply, raw_log_enabled=False)
+    results = client.analyze_mosaic(frames)
+
+    assert results["cam0"][0] is False and results["cam0"][3]["mode"] == "mosaic"
+    assert results["cam1"][0] is True and results["cam1"][3]["mosaic_verdict"] == "DANGER"
+    # Tile 3 was missing from the reply, so it is confirmed at full resolution too.
+    assert results["cam2"][3]["mosaic_verdict"] == "missing"
+    assert client.calls == ["mosaic", "classify", "summary", "classify", "summary"]  # type: ignore[attr-defined]
+
+    broken = _client(tmp_path, "SAFE", mosaic_reply="not json", raw_log_enabled=False)
+    assert all(result[0] is False for result in broken.analyze_mosaic(frames).values())
+
+
+def test_fallback_raw_log_keeps_its_own_copy_of_meta(tmp_path: Path) -> None:
+    client = VLMClient(provider="unsupported", raw_log_path=str(tmp_path / "vlm_raw.jsonl"))
+    writer = client._raw_log_writer
+    assert writer is not None
+    drained, writer._queue = writer._queue, queue.Queue()  # hold the record so the caller mutates first
+    _, _, _, meta = client.analyze_frame(np.zeros((8, 8, 3), dtype=np.uint8))
+    meta["camera_id"] = "cam0"
+    queued = writer._queue.get_nowait()
+    writer._queue = drained
+    client.close()
+    assert "camera_id" not in queued["meta"]
+    assert queued["meta"]["fallback_reason"] == meta["fallback_reason"]
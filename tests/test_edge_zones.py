@@ -0,0 +1,83 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.edge.config import EdgeConfig
+from src.edge.orchestrator import EdgeOrchestrator
+from src.edge.zones import ZoneCropper, load_camera_zones
+
+
+def _write_zones(tmp_path: Path, payload: dict) -> str:  # type: ignore[type-arg]
+    path = tmp_path / "zones.json"
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    return str(path)
+
+
+def test_load_camera_zones_validates_polygons(tmp_path: Path) -> None:
+    zones = load_camera_zones(
+        _write_zones(
+            tmp_path,
+            {"cam0": [{"zone_id": "panel", "polygon": [[0, 0], [0.5, 0], [0.5, 0.5]], "scenario": "electrical", "cooldown_sec": 90}]},
+        )
+    )
+    assert zones["cam0"][0].zone_id == "panel"
+    assert zones["cam0"][0].cooldown_sec == 90.0
+    assert load_camera_zones(None) == {}
+
+    with pytest.raises(ValueError):
+        load_camera_zones(_write_zones(tmp_path, {"cam0": [{"polygon": [[0, 0], [2, 0], [0, 1]]}]}))
+    with pytest.raises(ValueError):
+        load_camera_zones(_write_zones(tmp_path, {"cam0": [{"polygon": [[0, 0], [1, 0], [0, 1]], "scenario": "flood"}]}))
+
+
+def test_zone_crop_keeps_only_polygon_pixels(tmp_path: Path) -> None:
+    zone = load_camera_zones(_write_zones(tmp_path, {"cam0": [{"polygon": [[0.5, 0], [1, 0], [1, 1], [0.5, 1]]}]}))["cam0"][0]
+    frame = np.full((40, 80, 3), 200, dtype=np.uint8)
+    crop = ZoneCropper().crop(frame, zone)
+    assert crop.shape[0] == 40 and 38 <= crop.shape[1] <= 42
+    assert int(crop.min()) == 200
+
+    triangle = load_camera_zones(_write_zones(tmp_path, {"cam0": [{"polygon": [[0, 0], [1, 0], [0, 1]]}]}))["cam0"][0]
+    masked = ZoneCropper().crop(frame, triangle)
+    assert int(masked[0, 0, 0]) == 200 and int(masked[-1, -1, 0]) == 0
+
+
+def test_orchestrator_splits_zoned_cameras_into_targets(tmp_path: Path) -> None:
+    cfg = EdgeConfig(
+        camera_zones_path=_write_zones(
+            tmp_path,
+            {"cam1": [{"zone_id": "bay", "polygon": [[0, 0], [0.5, 0], [0.5, 0.5], [0, 0.5]]}, {"zone_id": "walkway", "polygon": [[0.5, 0.5], [1, 0.5], [1, 1]]}]},
+        )
+    )
+    orchestrator = EdgeOrchestrator(cfg, alerts=object(), client=object(), vlm=object())  # type: ignore[arg-type]
+    frame = np.zeros((40, 80, 3), dtype=np.uint8)
+    targets = orchestrator._inference_targets({"cam0": frame, "cam1": frame})
+
+    assert list(targets) == ["cam0", "cam1:bay", "cam1:walkway"]
+    assert targets["cam0"][2] is frame
+    assert targets["cam1:bay"][1].zone_id == "bay"
+    assert targets["cam1:bay"][2].shape[:2] == (21, 41)
+
+
+class _RecordingVLM:
+    def __init__(self) -> None:
+        self.mosaics: list[list[str]] = []
+
+    def analyze_mosaic(self, frames: dict) -> dict:  # type: ignore[type-arg]
+        self.mosaics.append(list(frames))
+        return {key: (False, "safe", 0.9, {}) for key in frames}
+
+
+def test_composite_mode_caps_mosaics_at_max_tiles_and_rejects_unknown_modes() -> None:
+    vlm = _RecordingVLM()
+    orchestrator = EdgeOrchestrator(EdgeConfig(vlm_mosaic_max_tiles=4), alerts=object(), client=object(), vlm=vlm)  # type: ignore[arg-type]
+    frame = np.zeros((8, 8, 3), dtype=np.uint8)
+    results = orchestrator._analyze_targets({f"cam{idx // 3}:z{idx % 3}": frame for idx in range(10)})
+
+    assert [len(keys) for keys in vlm.mosaics] == [4, 4, 2]
+    assert len(results) == 10
+
+    with pytest.raises(ValueError):
+        EdgeOrchestrator(EdgeConfig(zone_mode="crop"), alerts=object(), client=object(), vlm=vlm)  # type: ignore[arg-type]
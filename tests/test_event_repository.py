@@ -0,0 +1,96 @@
+import json
+import shutil
+from pathlib import Path
+
+from src.api.repositories.event_repository import EventRepository
+from src.api.repositories.records import ReferenceCatalog, read_jsonl_tail
+from src.rag.manual_repository import ManualEntry
+
+
+def _write_lines(path: Path, payloads: list[dict], trailing: str = "") -> None:
+    path.write_text("".join(json.dumps(item) + "\n" for item in payloads) + trailing, encoding="utf-8")
+
+
+def test_read_jsonl_tail_reads_backwards_and_skips_truncated_line(tmp_path: Path) -> None:
+    path = tmp_path / "events.jsonl"
+    _write_lines(path, [{"idx": idx, "pad": "x" * idx} for idx in range(200)], trailing='{"idx": 200, "pa')
+
+    tail = read_jsonl_tail(path, max_records=5, block_size=32)
+    assert [item["idx"] for item in tail] == [199, 198, 197, 196, 195]
+    assert read_jsonl_tail(tmp_path / "missing.jsonl", max_records=5) == []
+    assert len(read_jsonl_tail(path, max_records=1000, block_size=17)) == 200
+
+
+def test_repository_recovers_recents_on_start(tmp_path: Path) -> None:
+    event_log = tmp_path / "danger_events.jsonl"
+    response_log = tmp_path / "danger_responses.jsonl"
+    _write_lines(event_log, [{"event_id": f"evt_{idx}"} for idx in range(10)], trailing='{"event_id": "evt_')
+    _write_lines(response_log, [{"event_id": f"evt_{idx}", "rag_source": "mcp"} for idx in range(10)])
+
+    repo = EventRepository(str(event_log), str(response_log), recents_max=3, recover=True)
+    snapshot = repo.get_recent_snapshot()
+    assert [item["event_id"] for item in snapshot["events"]] == ["evt_9", "evt_8", "evt_7"]
+    assert repo.get_response("evt_8") == {"event_id": "evt_8", "rag_source": "mcp"}
+    assert repo.get_response("evt_1") is None
+
+    repo.append_event({"event_id": "evt_new"})
+    repo.close()
+    lines = event_log.read_text(encoding="utf-8").splitlines()
+    assert json.loads(lines[-1]) == {"event_id": "evt_new"}
+
+
+def test_responses_store_manual_ids_and_resolve_on_read(tmp_path: Path) -> None:
+    manuals = [ManualEntry(id="fire-001", title="화재 대응", content="전원을 차단한다.", tags=["화재"])]
+    catalog = ReferenceCatalog(manuals)
+    response_log = tmp_path / "danger_responses.jsonl"
+    repo = EventRepository(
+        str(tmp_path / "danger_events.jsonl"),
+        str(response_log),
+        recents_max=2,
+        responses_index_max=2,
+        catalog=catalog,
+    )
+    inline = {"id": "mcp-text", "title": "MCP Result", "content": "자유 텍스트", "tags": []}
+    full = {"id": "fire-001", "title": "화재 대응", "content": "전원을 차단한다.", "tags": ["화재"]}
+    for idx in range(3):
+        repo.append_response(
+            f"evt_{idx}",
+            {"event_id": f"evt_{idx}", "rag_source": "mcp", "references": [full, inline]},
+        )
+
+    stored = json.loads(response_log.read_text(encoding="utf-8").splitlines()[0])
+    assert stored["references"] == ["fire-001", inline]
+    assert stored["corpus_version"] == catalog.version
+
+    assert repo.get_response("evt_2") == {"event_id": "evt_2", "rag_source": "mcp", "references": [full, inline]}
+    # The per-event index is bounded; the oldest response is evicted.
+    assert repo.get_response("evt_0") is None
+    assert repo.get_recent_snapshot()["responses"][0]["references"][0] == full
+    repo.close()
+
+
+def test_references_resolve_against_the_corpus_version_they_were_stored_under(tmp_path: Path) -> None:
+    event_log, response_log = str(tmp_path / "danger_events.jsonl"), str(tmp_path / "danger_responses.jsonl")
+    old_manual = ManualEntry(id="fire-001", title="화재 대응", content="전원을 차단한다.", tags=["화재"])
+    gone_manual = ManualEntry(id="gas-001", title="가스 누출", content="밸브를 잠근다.", tags=["가스"])
+    old = {"id": "fire-001", "title": "화재 대응", "content": "전원을 차단한다.", "tags": ["화재"]}
+    repo = EventRepository(event_log, response_log, catalog=ReferenceCatalog([old_manual, gone_manual]))
+    gas = {"id": "gas-001", "title": "가스 누출", "content": "밸브를 잠근다.", "tags": ["가스"]}
+    repo.append_response("evt_0", {"event_id": "evt_0", "references": [old, gas]})
+    repo.close()
+
+    # The manuals are edited and one is removed; the old record keeps the text it was answered with.
+    new_manual = ManualEntry(id="fire-001", title="화재 대응", content="소화기를 사용한다.", tags=["화재"])
+    restarted = EventRepository(event_log, response_log, recover=True, catalog=ReferenceCatalog([new_manual]))
+    assert restarted.get_response("evt_0") == {"event_id": "evt_0", "references": [old, gas]}
+    restarted.close()
+
+    # Without the archived version nothing is invented: unknown ids are reported, not stubbed.
+    shutil.rmtree(tmp_path / "reference_catalog")
+    orphaned = EventRepository(event_log, response_log, recover=True, catalog=ReferenceCatalog([new_manual]))
+    assert orphaned.get_response("evt_0") == {
+        "event_id": "evt_0",
+        "references": [],
+        "unresolved_references": ["fire-001", "gas-001"],
+    }
+    orphaned.close()
@@ -0,0 +1,42 @@
+from pathlib import Path
+
+from src.api.repositories.stats import EventStats
+
+
+def test_event_stats_windows_percentiles_and_persistence(tmp_path: Path) -> None:
+    stats = EventStats(persist_path=str(tmp_path / "stats.json"))
+    for idx in range(20):
+        stats.record_event({"source": f"cam-{idx % 2}", "confidence": idx / 20, "metadata": {"scenario": "fall"}})
+        stats.record_response({"rag_source": "mcp" if idx % 4 else "local-fallback"}, latency_sec=0.3 if idx else 9.0)
+
+    summary = stats.summary("24h")
+    assert summary["events"] == 20
+    assert summary["by_source"] == {"cam-0": 10, "cam-1": 10}
+    assert summary["by_hazard"] == {"fall": 20}
+    assert summary["rag_source_ratio"] == {"local-fallback": 0.25, "mcp": 0.75}
+    assert sum(summary["confidence"]["histogram"]) == 20
+    assert summary["latency_ms"]["p50"] == 500
+    assert summary["latency_ms"]["p99"] == 16000
+    assert len(summary["hourly"]) == 1
+
+    stats.save()
+    restored = EventStats(persist_path=str(tmp_path / "stats.json"))
+    assert restored.summary("7d")["events"] == 20
+
+
+def test_event_stats_recording_never_writes_the_snapshot(tmp_path: Path) -> None:
+    path = tmp_path / "stats.json"
+    stats = EventStats(persist_path=str(path), save_interval_sec=0.0)
+    stats.record_event({"source": "cam-a", "confidence": 0.5})
+    stats.record_response({"rag_source": "mcp"}, latency_sec=0.2)
+    assert not path.exists()
+
+    # The lifespan task saves only when something changed since the last save.
+    stats.save_if_dirty()
+    saved_at = path.stat().st_mtime_ns
+    path.unlink()
+    stats.save_if_dirty()
+    assert not path.exists() and saved_at > 0
+    stats.record_event({"source": "cam-a"})
+    stats.save_if_dirty()
+    assert EventStats(persist_path=str(path)).summary("1h")["events"] == 2
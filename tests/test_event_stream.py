@@ -0,0 +1,37 @@
+import asyncio
+
+from src.api.services.event_stream import EventBroadcaster
+
+
+def test_broadcaster_fans_out_and_encodes_sse() -> None:
+    async def scenario() -> None:
+        broadcaster = EventBroadcaster()
+        first = broadcaster.subscribe()
+        second = broadcaster.subscribe()
+        broadcaster.publish("event", {"event_id": "evt_1", "summary": "화재"})
+
+        message = await first.get()
+        assert (await second.get()).seq == message.seq
+        assert message.encode() == 'id: 1\nevent: event\ndata: {"event_id":"evt_1","summary":"화재"}\n\n'
+
+        broadcaster.unsubscribe(first)
+        broadcaster.unsubscribe(second)
+        assert broadcaster.subscriber_count == 0
+
+    asyncio.run(scenario())
+
+
+def test_broadcaster_replays_after_last_event_id_and_drops_oldest_when_full() -> None:
+    async def scenario() -> None:
+        broadcaster = EventBroadcaster(queue_max=2)
+        for idx in range(3):
+            broadcaster.publish("event", {"event_id": f"evt_{idx}"})
+
+        resumed = broadcaster.subscribe(last_event_id=1)
+        assert [(await resumed.get()).data["event_id"] for _ in range(2)] == ["evt_1", "evt_2"]
+
+        for idx in range(3, 6):
+            broadcaster.publish("response", {"event_id": f"evt_{idx}"})
+        assert [(await resumed.get()).data["event_id"] for _ in range(2)] == ["evt_4", "evt_5"]
+
+    asyncio.run(scenario())
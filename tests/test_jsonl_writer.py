@@ -0,0 +1,163 @@
+import json
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from src.api.repositories.event_repository import EventRepository
+from src.api.repositories import jsonl_writer
+from src.api.repositories.jsonl_writer import JsonlWriter, iter_jsonl_range, list_segments, load_segment_index
+from src.api.repositories.records import read_jsonl_tail
+
+
+def test_background_writer_flushes_batches(tmp_path: Path) -> None:
+    path = tmp_path / "events.jsonl"
+    writer = JsonlWriter(path, background=True, fsync_policy="batch")
+    for idx in range(50):
+        writer.write({"idx": idx, "text": "화재"})
+    writer.flush()
+
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [line["idx"] for line in lines] == list(range(50))
+    assert lines[0]["text"] == "화재"
+    writer.close()
+
+
+def test_interval_fsync_runs_when_the_writer_goes_idle(tmp_path: Path, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    synced: list[int] = []
+    real_fsync = jsonl_writer.os.fsync
+    monkeypatch.setattr(jsonl_writer.os, "fsync", lambda fd: (synced.append(fd), real_fsync(fd)))
+    writer = JsonlWriter(
+        tmp_path / "events.jsonl",
+        fsync_policy="interval",
+        fsync_interval_sec=0.3,
+        flush_interval_sec=0.02,
+    )
+    writer.write({"idx": 0})
+    writer.flush()
+    writer.write({"idx": 1})
+    writer.flush()
+    assert len(synced) == 1
+
+    # No further write arrives, yet the second line still reaches the disk once the interval passes.
+    deadline = time.monotonic() + 3.0
+    while len(synced) < 2 and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert len(synced) == 2
+    writer.close()
+
+
+def test_writer_rotates_by_size(tmp_path: Path) -> None:
+    path = tmp_path / "events.jsonl"
+    writer = JsonlWriter(path, background=False, fsync_policy="none", rotate_max_bytes=64)
+    for idx in range(6):
+        writer.write({"idx": idx, "pad": "x" * 40})
+    writer.close()
+
+    segments = sorted(tmp_path.glob("events.*.jsonl"))
+    assert segments
+    total = sum(len(p.read_text(encoding="utf-8").splitlines()) for p in [*segments, path])
+    assert total == 6
+
+
+def test_writer_compresses_indexes_and_retains_segments(tmp_path: Path) -> None:
+    path = tmp_path / "events.jsonl"
+    writer = JsonlWriter(
+        path,
+        background=False,
+        fsync_policy="none",
+        rotate_max_bytes=200,
+        compress="gzip",
+        retention_max_segments=3,
+        index_every=1,
+    )
+    for idx in range(40):
+        writer.write({"idx": idx, "timestamp": f"2026-02-21T01:{idx:02d}:00+00:00", "pad": "x" * 40})
+    writer.close()
+
+    segments = list_segments(path)
+    assert len(segments) == 3
+    assert all(item.name.endswith(".jsonl.gz") for item in segments)
+    index = load_segment_index(path)
+    assert set(index) == {item.name.removesuffix(".gz") for item in segments}
+    assert all(entry["min_ts"] <= entry["max_ts"] for entry in index.values())
+    assert any(entry["seek"] for entry in index.values())
+
+    oldest_kept = min(entry["min_ts"] for entry in index.values())
+    ranged = [item["idx"] for item in iter_jsonl_range(path, since=oldest_kept + 60, until=oldest_kept + 180)]
+    assert ranged == [ranged[0] + offset for offset in range(3)]
+    assert read_jsonl_tail(segments[-1], max_records=1)[0]["idx"] < 40
+
+
+def test_range_reads_survive_out_of_order_timestamps(tmp_path: Path) -> None:
+    path = tmp_path / "events.jsonl"
+    writer = JsonlWriter(path, background=False, fsync_policy="none", rotate_max_bytes=300, index_every=2)
+    # A late source delivers minute 0 after minutes 1-9 within the same segment.
+    minutes = [1, 2, 3, 4, 5, 6, 7, 8, 9, 0, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19]
+    for minute in minutes:
+        writer.write({"minute": minute, "timestamp": f"2026-02-21T01:{minute:02d}:00+00:00", "pad": "x" * 40})
+    writer.close()
+
+    index = load_segment_index(path)
+    assert len(index) >= 2
+    base = datetime(2026, 2, 21, 1, tzinfo=timezone.utc).timestamp()
+    assert min(entry["min_ts"] for entry in index.values()) == base
+    ranged = sorted(item["minute"] for item in iter_jsonl_range(path, since=base, until=base + 30))
+    assert ranged == [0]
+    assert sorted(item["minute"] for item in iter_jsonl_range(path, since=base + 540)) == list(range(9, 20))
+
+
+def test_index_rewrite_never_drops_a_concurrent_rotation(tmp_path: Path) -> None:
+    path = tmp_path / "events.jsonl"
+    writer = JsonlWriter(path, background=False, fsync_policy="none", rotate_max_bytes=80)
+    done = threading.Event()
+
+    def prune() -> None:
+        while not done.is_set():
+            writer._prune_index()
+
+    pruner = threading.Thread(target=prune)
+    pruner.start()
+    try:
+        for idx in range(200):
+            writer.write({"idx": idx, "timestamp": f"2026-02-21T01:00:{idx % 60:02d}+00:00", "pad": "x" * 40})
+    finally:
+        done.set()
+        pruner.join()
+    writer.close()
+
+    assert set(load_segment_index(path)) == {item.name for item in list_segments(path)}
+
+
+def test_repository_reads_since_queries_from_the_log(tmp_path: Path) -> None:
+    repo = EventRepository(
+        event_log_path=str(tmp_path / "events.jsonl"),
+        response_log_path=str(tmp_path / "responses.jsonl"),
+        recents_max=3,
+        rotate_max_bytes=200,
+    )
+    for idx in range(12):
+        repo.append_event({"event_id": f"evt_{idx}", "source": "cam-a", "timestamp": f"2026-02-21T01:{idx:02d}:00Z"})
+
+    page = repo.query_events(since=datetime(2026, 2, 21, 1, 4, tzinfo=timezone.utc), limit=5)
+    assert [item["event_id"] for item in page["events"]] == [f"evt_{idx}" for idx in range(11, 6, -1)]
+    rest = repo.query_events(since=datetime(2026, 2, 21, 1, 4, tzinfo=timezone.utc), cursor=page["next_cursor"])
+    assert [item["event_id"] for item in rest["events"]] == ["evt_6", "evt_5", "evt_4"]
+    # Without a time range only the in-memory recents answer.
+    assert len(repo.query_events(limit=50)["events"]) == 3
+    repo.close()
+
+
+def test_repository_close_drains_write_behind_queue(tmp_path: Path) -> None:
+    repo = EventRepository(
+        event_log_path=str(tmp_path / "events.jsonl"),
+        response_log_path=str(tmp_path / "responses.jsonl"),
+        write_behind=True,
+        fsync_policy="interval",
+    )
+    repo.append_event({"event_id": "evt_1"})
+    repo.append_response("evt_1", {"event_id": "evt_1"})
+    repo.close()
+
+    assert (tmp_path / "events.jsonl").read_text(encoding="utf-8").strip() == '{"event_id": "evt_1"}'
+    assert (tmp_path / "responses.jsonl").read_text(encoding="utf-8").strip() == '{"event_id": "evt_1"}'
@@ -0,0 +1,98 @@
+import asyncio
+from datetime import datetime, timezone
+
+from src.api.models import DangerEvent, RAGReference
+from src.api.services.pipeline import DangerProcessingPipeline
+from src.api.services.routing import ResponseTierRouter
+
+
+def _event(confidence: float | None, provider: str = "ollama", summary: str = "위험 상황") -> DangerEvent:
+    return DangerEvent(
+        event_id="evt_route",
+        timestamp=datetime.now(timezone.utc),
+        source="test",
+        summary=summary,
+        confidence=confidence,
+        metadata={"provider": provider},
+    )
+
+
+class FakeMCPRetriever:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def retrieve(self, query: str) -> list[RAGReference]:
+        self.calls += 1
+        return [RAGReference(id="general-1", title="공통 절차", content="공통", tags=[])]
+
+
+class FakeLocalRetriever:
+    top_k = 3
+
+    def retrieve(self, query: str) -> list[RAGReference]:
+        return [RAGReference(id="general-local", title="공통 절차", content="로컬", tags=[])]
+
+
+class FakeResponder:
+    provider_name = "gemini"
+
+    def __init__(self) -> None:
+        self.calls: list[dict] = []
+
+    async def build_response(self, situation, references, hazard_hint=None, model=None, template_only=False):  # type: ignore[no-untyped-def]
+        self.calls.append({"model": model, "template_only": template_only})
+        return "운영자 대응", "현장 안내"
+
+
+class FakeTTS:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def synthesize_wav_base64(self, text: str) -> str | None:
+        self.calls += 1
+        return "d2F2"
+
+
+def test_router_tiers_by_confidence() -> None:
+    router = ResponseTierRouter()
+    assert router.route(_event(0.95), "general").tier == "full"
+    assert router.route(_event(0.7), "general").tier == "fast"
+    assert router.route(_event(0.55), "general").tier == "template"
+    assert router.route(_event(None), "general").tier == "fast"
+
+
+def test_router_caps_heuristic_and_boosts_severe_hazards() -> None:
+    router = ResponseTierRouter()
+    assert router.route(_event(0.95, provider="heuristic"), "general").tier == "fast"
+    assert router.route(_event(0.55), "fire").tier == "fast"
+    assert ResponseTierRouter(enabled=False).route(_event(0.1), "general").tier == "full"
+
+
+def test_pipeline_applies_tier() -> None:
+    mcp = FakeMCPRetriever()
+    responder = FakeResponder()
+    tts = FakeTTS()
+    pipeline = DangerProcessingPipeline(
+        mcp_retriever=mcp,  # type: ignore[arg-type]
+        local_retriever=FakeLocalRetriever(),  # type: ignore[arg-type]
+        responder=responder,  # type: ignore[arg-type]
+        tts_generator=tts,  # type: ignore[arg-type]
+        fast_model="fast-model",
+    )
+
+    template = asyncio.run(pipeline.process(_event(0.55)))
+    assert template.response_tier == "template"
+    assert template.rag_source == "local"
+    assert template.llm_provider == "fallback-template"
+    assert template.jetson_tts_wav_base64 is None
+    assert mcp.calls == 0
+
+    fast = asyncio.run(pipeline.process(_event(0.7)))
+    assert fast.response_tier == "fast"
+    assert responder.calls[-1] == {"model": "fast-model", "template_only": False}
+    assert fast.jetson_tts_wav_base64 is None
+
+    full = asyncio.run(pipeline.process(_event(0.95)))
+    assert full.response_tier == "full"
+    assert full.jetson_tts_wav_base64 == "d2F2"
+    assert tts.calls == 1
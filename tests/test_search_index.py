@@ -0,0 +1,87 @@
+from pathlib import Path
+
+from src.api.repositories.search_index import SearchIndex, tokenize
+
+
+def _event(idx: int, summary: str, source: str = "line-3") -> dict:
+    return {
+        "event_id": f"evt_{idx}",
+        "timestamp": f"2026-02-2{idx % 3 + 1}T01:02:03+00:00",
+        "source": source,
+        "summary": summary,
+    }
+
+
+def test_tokenize_uses_hangul_bigrams() -> None:
+    assert tokenize("감전사고 line-3") == ["감전", "전사", "사고", "line", "3"]
+    assert tokenize("불") == ["불"]
+
+
+def test_search_index_matches_incrementally_and_paginates(tmp_path: Path) -> None:
+    journal = tmp_path / "search_index.jsonl"
+    index = SearchIndex(journal_path=str(journal), write_behind=False)
+    for idx in range(6):
+        index.add_event(_event(idx, "배전반 누전 스파크 감지" if idx % 2 == 0 else "작업자 넘어짐"))
+    index.add_event(_event(6, "배전반 누전", source="line-1"))
+    index.add_response("evt_1", {"operator_response": "전원 차단 후 절연 점검"})
+
+    first = index.search("누전 line 3", limit=2)
+    assert [hit["event_id"] for hit in first["hits"]] == ["evt_4", "evt_2"]
+    assert first["hits"][0]["hazard"] == "electrical"
+    second = index.search("누전 line 3", limit=2, cursor=first["next_cursor"])
+    assert [hit["event_id"] for hit in second["hits"]] == ["evt_0"]
+    assert second["next_cursor"] is None
+
+    assert [hit["event_id"] for hit in index.search("절연")["hits"]] == ["evt_1"]
+    assert [hit["event_id"] for hit in index.search("누전", source="line-1")["hits"]] == ["evt_6"]
+    assert len(index.search("짐")["hits"]) == 3
+    assert index.search("화재")["hits"] == []
+    index.close()
+
+    restored = SearchIndex(journal_path=str(journal), write_behind=False)
+    assert restored.doc_count == 7
+    assert [hit["event_id"] for hit in restored.search("절연 점검")["hits"]] == ["evt_1"]
+    restored.close()
+
+
+def test_search_index_restarts_from_snapshot_plus_journal_tail(tmp_path: Path) -> None:
+    journal = tmp_path / "search_index.jsonl"
+    index = SearchIndex(journal_path=str(journal), write_behind=False, snapshot_every=4)
+    for idx in range(10):
+        index.add_event(_event(idx, "배전반 누전 스파크"))
+    index.add_response("evt_9", {"operator_response": "절연 점검"})
+    index.close()
+
+    snapshot = tmp_path / "search_index.snapshot.json"
+    assert snapshot.exists()
+    # The journal only carries what arrived after the last snapshot.
+    tail = journal.read_text(encoding="utf-8").splitlines() if journal.exists() else []
+    assert len(tail) < 11
+    assert not (tmp_path / "search_index.jsonl.prev").exists()
+
+    restored = SearchIndex(journal_path=str(journal), write_behind=False, snapshot_every=4)
+    assert restored.doc_count == 10
+    assert [hit["event_id"] for hit in restored.search("절연")["hits"]] == ["evt_9"]
+    assert len(restored.search("누전", limit=50)["hits"]) == 10
+    restored.close()
+
+
+def test_search_index_trims_oldest_docs_and_keeps_cursors(tmp_path: Path) -> None:
+    journal = tmp_path / "search_index.jsonl"
+    index = SearchIndex(journal_path=str(journal), write_behind=False, snapshot_every=0, max_docs=4)
+    for idx in range(10):
+        index.add_event(_event(idx, "작업자 넘어짐"))
+    page = index.search("넘어짐", limit=2)
+    index._snapshot()
+
+    assert index.doc_count == 4
+    assert [hit["event_id"] for hit in index.search("넘어짐")["hits"]] == ["evt_9", "evt_8", "evt_7", "evt_6"]
+    # A cursor issued before the trim still points at the same place.
+    after = index.search("넘어짐", limit=2, cursor=page["next_cursor"])
+    assert [hit["event_id"] for hit in after["hits"]] == ["evt_7", "evt_6"]
+    index.add_event(_event(10, "작업자 넘어짐"))
+    index.close()
+
+    restored = SearchIndex(journal_path=str(journal), write_behind=False, snapshot_every=0, max_docs=4)
+    assert [hit["event_id"] for hit in restored.search("넘어짐")["hits"]] == ["evt_10", "evt_9", "evt_8", "evt_7", "evt_6"]
+    restored.close()
@@ -0,0 +1,51 @@
+from datetime import datetime, timezone
+from pathlib import Path
+
+from src.api.repositories.sqlite_repository import SQLiteEventRepository
+
+
+def _event(idx: int, source: str, scenario: str) -> dict:
+    return {
+        "event_id": f"evt_{idx:03d}",
+        "timestamp": f"2026-02-2{idx % 3 + 1}T01:02:03+09:00",
+        "source": source,
+        "is_danger": True,
+        "summary": "위험 상황",
+        "confidence": 0.9,
+        "metadata": {"scenario": scenario},
+    }
+
+
+def test_sqlite_repository_snapshot_and_response(tmp_path: Path) -> None:
+    repo = SQLiteEventRepository(db_path=str(tmp_path / "events.db"), recents_max=2)
+    for idx in range(3):
+        repo.append_event(_event(idx, "cam-a", "fire"))
+    repo.append_response("evt_001", {"event_id": "evt_001", "rag_source": "mcp"})
+
+    snapshot = repo.get_recent_snapshot()
+    assert [item["event_id"] for item in snapshot["events"]] == ["evt_002", "evt_001"]
+    assert snapshot["response_count"] == 1
+    assert repo.get_response("evt_001") == {"event_id": "evt_001", "rag_source": "mcp"}
+    assert repo.get_response("evt_missing") is None
+    repo.close()
+
+
+def test_sqlite_repository_filters_and_cursor_pagination(tmp_path: Path) -> None:
+    repo = SQLiteEventRepository(db_path=str(tmp_path / "events.db"))
+    for idx in range(10):
+        repo.append_event(_event(idx, "cam-a" if idx % 2 == 0 else "cam-b", "fire" if idx < 5 else "fall"))
+
+    first = repo.query_events(source="cam-a", limit=2)
+    assert [item["event_id"] for item in first["events"]] == ["evt_008", "evt_006"]
+    second = repo.query_events(source="cam-a", limit=2, cursor=first["next_cursor"])
+    assert [item["event_id"] for item in second["events"]] == ["evt_004", "evt_002"]
+    third = repo.query_events(source="cam-a", limit=2, cursor=second["next_cursor"])
+    assert [item["event_id"] for item in third["events"]] == ["evt_000"]
+    assert third["next_cursor"] is None
+
+    fall = repo.query_events(hazard="fall", limit=50)
+    assert len(fall["events"]) == 5
+
+    since = repo.query_events(since=datetime(2026, 2, 22, tzinfo=timezone.utc), limit=50)
+    assert {item["timestamp"][:10] for item in since["events"]} == {"2026-02-23"}
+    repo.close()